@@ -0,0 +1,35 @@
+"""
+Create indexes declared on the models that are missing from an existing
+database. `Base.metadata.create_all` only creates indexes together with new
+tables, so run this after adding `index=True` / `Index(...)` to a model.
+
+Safe to re-run. Usage (from backend/): python add_indexes.py
+"""
+from sqlalchemy import inspect
+
+import app.models  # noqa: F401 - register every model on Base.metadata
+from app.db.base_class import Base
+from app.db.session import engine
+
+
+def add_indexes():
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in tables:
+            print(f"Table {table.name} does not exist yet, skipping (created on startup)")
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            if index.name in existing:
+                continue
+            columns = ", ".join(column.name for column in index.columns)
+            print(f"Creating index {index.name} on {table.name} ({columns})...")
+            index.create(bind=engine)
+
+    print("Index update completed.")
+
+
+if __name__ == "__main__":
+    add_indexes()
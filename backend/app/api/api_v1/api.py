@@ -1,12 +1,23 @@
 from fastapi import APIRouter
+from app.core.config import settings
 from app.api.api_v1.endpoints import (
     login, users, projects, tasks, categories, customers,
     subcontractors, project_stages, documents, tickets, notes, comments, upload, messages, content,
-    products, product_logs, time_entries, cash_registers, cash_sales
+    products, product_logs, time_entries, cash_registers, cash_sales, dashboard, channels
 )
 
 
 api_router = APIRouter()
+
+if settings.ASYNC_DB:
+    # Routes match in registration order, so the async reads shadow their
+    # sync counterparts; writes and everything else stay on the sync routers.
+    api_router.include_router(projects.async_router, prefix="/projects", tags=["projects"])
+    api_router.include_router(tasks.async_router, prefix="/tasks", tags=["tasks"])
+    api_router.include_router(categories.async_router, prefix="/categories", tags=["categories"])
+    api_router.include_router(messages.async_router, prefix="/messages", tags=["messages"])
+    api_router.include_router(content.async_router, prefix="/content", tags=["content"])
+
 api_router.include_router(login.router, tags=["login"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
@@ -26,7 +37,9 @@ api_router.include_router(notes.router, prefix="/notes", tags=["notes"])
 api_router.include_router(comments.router, prefix="/comments", tags=["comments"])
 api_router.include_router(upload.router, prefix="/upload", tags=["upload"])
 api_router.include_router(messages.router, prefix="/messages", tags=["messages"])
+api_router.include_router(channels.router, prefix="/channels", tags=["channels"])
 api_router.include_router(content.router, prefix="/content", tags=["content"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
 
 
 
@@ -1,5 +1,5 @@
 from . import (
     login, users, projects, tasks, categories, customers,
     products, product_logs, time_entries, cash_registers, cash_sales,
-    subcontractors, project_stages, documents, tickets, notes, comments, upload
+    subcontractors, project_stages, documents, tickets, notes, comments, upload, dashboard
 )
@@ -1,19 +1,25 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
 from app.models.cash_register import CashRegister
 from app.schemas.cash_register import CashRegister as CashRegisterSchema, CashRegisterCreate, CashRegisterUpdate
 
 router = APIRouter()
 
+CASH_REGISTER_KEYSET = Keyset(CashRegister.id)
+
 @router.get("/", response_model=List[CashRegisterSchema])
 def read_cash_registers(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
-    return db.query(CashRegister).offset(skip).limit(limit).all()
+    rows = CASH_REGISTER_KEYSET.paginate(db.query(CashRegister), cursor, skip, limit).all()
+    return CASH_REGISTER_KEYSET.page(rows, limit, response)
 
 @router.post("/", response_model=CashRegisterSchema)
 def create_cash_register(
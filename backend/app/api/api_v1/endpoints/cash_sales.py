@@ -1,19 +1,27 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
+from app.core.serialization import ListSerializer
 from app.models.cash_sale import CashSale
 from app.schemas.cash_sale import CashSale as CashSaleSchema, CashSaleCreate
 
 router = APIRouter()
 
+cash_sale_list_serializer = ListSerializer(CashSaleSchema)
+CASH_SALE_KEYSET = Keyset(CashSale.id)
+
 @router.get("/", response_model=List[CashSaleSchema])
 def read_cash_sales(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
-    return db.query(CashSale).offset(skip).limit(limit).all()
+    rows = CASH_SALE_KEYSET.paginate(db.query(CashSale), cursor, skip, limit).all()
+    return cash_sale_list_serializer.response(CASH_SALE_KEYSET.page(rows, limit, response), response)
 
 @router.post("/", response_model=CashSaleSchema)
 def create_cash_sale(
@@ -1,18 +1,35 @@
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from app.api import deps
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate, Category as CategorySchema
 
 router = APIRouter()
+# Event-loop variants of the hot reads, mounted ahead of `router` when ASYNC_DB is on
+async_router = APIRouter()
+
+def categories_statement(skip: int, limit: int):
+    """
+    Categories with their whole `children` tree loaded up front (one SELECT
+    per level); the async session cannot lazy-load the nested schema.
+    `Category.children` is a backref, so the option is built per call.
+    """
+    return (
+        select(Category)
+        .options(selectinload(Category.children, recursion_depth=-1))
+        .offset(skip)
+        .limit(limit)
+    )
 
 @router.get("/", response_model=List[CategorySchema])
 def read_categories(
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
-    current_user = Depends(deps.get_current_active_user),
+    current_user = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Retrieve categories.
@@ -37,7 +54,7 @@ def create_category(
     *,
     db: Session = Depends(deps.get_db),
     category_in: CategoryCreate,
-    current_user = Depends(deps.get_current_active_user),
+    current_user = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Create new category.
@@ -63,7 +80,7 @@ def update_category(
     db: Session = Depends(deps.get_db),
     category_id: int,
     category_in: CategoryUpdate,
-    current_user = Depends(deps.get_current_active_user),
+    current_user = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Update a category.
@@ -86,7 +103,7 @@ def delete_category(
     *,
     db: Session = Depends(deps.get_db),
     category_id: int,
-    current_user = Depends(deps.get_current_active_user),
+    current_user = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Delete a category.
@@ -98,3 +115,26 @@ def delete_category(
     db.delete(category)
     db.commit()
     return category
+
+@async_router.get("/", response_model=List[CategorySchema])
+async def read_categories_async(
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user = Depends(deps.get_current_active_principal_async),
+) -> Any:
+    """
+    Retrieve categories (async engine).
+    """
+    return (await db.execute(categories_statement(skip, limit))).scalars().all()
+
+@async_router.get("/public", response_model=List[CategorySchema])
+async def read_public_categories_async(
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+) -> Any:
+    """
+    Retrieve categories for public access (async engine).
+    """
+    return (await db.execute(categories_statement(skip, limit))).scalars().all()
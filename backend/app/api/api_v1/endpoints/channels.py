@@ -0,0 +1,251 @@
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, case, func, or_, select, union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.push import sse_response, websocket_push
+from app.core.pubsub import publish_on_commit
+from app.core.serialization import ListSerializer
+from app.models.project import Projekt, project_gruppenleiter, project_worker
+from app.models.project_message import ProjectMessage, ProjectReadCursor
+from app.models.user import UserRole
+from app.schemas.project_message import (
+    ProjectChannel, ProjectChannelRead, ProjectMessage as ProjectMessageSchema, ProjectMessageCreate
+)
+from app.schemas.user import UserPrincipal
+
+router = APIRouter()
+
+project_message_list_serializer = ListSerializer(ProjectMessageSchema)
+# Roles that see every project (see filter_projects_for_user) may read and write every channel
+CHANNEL_ALL_ACCESS_ROLES = [UserRole.ADMIN, UserRole.PROJECT_MANAGER, UserRole.OFFICE]
+
+def channel_name(project_id: int) -> str:
+    return f"project:{project_id}"
+
+def project_message_events(message: ProjectMessage):
+    # One event per message on the shared channel, however many members are listening
+    payload = {"type": "project_message", "data": ProjectMessageSchema.model_validate(message).model_dump(mode="json")}
+    yield channel_name(message.project_id), payload
+
+publish_on_commit(ProjectMessage, project_message_events)
+
+def channel_members_statement(project_id: int):
+    """
+    User ids of a project channel: the Projektleiter, the Gruppenleiter and the workers.
+    """
+    return union(
+        select(Projekt.projektleiter_id.label("user_id")).where(
+            Projekt.id == project_id, Projekt.projektleiter_id.isnot(None)
+        ),
+        select(project_gruppenleiter.c.user_id).where(project_gruppenleiter.c.project_id == project_id),
+        select(project_worker.c.user_id).where(project_worker.c.project_id == project_id),
+    )
+
+def member_projects_statement(user_id: int):
+    return select(Projekt.id, Projekt.name, Projekt.projekt_nummer).where(
+        or_(
+            Projekt.projektleiter_id == user_id,
+            Projekt.gruppenleiter.any(id=user_id),
+            Projekt.workers.any(id=user_id),
+        )
+    )
+
+def ensure_channel_access(db: Session, project_id: int, current_user: UserPrincipal) -> None:
+    if db.get(Projekt, project_id) is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if current_user.role in CHANNEL_ALL_ACCESS_ROLES:
+        return
+    members = db.execute(channel_members_statement(project_id)).scalars().all()
+    if current_user.id not in members:
+        raise HTTPException(status_code=403, detail="Not a member of this project")
+
+def advance_read_cursor(db: Session, project_id: int, user_id: int, last_read_id: int) -> None:
+    """Move a member's read cursor forward (never back), creating it on first read."""
+    values = {"project_id": project_id, "user_id": user_id, "last_read_id": last_read_id}
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        stmt = (sqlite_insert if dialect == "sqlite" else pg_insert)(ProjectReadCursor).values(**values)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["project_id", "user_id"],
+                set_={"last_read_id": case(
+                    (stmt.excluded.last_read_id > ProjectReadCursor.last_read_id, stmt.excluded.last_read_id),
+                    else_=ProjectReadCursor.last_read_id,
+                )},
+            )
+        )
+        return
+    cursor = db.query(ProjectReadCursor).filter_by(project_id=project_id, user_id=user_id).first()
+    if cursor is None:
+        db.add(ProjectReadCursor(**values))
+    elif last_read_id > cursor.last_read_id:
+        cursor.last_read_id = last_read_id
+
+@router.get("/", response_model=List[ProjectChannel])
+def read_channels(
+    db: Session = Depends(deps.get_db),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Retrieve the chat channels of the projects the current user belongs to,
+    with their last message and unread count, most recently active first.
+    """
+    projects = db.execute(member_projects_statement(current_user.id)).all()
+    project_ids = [project.id for project in projects]
+    if not project_ids:
+        return []
+
+    in_channels = ProjectMessage.project_id.in_(project_ids)
+    last_ids = db.execute(
+        select(func.max(ProjectMessage.id)).where(in_channels).group_by(ProjectMessage.project_id)
+    ).scalars().all()
+    last_messages = {
+        message.project_id: message
+        for message in db.execute(select(ProjectMessage).where(ProjectMessage.id.in_(last_ids))).scalars()
+    }
+    cursors = dict(db.execute(
+        select(ProjectReadCursor.project_id, ProjectReadCursor.last_read_id).where(
+            ProjectReadCursor.user_id == current_user.id, ProjectReadCursor.project_id.in_(project_ids)
+        )
+    ).all())
+    # Only messages after each cursor are counted, so the cost follows the unread backlog
+    unread = dict(db.execute(
+        select(ProjectMessage.project_id, func.count())
+        .outerjoin(
+            ProjectReadCursor,
+            and_(ProjectReadCursor.project_id == ProjectMessage.project_id, ProjectReadCursor.user_id == current_user.id),
+        )
+        .where(
+            in_channels,
+            ProjectMessage.id > func.coalesce(ProjectReadCursor.last_read_id, 0),
+            ProjectMessage.sender_id != current_user.id,
+        )
+        .group_by(ProjectMessage.project_id)
+    ).all())
+
+    channels = [
+        ProjectChannel(
+            project_id=project.id,
+            name=project.name,
+            projekt_nummer=project.projekt_nummer,
+            last_message=last_messages.get(project.id),
+            last_read_id=cursors.get(project.id, 0),
+            unread_count=unread.get(project.id, 0),
+        )
+        for project in projects
+    ]
+    channels.sort(key=lambda channel: channel.last_message.id if channel.last_message else 0, reverse=True)
+    return channels
+
+@router.get("/{project_id}/messages", response_model=List[ProjectMessageSchema])
+def read_channel_messages(
+    *,
+    db: Session = Depends(deps.get_db),
+    project_id: int,
+    limit: int = 100,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Retrieve a project channel, oldest first.
+    Returns the latest `limit` messages; scroll back with `before_id` and
+    catch up with `after_id`.
+    """
+    ensure_channel_access(db, project_id, current_user)
+    stmt = select(ProjectMessage).where(ProjectMessage.project_id == project_id)
+    if before_id is not None:
+        stmt = stmt.where(ProjectMessage.id < before_id)
+    if after_id is not None:
+        stmt = stmt.where(ProjectMessage.id > after_id)
+        messages = db.execute(stmt.order_by(ProjectMessage.id).limit(limit)).scalars().all()
+    else:
+        messages = db.execute(stmt.order_by(ProjectMessage.id.desc()).limit(limit)).scalars().all()[::-1]
+    return project_message_list_serializer.response(messages)
+
+@router.post("/{project_id}/messages", response_model=ProjectMessageSchema)
+def create_channel_message(
+    *,
+    db: Session = Depends(deps.get_db),
+    project_id: int,
+    message_in: ProjectMessageCreate,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Post a message to a project channel.
+    """
+    ensure_channel_access(db, project_id, current_user)
+    message = ProjectMessage(project_id=project_id, sender_id=current_user.id, content=message_in.content)
+    db.add(message)
+    db.flush()
+    # Your own messages are read
+    advance_read_cursor(db, project_id, current_user.id, message.id)
+    db.commit()
+    db.refresh(message)
+    return message
+
+@router.post("/{project_id}/read", response_model=ProjectChannelRead)
+def mark_channel_read(
+    *,
+    db: Session = Depends(deps.get_db),
+    project_id: int,
+    read_in: Optional[ProjectChannelRead] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Mark a project channel as read up to `last_read_id` (default: the newest message).
+    """
+    ensure_channel_access(db, project_id, current_user)
+    newest_id = db.execute(
+        select(func.max(ProjectMessage.id)).where(ProjectMessage.project_id == project_id)
+    ).scalar() or 0
+    last_read_id = newest_id
+    if read_in and read_in.last_read_id is not None:
+        # The cursor never moves back, so an id beyond the channel would hide all future messages
+        last_read_id = min(read_in.last_read_id, newest_id)
+    if last_read_id > 0:
+        advance_read_cursor(db, project_id, current_user.id, last_read_id)
+        db.commit()
+    last_read_id = db.execute(
+        select(ProjectReadCursor.last_read_id).where(
+            ProjectReadCursor.project_id == project_id, ProjectReadCursor.user_id == current_user.id
+        )
+    ).scalar()
+    return {"last_read_id": last_read_id or 0}
+
+@router.websocket("/{project_id}/ws")
+async def channel_websocket(websocket: WebSocket, project_id: int, db: Session = Depends(deps.get_db)):
+    """
+    Push new messages of a project channel: one `{"type": "project_message",
+    "data": ProjectMessage}` frame each. Authenticate with `?token=`.
+    """
+    try:
+        current_user = await deps.get_stream_principal(websocket)
+        await run_in_threadpool(ensure_channel_access, db, project_id, current_user)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    finally:
+        db.close()  # Not needed while the connection is open
+    await websocket.accept()
+    await websocket_push(websocket, [channel_name(project_id)])
+
+@router.get("/{project_id}/stream")
+async def stream_channel(
+    project_id: int,
+    db: Session = Depends(deps.get_db),
+    current_user: UserPrincipal = Depends(deps.get_stream_principal),
+):
+    """
+    Server-Sent Events fallback of `/channels/{project_id}/ws` (same payloads).
+    """
+    try:
+        await run_in_threadpool(ensure_channel_access, db, project_id, current_user)
+    finally:
+        db.close()
+    return await sse_response([channel_name(project_id)])
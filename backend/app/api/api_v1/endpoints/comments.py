@@ -1,17 +1,22 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
 from app.models.comment import Comment
 from app.schemas.comment import Comment as CommentSchema, CommentCreate
 
 router = APIRouter()
 
+COMMENT_KEYSET = Keyset(Comment.id)
+
 @router.get("/", response_model=List[CommentSchema])
 def read_comments(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     entity_type: str = None,
     entity_id: str = None,
 ) -> Any:
@@ -20,7 +25,8 @@ def read_comments(
         query = query.filter(Comment.entity_type == entity_type)
     if entity_id:
         query = query.filter(Comment.entity_id == entity_id)
-    return query.offset(skip).limit(limit).all()
+    rows = COMMENT_KEYSET.paginate(query, cursor, skip, limit).all()
+    return COMMENT_KEYSET.page(rows, limit, response)
 
 @router.post("/", response_model=CommentSchema)
 def create_comment(
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.api import deps
 from app.models.site_content import SiteContent
@@ -6,6 +8,8 @@ from app.schemas.site_content import SiteContentCreate, SiteContentUpdate, SiteC
 from typing import List
 
 router = APIRouter()
+# Event-loop variants of the hot reads, mounted ahead of `router` when ASYNC_DB is on
+async_router = APIRouter()
 
 @router.get("/{key}", response_model=SiteContentSchema)
 def read_content(key: str, db: Session = Depends(deps.get_db)):
@@ -19,7 +23,7 @@ def update_content(
     key: str,
     content_in: SiteContentUpdate,
     db: Session = Depends(deps.get_db),
-    current_user = Depends(deps.get_current_active_user) # Require auth
+    current_user = Depends(deps.get_current_active_principal) # Require auth
 ):
     if not current_user.is_superuser and current_user.role not in ["Admin"]:
          raise HTTPException(status_code=403, detail="Not enough permissions")
@@ -41,3 +45,15 @@ def update_content(
 @router.get("/", response_model=List[SiteContentSchema])
 def read_all_content(db: Session = Depends(deps.get_db)):
     return db.query(SiteContent).all()
+
+@async_router.get("/{key}", response_model=SiteContentSchema)
+async def read_content_async(key: str, db: AsyncSession = Depends(deps.get_async_db)):
+    result = await db.execute(select(SiteContent).where(SiteContent.key == key))
+    content = result.scalars().first()
+    if not content:
+        raise HTTPException(status_code=404, detail="Content not found")
+    return content
+
+@async_router.get("/", response_model=List[SiteContentSchema])
+async def read_all_content_async(db: AsyncSession = Depends(deps.get_async_db)):
+    return (await db.execute(select(SiteContent))).scalars().all()
@@ -1,31 +1,36 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
 from app.models.customer import Customer
 from app.schemas.customer import CustomerCreate, CustomerUpdate, Customer as CustomerSchema
 
 router = APIRouter()
 
+CUSTOMER_KEYSET = Keyset(Customer.id)
+
 @router.get("/", response_model=List[CustomerSchema])
 def read_customers(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
-    current_user = Depends(deps.get_current_active_user),
+    cursor: Optional[str] = None,
+    current_user = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Retrieve customers.
     """
-    customers = db.query(Customer).offset(skip).limit(limit).all()
-    return customers
+    customers = CUSTOMER_KEYSET.paginate(db.query(Customer), cursor, skip, limit).all()
+    return CUSTOMER_KEYSET.page(customers, limit, response)
 
 @router.post("/", response_model=CustomerSchema)
 def create_customer(
     *,
     db: Session = Depends(deps.get_db),
     customer_in: CustomerCreate,
-    current_user = Depends(deps.get_current_active_user),
+    current_user = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Create new customer.
@@ -42,7 +47,7 @@ def update_customer(
     db: Session = Depends(deps.get_db),
     customer_id: int,
     customer_in: CustomerUpdate,
-    current_user = Depends(deps.get_current_active_user),
+    current_user = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Update a customer.
@@ -65,7 +70,7 @@ def delete_customer(
     *,
     db: Session = Depends(deps.get_db),
     customer_id: int,
-    current_user = Depends(deps.get_current_active_user),
+    current_user = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Delete a customer.
@@ -0,0 +1,121 @@
+from typing import Any
+from fastapi import APIRouter, Depends
+from sqlalchemy import func, literal
+from sqlalchemy.orm import Session
+from app.api import deps
+from app.api.api_v1.endpoints.projects import filter_projects_for_user, summarize_project_status
+from app.api.api_v1.endpoints.tasks import summarize_task_status
+from app.core.cache import TTLCache, invalidate_on_commit
+from app.core.config import settings
+from app.models.product import Product
+from app.models.project import Projekt
+from app.models.task import Aufgabe
+from app.models.ticket import Ticket, TicketStatus
+from app.models.user import User, UserRole
+from app.schemas.project import ProjectSummary
+from app.schemas.user import UserPrincipal
+
+router = APIRouter()
+
+# Roles that see company-wide figures; everyone else gets figures scoped to
+# their own projects and tasks.
+STAFF_ROLES = [UserRole.ADMIN, UserRole.PROJECT_MANAGER, UserRole.OFFICE]
+STOCK_ROLES = STAFF_ROLES + [UserRole.WAREHOUSE]
+OPEN_TICKET_STATUSES = [TicketStatus.NEW.value, TicketStatus.IN_PROGRESS.value]
+RECENT_PROJECTS_LIMIT = 5
+LOW_STOCK_LIMIT = 10
+
+dashboard_cache = TTLCache(ttl=settings.STATS_CACHE_TTL_SECONDS, maxsize=1024)
+invalidate_on_commit(dashboard_cache, Projekt, Aufgabe, User, Ticket, Product)
+
+def _grouped(query, kind: str, column, id_column):
+    return (
+        query.with_entities(literal(kind).label("kind"), column.label("key"), func.count(id_column).label("count"))
+        .group_by(column)
+        .order_by(None)
+    )
+
+def build_dashboard(db: Session, current_user: UserPrincipal) -> dict:
+    """
+    Compute every dashboard figure for `current_user`.
+
+    All counters come back from a single UNION ALL of per-entity GROUP BYs;
+    recent projects and low-stock products are one query each.
+    """
+    is_staff = current_user.role in STAFF_ROLES
+    sees_stock = current_user.role in STOCK_ROLES
+
+    projects = filter_projects_for_user(db.query(Projekt), current_user)
+    tasks = db.query(Aufgabe)
+    if not is_staff:
+        tasks = tasks.filter(Aufgabe.assigned_to_id == current_user.id)
+
+    counters = [
+        _grouped(projects, "project", Projekt.status, Projekt.id),
+        _grouped(tasks, "task", Aufgabe.status, Aufgabe.id),
+    ]
+    if is_staff:
+        counters.append(_grouped(db.query(User), "user", User.role, User.id))
+        counters.append(_grouped(db.query(Ticket), "ticket", Ticket.status, Ticket.id))
+    if sees_stock:
+        counters.append(
+            db.query(literal("low_stock").label("kind"), literal("all").label("key"), func.count(Product.id).label("count"))
+            .filter(Product.stock <= Product.min_stock)
+        )
+
+    grouped = {}
+    for kind, key, count in counters[0].union_all(*counters[1:]).all():
+        grouped.setdefault(kind, []).append((key, count))
+
+    recent_projects = projects.order_by(Projekt.id.desc()).limit(RECENT_PROJECTS_LIMIT).all()
+    dashboard = {
+        "projects": summarize_project_status(grouped.get("project", [])),
+        "tasks": summarize_task_status(grouped.get("task", [])),
+        "recent_projects": [ProjectSummary.model_validate(p).model_dump() for p in recent_projects],
+        "users": None,
+        "open_tickets": None,
+        "low_stock": None,
+    }
+
+    if is_staff:
+        users_by_role = {role: count for role, count in grouped.get("user", []) if role is not None}
+        dashboard["users"] = {
+            "total": sum(count for _, count in grouped.get("user", [])),
+            "by_role": users_by_role,
+        }
+        tickets_by_status = dict(grouped.get("ticket", []))
+        dashboard["open_tickets"] = sum(tickets_by_status.get(status, 0) for status in OPEN_TICKET_STATUSES)
+
+    if sees_stock:
+        low_stock_products = (
+            db.query(Product)
+            .filter(Product.stock <= Product.min_stock)
+            .order_by(Product.stock - Product.min_stock, Product.id)
+            .limit(LOW_STOCK_LIMIT)
+            .all()
+        )
+        dashboard["low_stock"] = {
+            "total": dict(grouped.get("low_stock", [])).get("all", 0),
+            "products": [
+                {"id": p.id, "name": p.name, "stock": p.stock, "min_stock": p.min_stock, "unit": p.unit}
+                for p in low_stock_products
+            ],
+        }
+
+    return dashboard
+
+@router.get("/", response_model=dict)
+def read_dashboard(
+    db: Session = Depends(deps.get_db),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    All dashboard figures in one request: project/task counts, users by
+    role, recent projects, open tickets and low-stock products.
+    Sections the caller's role may not see are returned as null.
+    """
+    if current_user.role in STAFF_ROLES:
+        key = ("staff",)
+    else:
+        key = ("user", current_user.id)
+    return dashboard_cache.get_or_set(key, lambda: build_dashboard(db, current_user))
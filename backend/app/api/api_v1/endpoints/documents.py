@@ -1,23 +1,29 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
 from app.models.document import Document
 from app.schemas.document import Document as DocumentSchema, DocumentCreate, DocumentUpdate
 
 router = APIRouter()
 
+DOCUMENT_KEYSET = Keyset(Document.id)
+
 @router.get("/", response_model=List[DocumentSchema])
 def read_documents(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     project_id: int = None,
 ) -> Any:
     query = db.query(Document)
     if project_id:
         query = query.filter(Document.project_id == project_id)
-    return query.offset(skip).limit(limit).all()
+    rows = DOCUMENT_KEYSET.paginate(query, cursor, skip, limit).all()
+    return DOCUMENT_KEYSET.page(rows, limit, response)
 
 @router.post("/", response_model=DocumentSchema)
 def create_document(
@@ -1,6 +1,7 @@
 from datetime import timedelta
-from typing import Any
+from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
@@ -12,32 +13,45 @@ from app.schemas.token import Token
 
 router = APIRouter()
 
+def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    return db.query(User).filter(User.email == email).first()
+
+def store_password_hash(db: Session, user: User, hashed_password: str) -> None:
+    user.hashed_password = hashed_password
+    db.add(user)
+    db.commit()
+
 @router.post("/login/access-token", response_model=Token)
-def login_access_token(
+async def login_access_token(
     db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests
+
+    The endpoint is async so that bcrypt runs on the dedicated password
+    executor instead of occupying a request threadpool token; the short DB
+    lookups still go through the threadpool.
     """
-    print(f"DEBUG LOGIN START")
-    print(f"Received username: {repr(form_data.username)}")
-    print(f"Received password: {repr(form_data.password)}")
-    
-    user = db.query(User).filter(User.email == form_data.username).first()
-    print(f"User found in DB: {user}")
-    
+    user = await run_in_threadpool(get_user_by_email, db, form_data.username)
+
+    # Exactly one bcrypt run per attempt, also for unknown emails
     if user:
-        is_password_correct = security.verify_password(form_data.password, user.hashed_password)
-        print(f"Password verification result: {is_password_correct}")
-        if not is_password_correct:
-            print(f"Stored hash: {user.hashed_password}")
-    
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
-        print("DEBUG LOGIN: Incorrect email or password")
+        is_password_correct, new_hash = await security.verify_and_update_password(
+            form_data.password, user.hashed_password
+        )
+    else:
+        await security.dummy_verify_password()
+        is_password_correct, new_hash = False, None
+
+    if not is_password_correct:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
     elif not user.is_active:
-        print("DEBUG LOGIN: Inactive user")
         raise HTTPException(status_code=400, detail="Inactive user")
+
+    if new_hash:
+        # Hash parameters changed (e.g. BCRYPT_ROUNDS) - upgrade transparently
+        await run_in_threadpool(store_password_hash, db, user, new_hash)
+
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
         "access_token": security.create_access_token(
@@ -1,21 +1,56 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, WebSocket, status
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, or_, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
-from app.models.message import Message
-from app.schemas.message import MessageCreate, Message as MessageSchema
-from app.models.user import User
+from app.api.push import sse_response, websocket_push
+from app.core.pagination import Keyset
+from app.core.conversations import mark_conversation_read
+from app.core.pubsub import publish_on_commit
+from app.core.serialization import ListSerializer
+from app.models.conversation import ConversationSummary
+from app.models.message import Message, MessageArchive
+from app.schemas.message import Conversation, ConversationRead, MessageCreate, Message as MessageSchema
+from app.schemas.user import UserPrincipal
 
 router = APIRouter()
+# Event-loop variants of the hot reads, mounted ahead of `router` when ASYNC_DB is on
+async_router = APIRouter()
+
+message_list_serializer = ListSerializer(MessageSchema)
+# Newest first; id breaks ties between messages sent within the same second
+MESSAGE_KEYSET = Keyset(Message.timestamp, Message.id, descending=True)
+conversation_list_serializer = ListSerializer(Conversation)
+# Most recently active conversation first
+INBOX_KEYSET = Keyset(ConversationSummary.last_message_at, ConversationSummary.id, descending=True)
+
+def message_channels(user_id: int, project_id: Optional[int] = None) -> List[str]:
+    """
+    Push channels: `user:<id>` carries every message a user sends or receives,
+    `user:<id>:project:<id>` only those of one project chat.
+    """
+    if project_id:
+        return [f"user:{user_id}:project:{project_id}"]
+    return [f"user:{user_id}"]
+
+def message_events(message: Message):
+    payload = {"type": "message", "data": MessageSchema.model_validate(message).model_dump(mode="json")}
+    for user_id in {message.sender_id, message.recipient_id}:
+        yield f"user:{user_id}", payload
+        if message.project_id:
+            yield f"user:{user_id}:project:{message.project_id}", payload
+
+publish_on_commit(Message, message_events)
 
 @router.post("/", response_model=MessageSchema)
 def create_message(
     *,
     db: Session = Depends(deps.get_db),
     message_in: MessageCreate,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Send a message.
@@ -31,55 +66,248 @@ def create_message(
     db.refresh(message)
     return message
 
+def messages_statement(
+    current_user: UserPrincipal, skip: int, limit: int, project_id: Optional[int], cursor: Optional[str] = None
+):
+    """
+    Messages the current user sent or received, newest first,
+    optionally limited to one project (shared by the sync and async endpoints).
+    """
+    stmt = select(Message).where(
+        or_(Message.sender_id == current_user.id, Message.recipient_id == current_user.id)
+    )
+    if project_id:
+        # 1-on-1 chat inside a project: still restricted to sender/recipient
+        # (the project group chat is /channels/{project_id})
+        stmt = stmt.where(Message.project_id == project_id)
+    return MESSAGE_KEYSET.paginate(stmt, cursor, skip, limit)
+
+def conversation_statement(
+    current_user: UserPrincipal,
+    user_id: int,
+    limit: int,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    model=Message,
+):
+    """
+    One page of the conversation with `user_id`, oldest first: the latest
+    `limit` messages, or those before/after message `before_id`/`after_id`
+    or sent after `since`. Each direction is read on its own from one of
+    the composite (sender, recipient, timestamp) indexes and the two are
+    merged, so a page costs the same however long the conversation is.
+    `model` selects the hot table or MessageArchive (see
+    `merge_conversation_pages`).
+    """
+    key = tuple_(model.timestamp, model.id)
+    conditions = []
+    if before_id is not None:
+        conditions.append(key < _message_key(before_id))
+    if after_id is not None:
+        conditions.append(key > _message_key(after_id))
+    if since is not None:
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)  # Stored as naive UTC
+        conditions.append(model.timestamp > since)
+    # Without a lower bound the page ends at the newest message
+    forward = after_id is not None or since is not None
+    order = [model.timestamp, model.id] if forward else [model.timestamp.desc(), model.id.desc()]
+
+    def direction(sender_id: int, recipient_id: int):
+        page = (
+            select(model.id)
+            .where(model.sender_id == sender_id, model.recipient_id == recipient_id, *conditions)
+            .order_by(*order)
+            .limit(limit)
+            .subquery()
+        )
+        return select(page.c.id)
+
+    candidates = union_all(direction(current_user.id, user_id), direction(user_id, current_user.id))
+    page_ids = select(model.id).where(model.id.in_(candidates)).order_by(*order).limit(limit)
+    return select(model).where(model.id.in_(page_ids)).order_by(model.timestamp, model.id)
+
+def _message_key(message_id: int):
+    """Sort key of an anchor message (hot or archived), resolved inside the query."""
+    timestamp = func.coalesce(
+        select(Message.timestamp).where(Message.id == message_id).scalar_subquery(),
+        select(MessageArchive.timestamp).where(MessageArchive.id == message_id).scalar_subquery(),
+    )
+    return tuple_(timestamp, message_id)
+
+def merge_conversation_pages(hot: List[Any], archived: List[Any], limit: int, forward: bool) -> List[Any]:
+    """
+    Combine the pages read from the hot table and the archive (both oldest
+    first) into one page, as if the conversation were a single table.
+    """
+    if not archived:
+        return list(hot)
+    messages = sorted([*hot, *archived], key=lambda message: (message.timestamp, message.id))
+    return messages[:limit] if forward else messages[-limit:]
+
+def inbox_statement(
+    current_user: UserPrincipal, skip: int, limit: int, unread_only: bool, cursor: Optional[str] = None
+):
+    """
+    The current user's conversations, one row per counterpart and project
+    thread, read from the maintained summary table (no grouping over messages).
+    """
+    stmt = (
+        select(ConversationSummary)
+        .where(ConversationSummary.user_id == current_user.id)
+        .options(joinedload(ConversationSummary.counterpart), joinedload(ConversationSummary.last_message))
+    )
+    if unread_only:
+        stmt = stmt.where(ConversationSummary.unread_count > 0)
+    return INBOX_KEYSET.paginate(stmt, cursor, skip, limit)
+
 @router.get("/", response_model=List[MessageSchema])
 def read_messages(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
     project_id: int = None,
-    current_user: User = Depends(deps.get_current_active_user),
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Retrieve messages for current user (sent and received).
     If project_id is provided, filter by project.
     """
-    query = db.query(Message)
-    
-    if project_id:
-        query = query.filter(Message.project_id == project_id)
-        # We also need to filter by user visibility (sender or recipient)
-        # Ideally, allows any project member to see, but Message struct has sender/recipient.
-        # If it's a group chat, new model needed. 
-        # Requirement: "chat inside orders". "User can go into it and there is a separate chat".
-        # This implies it might be a communication channel with the company. 
-        # So sender=User, Recipient=Admin/Manager (or vice-versa).
-        # So filtering by sender/recipient is still correct for 1-on-1 context within project.
-        query = query.filter(
-             or_(Message.sender_id == current_user.id, Message.recipient_id == current_user.id)
-        )
-    else:
-         # Global chat / Support chat
-        query = query.filter(
-            or_(Message.sender_id == current_user.id, Message.recipient_id == current_user.id)
-        )
-
-    messages = query.order_by(Message.timestamp.desc()).offset(skip).limit(limit).all()
-    return messages
+    messages = db.execute(messages_statement(current_user, skip, limit, project_id, cursor)).scalars().all()
+    return message_list_serializer.response(MESSAGE_KEYSET.page(messages, limit, response), response)
 
 @router.get("/conversation/{user_id}", response_model=List[MessageSchema])
 def read_conversation(
     *,
     db: Session = Depends(deps.get_db),
     user_id: int,
-    current_user: User = Depends(deps.get_current_active_user),
+    limit: int = 100,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
-    Retrieve conversation with a specific user.
+    Retrieve conversation with a specific user, oldest first.
+    Returns the latest `limit` messages; scroll back with `before_id` (the
+    oldest id shown) and catch up with `after_id` (the newest id shown) or
+    `since` (a timestamp).
     """
-    messages = db.query(Message).filter(
-        or_(
-            (Message.sender_id == current_user.id) & (Message.recipient_id == user_id),
-            (Message.sender_id == user_id) & (Message.recipient_id == current_user.id)
-        )
-    ).order_by(Message.timestamp).all()
-    return messages
+    args = (current_user, user_id, limit, before_id, after_id, since)
+    # Archived history is read from messagearchive the same way and merged in
+    hot = db.execute(conversation_statement(*args)).scalars().all()
+    archived = db.execute(conversation_statement(*args, model=MessageArchive)).scalars().all()
+    forward = after_id is not None or since is not None
+    return message_list_serializer.response(merge_conversation_pages(hot, archived, limit, forward))
+
+@router.post("/conversation/{user_id}/read", response_model=ConversationRead)
+def mark_conversation_as_read(
+    *,
+    db: Session = Depends(deps.get_db),
+    user_id: int,
+    project_id: Optional[int] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Mark all messages from a specific user as read (only one project thread if project_id is given).
+    """
+    return {"updated": mark_conversation_read(db, current_user.id, user_id, project_id)}
+
+@router.get("/inbox", response_model=List[Conversation])
+def read_inbox(
+    response: Response,
+    db: Session = Depends(deps.get_db),
+    skip: int = 0,
+    limit: int = 100,
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Retrieve the current user's conversations with their last message and
+    unread count, most recent first.
+    """
+    conversations = db.execute(inbox_statement(current_user, skip, limit, unread_only, cursor)).scalars().all()
+    return conversation_list_serializer.response(INBOX_KEYSET.page(conversations, limit, response), response)
+
+@router.websocket("/ws")
+async def messages_websocket(websocket: WebSocket, project_id: Optional[int] = None):
+    """
+    Push new messages of the caller (optionally of one project chat) as they
+    are committed: one `{"type": "message", "data": Message}` frame each.
+    Authenticate with `?token=`.
+    """
+    try:
+        current_user = await deps.get_stream_principal(websocket)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+    await websocket_push(websocket, message_channels(current_user.id, project_id))
+
+@router.get("/stream")
+async def stream_messages(
+    project_id: Optional[int] = None,
+    current_user: UserPrincipal = Depends(deps.get_stream_principal),
+):
+    """
+    Server-Sent Events fallback of `/messages/ws` (same payloads).
+    """
+    return await sse_response(message_channels(current_user.id, project_id))
+
+@async_router.get("/", response_model=List[MessageSchema])
+async def read_messages_async(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+    project_id: int = None,
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal_async),
+) -> Any:
+    """
+    Retrieve messages for current user (async engine).
+    """
+    result = await db.execute(messages_statement(current_user, skip, limit, project_id, cursor))
+    messages = MESSAGE_KEYSET.page(result.scalars().all(), limit, response)
+    return message_list_serializer.response(messages, response)
+
+@async_router.get("/conversation/{user_id}", response_model=List[MessageSchema])
+async def read_conversation_async(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    user_id: int,
+    limit: int = 100,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal_async),
+) -> Any:
+    """
+    Retrieve conversation with a specific user (async engine).
+    """
+    args = (current_user, user_id, limit, before_id, after_id, since)
+    hot = (await db.execute(conversation_statement(*args))).scalars().all()
+    archived = (await db.execute(conversation_statement(*args, model=MessageArchive))).scalars().all()
+    forward = after_id is not None or since is not None
+    return message_list_serializer.response(merge_conversation_pages(hot, archived, limit, forward))
+
+@async_router.get("/inbox", response_model=List[Conversation])
+async def read_inbox_async(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal_async),
+) -> Any:
+    """
+    Retrieve the current user's conversations (async engine).
+    """
+    result = await db.execute(inbox_statement(current_user, skip, limit, unread_only, cursor))
+    conversations = INBOX_KEYSET.page(result.scalars().all(), limit, response)
+    return conversation_list_serializer.response(conversations, response)
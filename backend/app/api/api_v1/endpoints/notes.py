@@ -1,23 +1,29 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
 from app.models.note import Note
 from app.schemas.note import Note as NoteSchema, NoteCreate, NoteUpdate
 
 router = APIRouter()
 
+NOTE_KEYSET = Keyset(Note.id)
+
 @router.get("/", response_model=List[NoteSchema])
 def read_notes(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     user_id: int = None,
 ) -> Any:
     query = db.query(Note)
     if user_id:
         query = query.filter(Note.user_id == user_id)
-    return query.offset(skip).limit(limit).all()
+    rows = NOTE_KEYSET.paginate(query, cursor, skip, limit).all()
+    return NOTE_KEYSET.page(rows, limit, response)
 
 @router.post("/", response_model=NoteSchema)
 def create_note(
@@ -1,19 +1,27 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
+from app.core.serialization import ListSerializer
 from app.models.product_log import ProductLog
 from app.schemas.product_log import ProductLog as ProductLogSchema, ProductLogCreate
 
 router = APIRouter()
 
+product_log_list_serializer = ListSerializer(ProductLogSchema)
+PRODUCT_LOG_KEYSET = Keyset(ProductLog.id)
+
 @router.get("/", response_model=List[ProductLogSchema])
 def read_product_logs(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
-    return db.query(ProductLog).offset(skip).limit(limit).all()
+    rows = PRODUCT_LOG_KEYSET.paginate(db.query(ProductLog), cursor, skip, limit).all()
+    return product_log_list_serializer.response(PRODUCT_LOG_KEYSET.page(rows, limit, response), response)
 
 @router.post("/", response_model=ProductLogSchema)
 def create_product_log(
@@ -1,19 +1,32 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.orm import Session, selectinload
 from app.api import deps
+from app.core.pagination import Keyset
+from app.core.serialization import ListSerializer
+from app.models.category import Category
 from app.models.product import Product
 from app.schemas.product import Product as ProductSchema, ProductCreate, ProductUpdate
 
 router = APIRouter()
 
+product_list_serializer = ListSerializer(ProductSchema)
+PRODUCT_KEYSET = Keyset(Product.id)
+
 @router.get("/", response_model=List[ProductSchema])
 def read_products(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
-    return db.query(Product).offset(skip).limit(limit).all()
+    # The schema nests the category with its subtree; load both in batches
+    query = db.query(Product).options(
+        selectinload(Product.category).selectinload(Category.children, recursion_depth=-1)
+    )
+    products = PRODUCT_KEYSET.paginate(query, cursor, skip, limit).all()
+    return product_list_serializer.response(PRODUCT_KEYSET.page(products, limit, response), response)
 
 @router.post("/", response_model=ProductSchema)
 def create_product(
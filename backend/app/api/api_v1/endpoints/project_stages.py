@@ -1,23 +1,29 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
 from app.models.project_stage import ProjectStage
 from app.schemas.project_stage import ProjectStage as ProjectStageSchema, ProjectStageCreate, ProjectStageUpdate
 
 router = APIRouter()
 
+PROJECT_STAGE_KEYSET = Keyset(ProjectStage.id)
+
 @router.get("/", response_model=List[ProjectStageSchema])
 def read_project_stages(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     project_id: int = None,
 ) -> Any:
     query = db.query(ProjectStage)
     if project_id:
         query = query.filter(ProjectStage.project_id == project_id)
-    return query.offset(skip).limit(limit).all()
+    rows = PROJECT_STAGE_KEYSET.paginate(query, cursor, skip, limit).all()
+    return PROJECT_STAGE_KEYSET.page(rows, limit, response)
 
 @router.post("/", response_model=ProjectStageSchema)
 def create_project_stage(
@@ -1,66 +1,169 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import JSONResponse
+from pydantic_core import to_jsonable_python
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only, selectinload
 from app.api import deps
-from app.models.project import Projekt
-from app.schemas.project import Project, ProjectCreate, ProjectUpdate, ProjectPublic
+from app.core.cache import TTLCache, invalidate_on_commit
+from app.core.config import settings
+from app.core.pagination import Keyset
+from app.core.serialization import ListSerializer
+from app.models.counter import Counter
+from app.models.project import Projekt, ProjectStatus
+from app.schemas.project import Project, ProjectCreate, ProjectUpdate, ProjectPublic, ProjectSummary, ProjectInDBBase
+from app.schemas.user import User as UserSchema, UserPrincipal
+from app.schemas.subcontractor import Subcontractor as SubcontractorSchema
 from app.models.user import User, UserRole
 from app.models.subcontractor import Subcontractor
 import re
 
 router = APIRouter()
+# Event-loop variants of the hot reads, mounted ahead of `router` when ASYNC_DB is on
+async_router = APIRouter()
 
-def generate_project_number(db: Session) -> str:
-    """Generate the next project number in format EP-XXXX (starting from 1000)"""
-    # Find the project with the highest number
-    # We query all project numbers, parse them, find max, and increment
-    # This is a simple implementation. For high concurrency, use a sequence or dedicated counter table.
-    projects = db.query(Projekt.projekt_nummer).filter(Projekt.projekt_nummer.isnot(None)).all()
+# Relationships serialized by the `Project` schema. Loading them with one
+# batched SELECT per relationship keeps a page at a fixed number of queries
+# instead of one lazy load per project and relationship.
+PROJECT_LOAD_OPTIONS = (
+    selectinload(Projekt.projektleiter),
+    selectinload(Projekt.gruppenleiter),
+    selectinload(Projekt.workers),
+    selectinload(Projekt.subcontractors),
+)
+
+# Nested relations a client can opt into with `include=` on the list endpoint
+PROJECT_RELATIONS = {
+    "projektleiter": UserSchema,
+    "gruppenleiter": UserSchema,
+    "workers": UserSchema,
+    "subcontractors": SubcontractorSchema,
+}
+PROJECT_FIELDS = list(ProjectInDBBase.model_fields)
+SUMMARY_FIELDS = list(ProjectSummary.model_fields)
+project_list_serializer = ListSerializer(Project)
+PROJECT_KEYSET = Keyset(Projekt.id)
+
+def _split_param(value: Optional[str], allowed: List[str], name: str) -> List[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    if "all" in items:
+        return list(allowed)
+    unknown = [item for item in items if item not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown {name}: {', '.join(unknown)}")
+    return items
+
+def parse_project_shape(fields: Optional[str], include: Optional[str]):
+    """
+    Resolve the `fields` / `include` query parameters into the scalar columns
+    and nested relations to return. `fields=summary` selects the compact
+    `ProjectSummary` columns, `all` selects everything.
+    """
+    if fields is None or fields.strip() == "summary":
+        field_names = list(SUMMARY_FIELDS)
+    else:
+        field_names = _split_param(fields, PROJECT_FIELDS, "fields")
+    if "id" not in field_names:
+        field_names.insert(0, "id")
+    relations = _split_param(include or "", list(PROJECT_RELATIONS), "include")
+    return field_names, relations
+
+def shape_project_query(query, field_names: List[str], relations: List[str]):
+    """Load only the requested columns and batch-load only the requested relations."""
+    columns = [getattr(Projekt, name) for name in field_names]
+    if "projektleiter" in relations and "projektleiter_id" not in field_names:
+        columns.append(Projekt.projektleiter_id)
+    options = [load_only(*columns)]
+    options += [selectinload(getattr(Projekt, name)) for name in relations]
+    return query.options(*options)
+
+def serialize_project_shape(project: Projekt, field_names: List[str], relations: List[str]) -> dict:
+    data = {name: getattr(project, name) for name in field_names}
+    for name in relations:
+        schema = PROJECT_RELATIONS[name]
+        value = getattr(project, name)
+        if isinstance(value, list):
+            data[name] = [schema.model_validate(item).model_dump() for item in value]
+        else:
+            data[name] = schema.model_validate(value).model_dump() if value is not None else None
+    return data
+
+PROJECT_NUMBER_COUNTER = "projekt_nummer"
+PROJECT_NUMBER_PATTERN = re.compile(r"^EP-(\d+)$")
+
+def parse_project_number(projekt_nummer: Optional[str]) -> Optional[int]:
+    match = PROJECT_NUMBER_PATTERN.match(projekt_nummer or "")
+    return int(match.group(1)) if match else None
+
+def scan_max_project_number(db: Session) -> int:
+    """
+    Highest existing EP-XXXX number (999 if there is none).
+    Full table scan - only used to seed the counter once.
+    """
     max_num = 999
-    
-    for p in projects:
-        if p.projekt_nummer and p.projekt_nummer.startswith("EP-"):
-            try:
-                num_part = int(p.projekt_nummer.split("-")[1])
-                if num_part > max_num:
-                    max_num = num_part
-            except (IndexError, ValueError):
-                continue
-                
-    return f"EP-{max_num + 1}"
+    for (projekt_nummer,) in db.query(Projekt.projekt_nummer).filter(Projekt.projekt_nummer.like("EP-%")):
+        num = parse_project_number(projekt_nummer)
+        if num is not None and num > max_num:
+            max_num = num
+    return max_num
 
-@router.get("/stats", response_model=dict)
-def read_project_stats(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_user),
-) -> Any:
+def seed_project_counter(db: Session) -> None:
+    """Create the project number counter from existing data if it does not exist yet."""
+    values = {"name": PROJECT_NUMBER_COUNTER, "value": scan_max_project_number(db)}
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        db.execute(sqlite_insert(Counter).values(**values).on_conflict_do_nothing(index_elements=["name"]))
+    elif dialect == "postgresql":
+        db.execute(pg_insert(Counter).values(**values).on_conflict_do_nothing(index_elements=["name"]))
+    else:
+        try:
+            with db.begin_nested():
+                db.add(Counter(**values))
+        except IntegrityError:
+            pass  # Seeded concurrently by another worker
+
+def generate_project_number(db: Session) -> str:
     """
-    Get project statistics.
+    Allocate the next project number in format EP-XXXX (starting from 1000).
+
+    Uses a single atomic `UPDATE ... RETURNING` on the counter row, so it is
+    O(1) and two workers can never get the same number. The increment is
+    part of the caller's transaction and is rolled back with it.
     """
-    total = db.query(Projekt).count()
-    in_progress = db.query(Projekt).filter(Projekt.status == "In Bearbeitung").count()
-    completed = db.query(Projekt).filter(Projekt.status == "Abgeschlossen").count()
-    
-    return {
-        "total": total,
-        "in_progress": in_progress,
-        "completed": completed
-    }
+    stmt = (
+        update(Counter)
+        .where(Counter.name == PROJECT_NUMBER_COUNTER)
+        .values(value=Counter.value + 1)
+        .returning(Counter.value)
+    )
+    value = db.execute(stmt).scalar()
+    if value is None:
+        seed_project_counter(db)
+        value = db.execute(stmt).scalar()
+    return f"EP-{value}"
 
-@router.get("/", response_model=List[Project])
-def read_projects(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_user: User = Depends(deps.get_current_active_user),
-    owner_only: bool = False,
-) -> Any:
+def reserve_project_number(db: Session, projekt_nummer: Optional[str]) -> None:
+    """Move the counter past a manually assigned EP-XXXX number so it is never handed out again."""
+    num = parse_project_number(projekt_nummer)
+    if num is None:
+        return
+    updated = db.execute(
+        update(Counter)
+        .where(Counter.name == PROJECT_NUMBER_COUNTER, Counter.value < num)
+        .values(value=num)
+    ).rowcount
+    if not updated and db.query(Counter.id).filter(Counter.name == PROJECT_NUMBER_COUNTER).first() is None:
+        seed_project_counter(db)
+        reserve_project_number(db, projekt_nummer)
+
+def filter_projects_for_user(query, current_user: UserPrincipal, owner_only: bool = False):
     """
-    Retrieve projects with role-based filtering.
+    Restrict a Projekt query to the projects `current_user` may see.
     """
-    query = db.query(Projekt)
-    
-    # Filter based on user role
     if owner_only:
         # User explicitly requests only THEIR projects
         # This is useful for Profile page where even Admins want to see "My Projects"
@@ -87,9 +190,104 @@ def read_projects(
         # We need to join with Customer table to filter by email
         from app.models.customer import Customer
         query = query.join(Projekt.customer).filter(Customer.email == current_user.email)
-    
-    projects = query.offset(skip).limit(limit).all()
-    return projects
+    return query
+
+project_stats_cache = TTLCache(ttl=settings.STATS_CACHE_TTL_SECONDS, maxsize=256)
+invalidate_on_commit(project_stats_cache, Projekt)
+
+def count_projects_by_status(query) -> dict:
+    """
+    Per-status project counts for `query` in a single GROUP BY
+    (served by the index on Projekt.status).
+    """
+    rows = (
+        query.with_entities(Projekt.status, func.count(Projekt.id))
+        .group_by(Projekt.status)
+        .order_by(None)
+        .all()
+    )
+    return summarize_project_status(rows)
+
+def summarize_project_status(rows) -> dict:
+    """Build the stats payload from (status, count) rows."""
+    by_status = {status: count for status, count in rows if status is not None}
+    return {
+        "total": sum(count for _, count in rows),
+        "in_progress": by_status.get(ProjectStatus.IN_BEARBEITUNG.value, 0),
+        "completed": by_status.get(ProjectStatus.ABGESCHLOSSEN.value, 0),
+        "by_status": by_status,
+    }
+
+@router.get("/stats", response_model=dict)
+def read_project_stats(
+    db: Session = Depends(deps.get_db),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Get project statistics.
+    """
+    return project_stats_cache.get_or_set(
+        "all", lambda: count_projects_by_status(db.query(Projekt))
+    )
+
+def build_projects_statement(
+    current_user: UserPrincipal,
+    skip: int,
+    limit: int,
+    owner_only: bool,
+    fields: Optional[str],
+    include: Optional[str],
+    cursor: Optional[str] = None,
+):
+    """
+    SELECT for the project list, shared by the sync and async endpoints.
+    Returns the statement and the (field_names, relations) shape, or None
+    when the full `Project` schema is requested.
+    """
+    stmt = select(Projekt)
+    shape = None
+    if fields is not None or include is not None:
+        shape = parse_project_shape(fields, include)
+        stmt = shape_project_query(stmt, *shape)
+    else:
+        stmt = stmt.options(*PROJECT_LOAD_OPTIONS)
+    stmt = filter_projects_for_user(stmt, current_user, owner_only)
+    return PROJECT_KEYSET.paginate(stmt, cursor, skip, limit), shape
+
+def project_list_response(projects, shape, limit: int, response: Response) -> Any:
+    projects = PROJECT_KEYSET.page(projects, limit, response)
+    if shape is None:
+        return project_list_serializer.response(projects, response)
+    rows = [serialize_project_shape(p, *shape) for p in projects]
+    return JSONResponse(content=to_jsonable_python(rows), headers=dict(response.headers))
+
+def project_detail_statement(project_id: int):
+    return select(Projekt).options(*PROJECT_LOAD_OPTIONS).where(Projekt.id == project_id)
+
+@router.get("/", response_model=List[Project])
+def read_projects(
+    response: Response,
+    db: Session = Depends(deps.get_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+    owner_only: bool = False,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Any:
+    """
+    Retrieve projects with role-based filtering.
+
+    Without `fields` / `include` the full `Project` schema is returned.
+    Passing either switches to a compact representation: `fields` is a
+    comma-separated list of columns (`summary` or `all`, default `summary`),
+    `include` a comma-separated list of nested relations to expand
+    (projektleiter, gruppenleiter, workers, subcontractors or `all`).
+    """
+    stmt, shape = build_projects_statement(current_user, skip, limit, owner_only, fields, include, cursor)
+    projects = db.execute(stmt).scalars().all()
+    return project_list_response(projects, shape, limit, response)
 
 @router.get("/public", response_model=List[ProjectPublic])
 def read_public_projects(
@@ -108,13 +306,17 @@ def create_project(
     *,
     db: Session = Depends(deps.get_db),
     project_in: ProjectCreate,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Create new project.
     """
     # Generate project number if not provided
-    prom_num = project_in.projekt_nummer or generate_project_number(db)
+    if project_in.projekt_nummer:
+        prom_num = project_in.projekt_nummer
+        reserve_project_number(db, prom_num)
+    else:
+        prom_num = generate_project_number(db)
     
     project = Projekt(
         name=project_in.name,
@@ -176,7 +378,7 @@ def update_project(
     db: Session = Depends(deps.get_db),
     project_id: int,
     project_in: ProjectUpdate,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Update a project.
@@ -186,6 +388,8 @@ def update_project(
         raise HTTPException(status_code=404, detail="Project not found")
     
     update_data = project_in.model_dump(exclude_unset=True)
+    if update_data.get('projekt_nummer'):
+        reserve_project_number(db, update_data['projekt_nummer'])
     
     # Handle M2M updates if present
     if 'gruppenleiter_ids' in update_data:
@@ -217,12 +421,12 @@ def read_project(
     *,
     db: Session = Depends(deps.get_db),
     project_id: int,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Get project by ID.
     """
-    project = db.query(Projekt).filter(Projekt.id == project_id).first()
+    project = db.execute(project_detail_statement(project_id)).scalar_one_or_none()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -238,7 +442,7 @@ def delete_project(
     *,
     db: Session = Depends(deps.get_db),
     project_id: int,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Delete a project.
@@ -246,7 +450,8 @@ def delete_project(
     if current_user.role not in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
         raise HTTPException(status_code=403, detail="Not authorized to delete projects")
 
-    project = db.query(Projekt).filter(Projekt.id == project_id).first()
+    # Load the relations now: the deleted instance is serialized after the commit
+    project = db.execute(project_detail_statement(project_id)).scalar_one_or_none()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     db.delete(project)
@@ -266,3 +471,37 @@ def read_public_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
+
+@async_router.get("/", response_model=List[Project])
+async def read_projects_async(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal_async),
+    owner_only: bool = False,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Any:
+    """
+    Retrieve projects with role-based filtering (async engine).
+    """
+    stmt, shape = build_projects_statement(current_user, skip, limit, owner_only, fields, include, cursor)
+    projects = (await db.execute(stmt)).scalars().all()
+    return project_list_response(projects, shape, limit, response)
+
+@async_router.get("/{project_id:int}", response_model=Project)
+async def read_project_async(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    project_id: int,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal_async),
+) -> Any:
+    """
+    Get project by ID (async engine).
+    """
+    project = (await db.execute(project_detail_statement(project_id))).scalar_one_or_none()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return project
@@ -1,19 +1,25 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
 from app.models.subcontractor import Subcontractor
 from app.schemas.subcontractor import Subcontractor as SubcontractorSchema, SubcontractorCreate, SubcontractorUpdate
 
 router = APIRouter()
 
+SUBCONTRACTOR_KEYSET = Keyset(Subcontractor.id)
+
 @router.get("/", response_model=List[SubcontractorSchema])
 def read_subcontractors(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
-    return db.query(Subcontractor).offset(skip).limit(limit).all()
+    rows = SUBCONTRACTOR_KEYSET.paginate(db.query(Subcontractor), cursor, skip, limit).all()
+    return SUBCONTRACTOR_KEYSET.page(rows, limit, response)
 
 @router.post("/", response_model=SubcontractorSchema)
 def create_subcontractor(
@@ -1,50 +1,82 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.api import deps
-from app.models.task import Aufgabe
+from app.core.cache import TTLCache, invalidate_on_commit
+from app.core.config import settings
+from app.core.pagination import Keyset
+from app.core.serialization import ListSerializer
+from app.models.task import Aufgabe, TaskStatus
 from app.schemas.task import Task, TaskCreate, TaskUpdate
-from app.models.user import User
+from app.schemas.user import UserPrincipal
 
 router = APIRouter()
+# Event-loop variants of the hot reads, mounted ahead of `router` when ASYNC_DB is on
+async_router = APIRouter()
+
+task_stats_cache = TTLCache(ttl=settings.STATS_CACHE_TTL_SECONDS, maxsize=256)
+invalidate_on_commit(task_stats_cache, Aufgabe)
+task_list_serializer = ListSerializer(Task)
+TASK_KEYSET = Keyset(Aufgabe.id)
+
+def count_tasks_by_status(query) -> dict:
+    """
+    Per-status task counts for `query` in a single GROUP BY
+    (served by the index on Aufgabe.status).
+    """
+    rows = (
+        query.with_entities(Aufgabe.status, func.count(Aufgabe.id))
+        .group_by(Aufgabe.status)
+        .order_by(None)
+        .all()
+    )
+    return summarize_task_status(rows)
+
+def summarize_task_status(rows) -> dict:
+    """Build the stats payload from (status, count) rows."""
+    by_status = {status: count for status, count in rows if status is not None}
+    return {
+        "total": sum(count for _, count in rows),
+        "open": by_status.get(TaskStatus.OFFEN.value, 0),
+        "in_progress": by_status.get(TaskStatus.IN_BEARBEITUNG.value, 0),
+        "by_status": by_status,
+    }
 
 @router.get("/stats", response_model=dict)
 def read_task_stats(
     db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Get task statistics.
     """
-    total = db.query(Aufgabe).count()
-    open_tasks = db.query(Aufgabe).filter(Aufgabe.status == "Offen").count()
-    in_progress = db.query(Aufgabe).filter(Aufgabe.status == "In Bearbeitung").count()
-    
-    return {
-        "total": total,
-        "open": open_tasks,
-        "in_progress": in_progress
-    }
+    return task_stats_cache.get_or_set(
+        "all", lambda: count_tasks_by_status(db.query(Aufgabe))
+    )
 
 @router.get("/", response_model=List[Task])
 def read_tasks(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(deps.get_current_active_user),
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Retrieve tasks.
     """
-    tasks = db.query(Aufgabe).offset(skip).limit(limit).all()
-    return tasks
+    tasks = TASK_KEYSET.paginate(db.query(Aufgabe), cursor, skip, limit).all()
+    return task_list_serializer.response(TASK_KEYSET.page(tasks, limit, response), response)
 
 @router.post("/", response_model=Task)
 def create_task(
     *,
     db: Session = Depends(deps.get_db),
     task_in: TaskCreate,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Create new task.
@@ -69,7 +101,7 @@ def update_task(
     db: Session = Depends(deps.get_db),
     task_id: int,
     task_in: TaskUpdate,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Update a task.
@@ -92,7 +124,7 @@ def read_task(
     *,
     db: Session = Depends(deps.get_db),
     task_id: int,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Get task by ID.
@@ -107,7 +139,7 @@ def delete_task(
     *,
     db: Session = Depends(deps.get_db),
     task_id: int,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Delete a task.
@@ -118,3 +150,34 @@ def delete_task(
     db.delete(task)
     db.commit()
     return task
+
+@async_router.get("/", response_model=List[Task])
+async def read_tasks_async(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal_async),
+) -> Any:
+    """
+    Retrieve tasks (async engine).
+    """
+    result = await db.execute(TASK_KEYSET.paginate(select(Aufgabe), cursor, skip, limit))
+    tasks = TASK_KEYSET.page(result.scalars().all(), limit, response)
+    return task_list_serializer.response(tasks, response)
+
+@async_router.get("/{task_id:int}", response_model=Task)
+async def read_task_async(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    task_id: int,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal_async),
+) -> Any:
+    """
+    Get task by ID (async engine).
+    """
+    task = await db.get(Aufgabe, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
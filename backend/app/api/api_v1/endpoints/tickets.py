@@ -1,20 +1,26 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
 from app.models.ticket import Ticket, TicketStatus, TicketPriority
+from app.schemas.user import UserPrincipal
 from app.schemas.ticket import Ticket as TicketSchema, TicketCreate, TicketUpdate
 
 router = APIRouter()
 
+TICKET_KEYSET = Keyset(Ticket.id)
+
 @router.get("/", response_model=List[TicketSchema])
 def read_tickets(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
-    tickets = db.query(Ticket).offset(skip).limit(limit).all()
-    return tickets
+    tickets = TICKET_KEYSET.paginate(db.query(Ticket), cursor, skip, limit).all()
+    return TICKET_KEYSET.page(tickets, limit, response)
 
 @router.post("/public", response_model=TicketSchema)
 def create_public_ticket(
@@ -78,7 +84,7 @@ def convert_ticket_to_project(
     *,
     db: Session = Depends(deps.get_db),
     id: int,
-    current_user: Any = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Convert a ticket to a project.
@@ -1,19 +1,64 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.core.pagination import Keyset
+from app.core.serialization import ListSerializer
 from app.models.time_entry import TimeEntry
 from app.schemas.time_entry import TimeEntry as TimeEntrySchema, TimeEntryCreate, TimeEntryUpdate
 
 router = APIRouter()
 
+time_entry_list_serializer = ListSerializer(TimeEntrySchema)
+# `sort` values; id breaks ties between entries of the same day
+TIME_ENTRY_KEYSETS = {
+    "-date": Keyset(TimeEntry.date, TimeEntry.id, descending=True),
+    "date": Keyset(TimeEntry.date, TimeEntry.id),
+    "id": Keyset(TimeEntry.id),
+}
+
 @router.get("/", response_model=List[TimeEntrySchema])
 def read_time_entries(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    location: Optional[str] = None,
+    open_only: bool = False,
+    sort: str = "-date",
 ) -> Any:
-    return db.query(TimeEntry).offset(skip).limit(limit).all()
+    """
+    Retrieve time entries, newest first.
+
+    Filters combine: `user_id`, `project_id`, `location`, an inclusive
+    `date_from`/`date_to` range and `open_only` (entries without an end time).
+    `sort` is `-date` (default), `date` or `id`. Per-user and per-project
+    queries are served by the (user_id, date) / (project_id, date) indexes.
+    """
+    keyset = TIME_ENTRY_KEYSETS.get(sort)
+    if keyset is None:
+        raise HTTPException(status_code=400, detail=f"Unknown sort: {sort}")
+    query = db.query(TimeEntry)
+    if user_id is not None:
+        query = query.filter(TimeEntry.user_id == user_id)
+    if project_id is not None:
+        query = query.filter(TimeEntry.project_id == project_id)
+    if date_from is not None:
+        query = query.filter(TimeEntry.date >= date_from)
+    if date_to is not None:
+        query = query.filter(TimeEntry.date <= date_to)
+    if location is not None:
+        query = query.filter(TimeEntry.location == location)
+    if open_only:
+        query = query.filter(TimeEntry.end_time.is_(None))
+    rows = keyset.paginate(query, cursor, skip, limit).all()
+    return time_entry_list_serializer.response(keyset.page(rows, limit, response), response)
 
 @router.post("/", response_model=TimeEntrySchema)
 def create_time_entry(
@@ -1,65 +1,187 @@
+import os
 from typing import Any
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import RedirectResponse
+from sqlalchemy.orm import Session
 from app.api import deps
-from app.models.user import User
-import shutil
-import os
-import uuid
+from app.core import storage
+from app.core.images import (
+    DERIVATIVE_FORMATS, DERIVATIVE_SIZES, DERIVED_DIR, derivative_relpath, derivative_urls, derivatives_enabled,
+    generate_derivatives, prerender_derivatives,
+)
+from app.api.api_v1.endpoints.documents import create_document
+from app.core import upload_sessions
+from app.core.config import settings
+from app.core.file_responses import cached_file_response, content_etag
+from app.core.storage import check_content_length, save_upload, store_blob, upload_url
+from app.core import upload_refs  # noqa: F401 - keeps the upload reference index up to date
+from app.models.upload import UploadBlob, UploadRef
+from app.schemas.document import DocumentCreate
+from app.schemas.upload import UploadResult, UploadSession, UploadSessionCreate, UploadSessionFinalize
+from app.schemas.user import UserPrincipal
 
 router = APIRouter()
 
-UPLOAD_DIR = "backend/static/uploads"
-
-@router.post("/", response_model=dict)
+@router.post("/", response_model=dict, dependencies=[Depends(check_content_length)])
 async def upload_file(
     file: UploadFile = File(...),
-    current_user: User = Depends(deps.get_current_active_user),
+    db: Session = Depends(deps.get_db),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Upload a generic file.
     """
-    # Base dir: backend/
-    # endpoints -> api_v1 -> api -> app -> backend
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-    upload_path = os.path.join(base_dir, "static", "uploads")
-    
-    os.makedirs(upload_path, exist_ok=True)
-    
-    # Generate unique filename
-    file_ext = os.path.splitext(file.filename)[1]
-    filename = f"{uuid.uuid4()}{file_ext}"
-    file_location = os.path.join(upload_path, filename)
-    
-    with open(file_location, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-        
-    return {"url": f"/assets/uploads/{filename}"}
-
-
-@router.post("/image", response_model=dict)
+    return await save_upload(file, db)
+
+
+@router.post("/image", response_model=dict, dependencies=[Depends(check_content_length)])
 async def upload_image(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    current_user: User = Depends(deps.get_current_active_user),
+    db: Session = Depends(deps.get_db),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Upload an image file.
+    Resized variants are rendered in the background; `variants` holds their URLs.
     """
     if not file.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="File must be an image")
-    
-    # Ensure upload directory exists
-    # Base dir: backend/
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-    upload_path = os.path.join(base_dir, "static", "uploads")
-    
-    os.makedirs(upload_path, exist_ok=True)
-    
-    # Generate unique filename
-    file_ext = os.path.splitext(file.filename)[1]
-    filename = f"{uuid.uuid4()}{file_ext}"
-    file_location = os.path.join(upload_path, filename)
-    
-    with open(file_location, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-        
-    return {"url": f"/assets/uploads/{filename}"}
+    result = await save_upload(file, db)
+    if derivatives_enabled():
+        background_tasks.add_task(prerender_derivatives, result["path"])
+        result["variants"] = derivative_urls(result["path"])
+    return result
+
+
+@router.get("/derivatives/{variant}/{path:path}")
+async def read_derivative(variant: str, path: str, request: Request, format: str = "webp") -> Any:
+    """
+    Resized variant of an uploaded image (thumb, medium, large) as WebP or JPEG.
+    Missing variants are rendered on first request and cached on disk.
+    """
+    if variant not in DERIVATIVE_SIZES or format not in DERIVATIVE_FORMATS:
+        raise HTTPException(status_code=404, detail="Unknown variant")
+    rel = storage.resolve_relpath(path)
+    if rel is None or rel.startswith(f"{DERIVED_DIR}/"):
+        raise HTTPException(status_code=404, detail="File not found")
+    if not await run_in_threadpool(os.path.isfile, storage.upload_path(rel)):
+        raise HTTPException(status_code=404, detail="File not found")
+    if not derivatives_enabled():
+        return RedirectResponse(upload_url(rel))
+    destination = storage.upload_path(derivative_relpath(rel, variant, format))
+    if not await run_in_threadpool(os.path.isfile, destination):
+        try:
+            await generate_derivatives(rel, [variant], [format])
+        except OSError:
+            raise HTTPException(status_code=415, detail="File is not a supported image")
+    stat = await run_in_threadpool(os.stat, destination)
+    etag = await content_etag(destination, stat)
+    return await cached_file_response(request, destination, stat, etag, f"image/{format}")
+
+
+@router.get("/blobs/{sha256}", response_model=dict)
+def read_blob(
+    sha256: str,
+    db: Session = Depends(deps.get_db),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Get a stored blob and the records referencing it.
+    """
+    blob = db.query(UploadBlob).filter(UploadBlob.sha256 == sha256).first()
+    if not blob:
+        raise HTTPException(status_code=404, detail="Blob not found")
+    refs = db.query(UploadRef).filter(UploadRef.sha256 == sha256).order_by(UploadRef.id).all()
+    return {
+        "sha256": blob.sha256,
+        "url": upload_url(blob.path),
+        "size": blob.size,
+        "content_type": blob.content_type,
+        "references": [{"model": r.model, "record_id": r.record_id, "field": r.field} for r in refs],
+    }
+
+
+# Resumable uploads for large documents: create a session, PUT the bytes in
+# any number of chunks (each at the current offset), then finalize.
+def _session_response(status: dict) -> UploadSession:
+    return UploadSession(**status, chunk_size=settings.RESUMABLE_CHUNK_SIZE)
+
+
+@router.post("/sessions", response_model=UploadSession)
+async def create_upload_session(
+    session_in: UploadSessionCreate,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Start a resumable upload of `size` bytes.
+    """
+    status = await upload_sessions.create_session(
+        session_in.filename, session_in.size, session_in.content_type, current_user.id
+    )
+    return _session_response(status)
+
+
+@router.get("/sessions/{session_id}", response_model=UploadSession)
+async def read_upload_session(
+    session_id: str,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Upload progress; `offset` is where the next chunk has to start.
+    """
+    return _session_response(await upload_sessions.get_session(session_id, current_user.id))
+
+
+@router.put("/sessions/{session_id}", response_model=UploadSession)
+async def upload_session_chunk(
+    session_id: str,
+    offset: int,
+    request: Request,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Append the raw request body at `offset`. The body is streamed to disk,
+    never held in memory; a wrong offset returns 409 with the current one.
+    """
+    status = await upload_sessions.append_chunk(session_id, current_user.id, offset, request.stream())
+    return _session_response(status)
+
+
+@router.post("/sessions/{session_id}/finalize", response_model=UploadResult)
+async def finalize_upload_session(
+    session_id: str,
+    finalize_in: UploadSessionFinalize,
+    db: Session = Depends(deps.get_db),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Move a complete upload into the file store. With `document`, the
+    document is created through the regular document flow as well.
+    """
+    stored, status = await upload_sessions.complete_session(session_id, current_user.id)
+    # The session is closed now; store_blob discards the file if it fails
+    result = await store_blob(stored, status["filename"], status["content_type"], db)
+    if finalize_in.document is not None:
+        doc_in = DocumentCreate(
+            **finalize_in.document.model_dump(),
+            file_url=result["url"],
+            file_name=status["filename"],
+            file_size=result["size"],
+        )
+        result["document"] = await run_in_threadpool(create_document, db=db, doc_in=doc_in)
+    return result
+
+
+@router.delete("/sessions/{session_id}", response_model=dict)
+async def delete_upload_session(
+    session_id: str,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Abort a resumable upload and drop the received bytes.
+    """
+    await upload_sessions.delete_session(session_id, current_user.id)
+    return {"ok": True}
+
@@ -1,48 +1,38 @@
-from typing import Any, List
-from fastapi import APIRouter, Body, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 
 from app.api import deps
 from app.core import security
 from app.core.config import settings
+from app.core.pagination import Keyset
+from app.core.serialization import ListSerializer
 from app.models.user import User
-from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
+from app.schemas.user import User as UserSchema, UserCreate, UserUpdate, UserPrincipal
 
 router = APIRouter()
 
+user_list_serializer = ListSerializer(UserSchema)
+USER_KEYSET = Keyset(User.id)
+
 @router.get("/", response_model=List[UserSchema])
 def read_users(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(deps.get_current_active_user),
+    cursor: Optional[str] = None,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Retrieve users.
     """
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
-
-@router.post("/", response_model=UserSchema)
-def create_user(
-    *,
-    db: Session = Depends(deps.get_db),
-    user_in: UserCreate,
-    current_user: User = Depends(deps.get_current_active_user), # Only authenticated users can create users for now? Or maybe open registration?
-) -> Any:
-    """
-    Create new user.
-    """
-    # Check permissions - usually admin only, but for now allow any active user or remove dependency for open reg
-    # Let's assume open registration is NOT the default for this system (it's enterprise), so maybe only admin.
-    # But for development ease, I'll allow open registration on a separate endpoint or just here if I remove dependency.
-    # Actually, let's make this an admin-only endpoint effectively, and add a open registration if needed.
-    # For now, I'll restrict it. To create the FIRST user (admin), we'll use a script.
-    # Allow Admin to create users
-    if not current_user.is_superuser and current_user.role != "Admin":
-        raise HTTPException(status_code=400, detail="Not enough permissions")
+    users = USER_KEYSET.paginate(db.query(User), cursor, skip, limit).all()
+    return user_list_serializer.response(USER_KEYSET.page(users, limit, response), response)
 
+def insert_user(db: Session, user_in: UserCreate, hashed_password: str) -> User:
     user = db.query(User).filter(User.email == user_in.email).first()
     if user:
         raise HTTPException(
@@ -51,7 +41,7 @@ def create_user(
         )
     user = User(
         email=user_in.email,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=hashed_password,
         first_name=user_in.first_name,
         last_name=user_in.last_name,
         role=user_in.role,
@@ -62,20 +52,32 @@ def create_user(
     db.refresh(user)
     return user
 
-@router.post("/open", response_model=UserSchema)
-def create_user_open(
+@router.post("/", response_model=UserSchema)
+async def create_user(
     *,
     db: Session = Depends(deps.get_db),
     user_in: UserCreate,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal), # Only authenticated users can create users for now? Or maybe open registration?
 ) -> Any:
     """
-    Create new user without logged in. Only for Clients.
+    Create new user.
+
+    Async like login_access_token: bcrypt runs on the password executor,
+    the DB work in the threadpool.
     """
-    if not settings.USERS_OPEN_REGISTRATION:
-        raise HTTPException(
-            status_code=403,
-            detail="Open user registration is forbidden on this server",
-        )
+    # Check permissions - usually admin only, but for now allow any active user or remove dependency for open reg
+    # Let's assume open registration is NOT the default for this system (it's enterprise), so maybe only admin.
+    # But for development ease, I'll allow open registration on a separate endpoint or just here if I remove dependency.
+    # Actually, let's make this an admin-only endpoint effectively, and add a open registration if needed.
+    # For now, I'll restrict it. To create the FIRST user (admin), we'll use a script.
+    # Allow Admin to create users
+    if not current_user.is_superuser and current_user.role != "Admin":
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+
+    hashed_password = await security.get_password_hash_async(user_in.password)
+    return await run_in_threadpool(insert_user, db, user_in, hashed_password)
+
+def register_customer(db: Session, user_in: UserCreate, hashed_password: str) -> User:
     user = db.query(User).filter(User.email == user_in.email).first()
     if user:
         raise HTTPException(
@@ -86,7 +88,7 @@ def create_user_open(
     # Create User
     user = User(
         email=user_in.email,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=hashed_password,
         first_name=user_in.first_name,
         last_name=user_in.last_name,
         role="Kunde", # Default role for self-registration
@@ -114,18 +116,26 @@ def create_user_open(
     
     return user
 
-@router.put("/me", response_model=UserSchema)
-def update_user_me(
+@router.post("/open", response_model=UserSchema)
+async def create_user_open(
     *,
     db: Session = Depends(deps.get_db),
-    user_in: UserUpdate,
-    current_user: User = Depends(deps.get_current_active_user),
+    user_in: UserCreate,
 ) -> Any:
     """
-    Update own user.
+    Create new user without logged in. Only for Clients.
     """
-    if user_in.password:
-        current_user.hashed_password = security.get_password_hash(user_in.password)
+    if not settings.USERS_OPEN_REGISTRATION:
+        raise HTTPException(
+            status_code=403,
+            detail="Open user registration is forbidden on this server",
+        )
+    hashed_password = await security.get_password_hash_async(user_in.password)
+    return await run_in_threadpool(register_customer, db, user_in, hashed_password)
+
+def update_own_user(db: Session, current_user: User, user_in: UserUpdate, hashed_password: Optional[str]) -> User:
+    if hashed_password:
+        current_user.hashed_password = hashed_password
     if user_in.email:
         current_user.email = user_in.email
     if user_in.first_name:
@@ -141,25 +151,24 @@ def update_user_me(
     
     db.add(current_user)
     db.commit()
+    deps.invalidate_user(current_user.id)
     db.refresh(current_user)
     return current_user
 
-@router.put("/{user_id}", response_model=UserSchema)
-def update_user(
+@router.put("/me", response_model=UserSchema)
+async def update_user_me(
     *,
     db: Session = Depends(deps.get_db),
-    user_id: int,
     user_in: UserUpdate,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Update a user. Admin only.
+    Update own user.
     """
-    if not current_user.is_superuser and current_user.role != "Admin":
-         raise HTTPException(
-            status_code=400, detail="The user doesn't have enough privileges"
-        )
-    
+    hashed_password = await security.get_password_hash_async(user_in.password) if user_in.password else None
+    return await run_in_threadpool(update_own_user, db, current_user, user_in, hashed_password)
+
+def update_user_by_id(db: Session, user_id: int, user_in: UserUpdate, hashed_password: Optional[str]) -> User:
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(
@@ -167,8 +176,8 @@ def update_user(
             detail="The user with this id does not exist in the system",
         )
         
-    if user_in.password:
-        user.hashed_password = security.get_password_hash(user_in.password)
+    if hashed_password:
+        user.hashed_password = hashed_password
     if user_in.email:
         user.email = user_in.email
     if user_in.first_name:
@@ -182,9 +191,29 @@ def update_user(
         
     db.add(user)
     db.commit()
+    deps.invalidate_user(user.id)
     db.refresh(user)
     return user
 
+@router.put("/{user_id}", response_model=UserSchema)
+async def update_user(
+    *,
+    db: Session = Depends(deps.get_db),
+    user_id: int,
+    user_in: UserUpdate,
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
+) -> Any:
+    """
+    Update a user. Admin only.
+    """
+    if not current_user.is_superuser and current_user.role != "Admin":
+         raise HTTPException(
+            status_code=400, detail="The user doesn't have enough privileges"
+        )
+    
+    hashed_password = await security.get_password_hash_async(user_in.password) if user_in.password else None
+    return await run_in_threadpool(update_user_by_id, db, user_id, user_in, hashed_password)
+
 
 @router.get("/me", response_model=UserSchema)
 def read_user_me(
@@ -201,7 +230,7 @@ def delete_user(
     *,
     db: Session = Depends(deps.get_db),
     user_id: int,
-    current_user: User = Depends(deps.get_current_active_user),
+    current_user: UserPrincipal = Depends(deps.get_current_active_principal),
 ) -> Any:
     """
     Delete a user. Admin only.
@@ -220,4 +249,5 @@ def delete_user(
     
     db.delete(user)
     db.commit()
+    deps.invalidate_user(user_id)
     return user
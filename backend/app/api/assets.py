@@ -0,0 +1,30 @@
+import mimetypes
+import os
+
+from fastapi import APIRouter, HTTPException, Request
+
+from app.core import storage
+from app.core.file_responses import cached_file_response, content_etag
+
+router = APIRouter()
+
+
+@router.api_route(storage.UPLOAD_URL_PREFIX + "{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def serve_upload(path: str, request: Request):
+    """
+    Uploaded files. Names are unique (content hash or uuid), so responses
+    are cacheable forever; the strong ETag is the content SHA-256.
+    """
+    rel = storage.resolve_relpath(path)
+    if rel is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    file_path = storage.upload_path(rel)
+    try:
+        stat = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail="File not found")
+    if not os.path.isfile(file_path):
+        raise HTTPException(status_code=404, detail="File not found")
+    etag = await content_etag(file_path, stat, storage.sha256_from_url(storage.UPLOAD_URL_PREFIX + rel))
+    media_type = mimetypes.guess_type(rel)[0] or "application/octet-stream"
+    return await cached_file_response(request, file_path, stat, etag, media_type)
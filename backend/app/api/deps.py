@@ -1,19 +1,29 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.requests import HTTPConnection
 from app.core import security
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal, SessionLocal
 from app.models.user import User
 from app.schemas.token import TokenPayload
+from app.schemas.user import UserPrincipal
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
 )
 
+# Principal snapshots keyed by user id. Invalidated by the user update/delete
+# endpoints; the TTL bounds staleness for writes made by other workers.
+user_cache = TTLCache(ttl=settings.USER_CACHE_TTL_SECONDS, maxsize=settings.USER_CACHE_MAXSIZE)
+
 def get_db() -> Generator:
     try:
         db = SessionLocal()
@@ -21,9 +31,14 @@ def get_db() -> Generator:
     finally:
         db.close()
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> User:
+async def get_async_db() -> AsyncGenerator:
+    """AsyncSession for endpoints running on the event loop (requires ASYNC_DB)."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("ASYNC_DB is disabled")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def decode_token(token: str) -> TokenPayload:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
@@ -34,9 +49,24 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
+    return token_data
+
+def cache_principal(user: User) -> UserPrincipal:
+    principal = UserPrincipal.model_validate(user)
+    user_cache.set(user.id, principal)
+    return principal
+
+def invalidate_user(user_id: int) -> None:
+    user_cache.invalidate(user_id)
+
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
+) -> User:
+    token_data = decode_token(token)
     user = db.query(User).filter(User.id == token_data.sub).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    cache_principal(user)
     return user
 
 def get_current_active_user(
@@ -45,3 +75,77 @@ def get_current_active_user(
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+def get_current_principal(
+    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
+) -> UserPrincipal:
+    """
+    Like get_current_user, but returns a cached snapshot (id, email, role,
+    flags) instead of the ORM object, so a cache hit needs no query.
+    Use it for endpoints that only check who the caller is.
+    """
+    token_data = decode_token(token)
+    principal = user_cache.get(token_data.sub)
+    if principal is None:
+        user = db.query(User).filter(User.id == token_data.sub).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        principal = cache_principal(user)
+    return principal
+
+def get_current_active_principal(
+    current_user: UserPrincipal = Depends(get_current_principal),
+) -> UserPrincipal:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+async def get_current_principal_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(reusable_oauth2)
+) -> UserPrincipal:
+    """Async get_current_principal: cache hits never leave the event loop."""
+    token_data = decode_token(token)
+    principal = user_cache.get(token_data.sub)
+    if principal is None:
+        user = (await db.execute(select(User).where(User.id == token_data.sub))).scalar_one_or_none()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        principal = cache_principal(user)
+    return principal
+
+async def get_current_active_principal_async(
+    current_user: UserPrincipal = Depends(get_current_principal_async),
+) -> UserPrincipal:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+def _load_principal(token: str) -> UserPrincipal:
+    token_data = decode_token(token)
+    principal = user_cache.get(token_data.sub)
+    if principal is None:
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter(User.id == token_data.sub).first()
+            if not user:
+                raise HTTPException(status_code=404, detail="User not found")
+            principal = cache_principal(user)
+        finally:
+            db.close()
+    if not principal.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return principal
+
+async def get_stream_principal(connection: HTTPConnection) -> UserPrincipal:
+    """
+    Caller of a long-lived connection (WebSocket, SSE). Browsers can't set
+    headers on those, so the token may also come as `?token=`. No session is
+    held for the lifetime of the connection; a cache miss opens a short one.
+    """
+    token = connection.query_params.get("token")
+    authorization = connection.headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return await run_in_threadpool(_load_principal, token)
@@ -0,0 +1,79 @@
+import asyncio
+from typing import Iterable
+
+from fastapi import WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.pubsub import hub
+
+KEEPALIVE = '{"type":"ping"}'
+
+
+async def websocket_push(websocket: WebSocket, channels: Iterable[str]) -> None:
+    """
+    Forward events of `channels` to an accepted WebSocket until either side
+    closes. Incoming frames are ignored; they only serve to notice the
+    disconnect while no events arrive.
+    """
+    subscription = await hub.subscribe(channels)
+
+    async def drain_incoming():
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+
+    receiver = asyncio.create_task(drain_incoming())
+    try:
+        while not receiver.done():
+            getter = asyncio.ensure_future(subscription.get())
+            done, _ = await asyncio.wait(
+                {getter, receiver}, timeout=settings.PUSH_KEEPALIVE_SECONDS, return_when=asyncio.FIRST_COMPLETED
+            )
+            if getter not in done:
+                getter.cancel()
+                if not receiver.done():
+                    await websocket.send_text(KEEPALIVE)
+                continue
+            data = getter.result()
+            if data is None:
+                # Fell behind: close so the client reconnects and refetches
+                await websocket.close(code=1013)
+                break
+            await websocket.send_text(data)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        hub.unsubscribe(subscription)
+
+
+async def sse_response(channels: Iterable[str]) -> StreamingResponse:
+    """
+    Server-Sent Events fallback for clients without WebSockets: one `data:`
+    line per event, comment lines as keep-alive.
+    """
+    subscription = await hub.subscribe(channels)
+
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    data = await asyncio.wait_for(subscription.get(), timeout=settings.PUSH_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if data is None:
+                    break
+                yield f"data: {data}\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Hashable, List, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    The cache lives in the worker process, so with several uvicorn workers
+    each one has its own copy; `ttl` bounds how stale another worker can be
+    after a write.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable = _MISSING) -> None:
+        """Drop one key, or everything when called without a key."""
+        with self._lock:
+            if key is _MISSING:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+_watchers: List[Tuple[TTLCache, Tuple[Type, ...]]] = []
+
+
+def invalidate_on_commit(cache: TTLCache, *models: Type) -> None:
+    """Clear `cache` whenever a transaction that wrote any of `models` commits."""
+    _watchers.append((cache, models))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_written_models(session, flush_context):
+    written = session.info.setdefault("written_models", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        written.add(type(obj))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_watchers(session):
+    written = session.info.pop("written_models", None)
+    if not written:
+        return
+    for cache, models in _watchers:
+        if any(issubclass(model, models) for model in written):
+            cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_models(session):
+    session.info.pop("written_models", None)
@@ -6,13 +6,70 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     SECRET_KEY: str = "CHANGE_THIS_TO_A_SECURE_SECRET_KEY" # In production, this should be an env var
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8 # 8 days
+    BCRYPT_ROUNDS: int = 12 # Changing it re-hashes passwords on next login
+    PASSWORD_HASH_WORKERS: int = 4 # Dedicated threads for bcrypt, separate from the request threadpool
     
     # Database
     SQLALCHEMY_DATABASE_URI: Optional[str] = "sqlite:///./sql_app.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    ASYNC_DB: bool = False # Serve hot read endpoints from an async engine (needs aiosqlite / asyncpg)
+
+    # SQLite production profile, applied on every new connection
+    SQLITE_TUNING: bool = True
+    SQLITE_JOURNAL_MODE: str = "WAL" # Readers don't block the writer
+    SQLITE_SYNCHRONOUS: str = "NORMAL" # Safe with WAL, fsync only at checkpoints
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000 # Wait for the write lock instead of "database is locked"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE: int = -64000 # Negative = KiB, i.e. 64 MB page cache per connection
+    SQLITE_TEMP_STORE: str = "MEMORY"
     
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:5173", "http://localhost:3000"] # React dev server
     USERS_OPEN_REGISTRATION: bool = True
 
+    # Uploads
+    MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024 # Bytes, enforced while streaming (413 beyond)
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+    MAX_RESUMABLE_UPLOAD_SIZE: int = 2 * 1024 * 1024 * 1024 # Plans/CAD exports via /upload/sessions
+    RESUMABLE_CHUNK_SIZE: int = 8 * 1024 * 1024 # Suggested PUT size for clients
+    UPLOAD_SESSION_TTL_HOURS: float = 48 # Idle resumable sessions are dropped by the upload GC
+    UPLOAD_GC_GRACE_HOURS: float = 24 # Unreferenced files younger than this are kept (not yet attached)
+    UPLOAD_GC_QUARANTINE_DAYS: int = 7 # Quarantined files are purged after this
+    UPLOAD_GC_INTERVAL_HOURS: float = 0 # > 0 runs the GC inside the app process; 0 = CLI/cron only
+
+    # Image derivatives (thumb/medium/large in WebP and JPEG, needs Pillow)
+    IMAGE_DERIVATIVES: bool = True
+    IMAGE_WORKERS: int = 2 # Processes rendering derivatives
+    IMAGE_QUALITY: int = 80
+
+    # Response compression (brotli when installed, else gzip)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024 # Bytes; smaller bodies gain less than the CPU costs
+    COMPRESSION_TYPES: List[str] = ["application/json", "text/html", "text/plain", "text/css", "application/javascript", "image/svg+xml"]
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4 # Dynamic responses: 4-5 is close to gzip speed at better ratios
+
+    # List endpoint serialization (app/core/serialization.py)
+    FAST_JSON_RESPONSES: bool = True # Precompiled TypeAdapter + one-pass JSON instead of response_model re-validation
+    TRUST_ORM_OUTPUT: bool = False # Flat schemas skip validation and encode ORM attributes with orjson
+
+    # Message retention (app/core/retention.py, archive_messages.py)
+    MESSAGE_RETENTION_DAYS: int = 365 # Older messages move to the archive table; 0 = keep all
+    MESSAGE_ARCHIVE_CLOSED_PROJECTS: bool = True # Archive messages of projects in "Abgeschlossen" regardless of age
+    MESSAGE_ARCHIVE_INTERVAL_HOURS: float = 0 # > 0 runs the archiver inside the app process; 0 = CLI/cron only
+
+    # Real-time push (WebSocket / SSE, app/core/pubsub.py)
+    PUSH_BACKEND: str = "memory" # "memory" (single worker) or "redis" (fan-out across workers)
+    PUSH_REDIS_URL: str = "redis://localhost:6379/0"
+    PUSH_QUEUE_SIZE: int = 256 # Undelivered events per client before it is disconnected to resync
+    PUSH_KEEPALIVE_SECONDS: float = 15 # SSE comment / WebSocket ping interval through proxies
+
+    # Caching
+    STATS_CACHE_TTL_SECONDS: int = 30 # Dashboard/status counters, cleared on writes
+    USER_CACHE_TTL_SECONDS: int = 60 # Authenticated user snapshots, cleared on user updates
+    USER_CACHE_MAXSIZE: int = 10000
+
     class Config:
         case_sensitive = True
         env_file = ".env"
@@ -0,0 +1,202 @@
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, event, func, insert, inspect, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.conversation import ConversationSummary
+from app.models.message import Message
+
+# (user_id, counterpart_id, thread_id) of a ConversationSummary row
+ThreadKey = Tuple[int, int, int]
+# Message columns an inbox row is derived from
+SUMMARY_FIELDS = ("sender_id", "recipient_id", "project_id", "timestamp", "is_read")
+
+
+def thread_keys(message: Any) -> List[Tuple[ThreadKey, bool]]:
+    """Inbox rows a message (or message row) belongs to, each with whether it counts as unread there."""
+    thread_id = message.project_id or 0
+    sent = ((message.sender_id, message.recipient_id, thread_id), False)
+    if message.sender_id == message.recipient_id:
+        return [sent]
+    return [sent, ((message.recipient_id, message.sender_id, thread_id), not message.is_read)]
+
+
+def _thread_filter(user_id: int, counterpart_id: int, thread_id: Optional[int]):
+    """Messages between two users, in one thread (0 = direct messages) or all of them (None)."""
+    pair = or_(
+        and_(Message.sender_id == user_id, Message.recipient_id == counterpart_id),
+        and_(Message.sender_id == counterpart_id, Message.recipient_id == user_id),
+    )
+    if thread_id is None:
+        return pair
+    return and_(pair, Message.project_id == thread_id if thread_id else Message.project_id.is_(None))
+
+
+def _add_messages(connection, rows: List[dict]) -> None:
+    """Move the last message forward and add to the unread count, creating missing rows."""
+    table = ConversationSummary.__table__
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        stmt = (sqlite_insert if dialect == "sqlite" else pg_insert)(table)
+        newer = or_(
+            stmt.excluded.last_message_at > table.c.last_message_at,
+            and_(
+                stmt.excluded.last_message_at == table.c.last_message_at,
+                stmt.excluded.last_message_id > table.c.last_message_id,
+            ),
+            table.c.last_message_id.is_(None),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "counterpart_id", "thread_id"],
+            set_={
+                "last_message_id": case((newer, stmt.excluded.last_message_id), else_=table.c.last_message_id),
+                "last_message_at": case((newer, stmt.excluded.last_message_at), else_=table.c.last_message_at),
+                "unread_count": table.c.unread_count + stmt.excluded.unread_count,
+            },
+        )
+        connection.execute(stmt, rows)
+        return
+    for row in rows:
+        result = connection.execute(
+            update(table)
+            .where(
+                table.c.user_id == row["user_id"],
+                table.c.counterpart_id == row["counterpart_id"],
+                table.c.thread_id == row["thread_id"],
+            )
+            .values(
+                last_message_id=row["last_message_id"],
+                last_message_at=row["last_message_at"],
+                unread_count=table.c.unread_count + row["unread_count"],
+            )
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(table), row)
+
+
+def _recompute(connection, key: ThreadKey) -> None:
+    """Rebuild one row from the messages after edits or deletes (O(thread), rare)."""
+    user_id, counterpart_id, thread_id = key
+    table = ConversationSummary.__table__
+    connection.execute(
+        delete(table).where(
+            table.c.user_id == user_id, table.c.counterpart_id == counterpart_id, table.c.thread_id == thread_id
+        )
+    )
+    in_thread = _thread_filter(user_id, counterpart_id, thread_id)
+    last = connection.execute(
+        select(Message.id, Message.timestamp).where(in_thread).order_by(Message.timestamp.desc(), Message.id.desc()).limit(1)
+    ).first()
+    if last is None:
+        return
+    unread = connection.execute(
+        select(func.count()).select_from(Message).where(
+            in_thread, Message.recipient_id == user_id, Message.is_read.isnot(True)
+        )
+    ).scalar()
+    if user_id == counterpart_id:
+        unread = 0
+    connection.execute(
+        insert(table),
+        {
+            "user_id": user_id, "counterpart_id": counterpart_id, "thread_id": thread_id,
+            "last_message_id": last.id, "last_message_at": last.timestamp, "unread_count": unread,
+        },
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_conversation_summaries(session, flush_context):
+    """
+    Keep ConversationSummary in step with Message, inside the same transaction.
+
+    New messages are added incrementally; rows touched by a deleted message
+    or a changed `is_read` are recomputed. Bulk UPDATE/DELETE statements
+    bypass this hook - see `mark_conversation_read`.
+    """
+    added: Dict[ThreadKey, dict] = {}
+    stale = set()
+    for obj in session.new:
+        if isinstance(obj, Message):
+            for key, unread in thread_keys(obj):
+                row = added.setdefault(key, {
+                    "user_id": key[0], "counterpart_id": key[1], "thread_id": key[2],
+                    "last_message_id": None, "last_message_at": None, "unread_count": 0,
+                })
+                if row["last_message_id"] is None or (obj.timestamp, obj.id) > (row["last_message_at"], row["last_message_id"]):
+                    row["last_message_id"], row["last_message_at"] = obj.id, obj.timestamp
+                row["unread_count"] += unread
+    for obj in session.deleted:
+        if isinstance(obj, Message):
+            stale.update(key for key, _ in thread_keys(obj))
+    for obj in session.dirty:
+        if isinstance(obj, Message) and obj not in session.deleted:
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in SUMMARY_FIELDS):
+                # Before the change the message may have belonged to other rows
+                stale.update(key for key, _ in thread_keys(obj))
+                stale.update(key for key, _ in thread_keys(_previous(state)))
+    if not added and not stale:
+        return
+    connection = session.connection()
+    if added:
+        _add_messages(connection, list(added.values()))
+    for key in stale:
+        _recompute(connection, key)
+
+
+def _previous(state) -> SimpleNamespace:
+    """Values of a modified message before the flush."""
+    values = {}
+    for field in SUMMARY_FIELDS:
+        history = state.attrs[field].history
+        values[field] = history.deleted[0] if history.deleted else getattr(state.obj(), field)
+    return SimpleNamespace(**values)
+
+
+def mark_conversation_read(db: Session, user_id: int, counterpart_id: int, project_id: Optional[int] = None) -> int:
+    """
+    Mark every message `counterpart_id` sent to `user_id` as read, optionally
+    in one project thread only; returns the number of messages updated.
+    """
+    updated = db.execute(
+        update(Message)
+        .where(
+            _thread_filter(user_id, counterpart_id, project_id),
+            Message.recipient_id == user_id,
+            Message.is_read.isnot(True),
+        )
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    summary = ConversationSummary.__table__
+    rows = update(summary).where(summary.c.user_id == user_id, summary.c.counterpart_id == counterpart_id)
+    if project_id is not None:
+        rows = rows.where(summary.c.thread_id == project_id)
+    db.execute(rows.values(unread_count=0))
+    db.commit()
+    return updated
+
+
+def rebuild_conversation_summaries(db: Session, batch_size: int = 1000) -> int:
+    """Recreate every inbox row from the messages; returns the number of rows."""
+    db.execute(delete(ConversationSummary))
+    summaries: Dict[ThreadKey, dict] = {}
+    messages = select(
+        Message.id, Message.sender_id, Message.recipient_id, Message.project_id, Message.timestamp, Message.is_read
+    ).order_by(Message.timestamp, Message.id)
+    for message in db.execute(messages.execution_options(yield_per=batch_size)):
+        for key, unread in thread_keys(message):
+            row = summaries.setdefault(key, {
+                "user_id": key[0], "counterpart_id": key[1], "thread_id": key[2], "unread_count": 0,
+            })
+            row["last_message_id"], row["last_message_at"] = message.id, message.timestamp
+            row["unread_count"] += unread
+    rows = list(summaries.values())
+    for start in range(0, len(rows), batch_size):
+        db.execute(insert(ConversationSummary), rows[start:start + batch_size])
+    db.commit()
+    return len(rows)
@@ -0,0 +1,144 @@
+import hashlib
+import os
+import re
+from typing import AsyncIterator, Optional, Set, Tuple
+
+import anyio
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Content hashes of files whose name does not carry one (legacy uploads,
+# derivatives), keyed by path, mtime and size so a rewrite changes the ETag.
+_etag_cache = TTLCache(ttl=24 * 3600, maxsize=4096)
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(settings.UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def content_etag(path: str, stat: os.stat_result, sha256: Optional[str] = None) -> str:
+    """Strong ETag from the content hash; hashed once per file version if not known."""
+    if sha256 is None:
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        sha256 = _etag_cache.get(key)
+        if sha256 is None:
+            sha256 = await anyio.to_thread.run_sync(hash_file, path)
+            _etag_cache.set(key, sha256)
+    return f'"{sha256}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def accepted_encodings(header: Optional[str]) -> Set[str]:
+    """Content codings from Accept-Encoding, without the ones refused with q=0."""
+    accepted = set()
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    if "*" in accepted:
+        accepted.update(("br", "gzip"))
+    return accepted
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) inclusive for a single `bytes=` range, None to serve the
+    whole file (no/unsupported/multi-range header). Raises ValueError when
+    the range cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = RANGE_PATTERN.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("range not satisfiable")
+    return start, end
+
+
+async def iter_file(path: str, start: int, length: int) -> AsyncIterator[bytes]:
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(start)
+        while length > 0:
+            chunk = await f.read(min(settings.UPLOAD_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+async def cached_file_response(
+    request: Request,
+    path: str,
+    stat: os.stat_result,
+    etag: str,
+    media_type: str,
+    cache_control: str = IMMUTABLE,
+    extra_headers: Optional[dict] = None,
+) -> Response:
+    """
+    Serve a file with validators: 304 for a matching If-None-Match,
+    206 for a single byte range (honouring If-Range), 416 for ranges
+    outside the file, otherwise the whole file streamed in chunks.
+    """
+    size = stat.st_size
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Accept-Ranges": "bytes", **(extra_headers or {})}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range.strip() != etag:
+        range_header = None  # Representation changed: send it whole
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    status_code = 200
+    start, end = 0, size - 1
+    if byte_range is not None:
+        start, end = byte_range
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    length = end - start + 1 if size else 0
+    headers["Content-Length"] = str(length)
+    if request.method == "HEAD":
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+    return StreamingResponse(iter_file(path, start, length), status_code=status_code, headers=headers, media_type=media_type)
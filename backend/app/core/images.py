@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import posixpath
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from app.core import storage
+from app.core.config import settings
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; without it only originals are served
+    Image = None
+
+# Longest edge in pixels per variant; originals smaller than that are only re-encoded
+DERIVATIVE_SIZES = {"thumb": 320, "medium": 960, "large": 1920}
+DERIVATIVE_FORMATS = {"webp": "WEBP", "jpeg": "JPEG"}
+DERIVED_DIR = "derived"
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def derivatives_enabled() -> bool:
+    return Image is not None and settings.IMAGE_DERIVATIVES
+
+
+def derivative_relpath(source_rel: str, variant: str, fmt: str) -> str:
+    """derived/<source path without extension>_<variant>.<fmt>, sharded like the source."""
+    stem = posixpath.splitext(source_rel)[0]
+    return f"{DERIVED_DIR}/{stem}_{variant}.{fmt}"
+
+
+def derivative_source_stem(rel: str) -> Optional[str]:
+    """Source path stem a derived file was made from (used by the upload GC)."""
+    if not rel.startswith(f"{DERIVED_DIR}/"):
+        return None
+    stem = posixpath.splitext(rel[len(DERIVED_DIR) + 1:])[0]
+    for variant in DERIVATIVE_SIZES:
+        if stem.endswith(f"_{variant}"):
+            return stem[: -len(variant) - 1]
+    return None
+
+
+def derivative_url(source_rel: str, variant: str, fmt: str = "webp") -> str:
+    return f"{settings.API_V1_STR}/upload/derivatives/{variant}/{source_rel}?format={fmt}"
+
+
+def derivative_urls(source_rel: str) -> Dict[str, Dict[str, str]]:
+    """Variant URLs for the upload response: {variant: {format: url}}."""
+    return {
+        variant: {fmt: derivative_url(source_rel, variant, fmt) for fmt in DERIVATIVE_FORMATS}
+        for variant in DERIVATIVE_SIZES
+    }
+
+
+def render_derivatives(source_path: str, targets: List[tuple]) -> List[str]:
+    """
+    Decode the source once and write each (variant, fmt, destination).
+    Runs in a worker process; writes go through a temp file and os.replace.
+    """
+    written = []
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original)
+        for variant, fmt, destination in targets:
+            size = DERIVATIVE_SIZES[variant]
+            resized = image.copy()
+            resized.thumbnail((size, size), Image.LANCZOS)
+            if fmt == "jpeg" and resized.mode not in ("RGB", "L"):
+                resized = resized.convert("RGB")
+            elif resized.mode not in ("RGB", "RGBA", "L"):
+                resized = resized.convert("RGBA" if "A" in resized.getbands() else "RGB")
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            tmp = f"{destination}.{uuid.uuid4().hex}.part"
+            resized.save(tmp, DERIVATIVE_FORMATS[fmt], quality=settings.IMAGE_QUALITY, optimize=fmt == "jpeg")
+            os.replace(tmp, destination)
+            written.append(destination)
+    return written
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: forking the threaded server process is not safe
+        _pool = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def generate_derivatives(source_rel: str, variants=None, formats=None, force: bool = False) -> List[str]:
+    """
+    Render missing derivatives of an upload in the image process pool,
+    off the event loop and off the request threadpool.
+    """
+    if not derivatives_enabled():
+        return []
+    targets = []
+    for variant in variants or DERIVATIVE_SIZES:
+        for fmt in formats or DERIVATIVE_FORMATS:
+            destination = storage.upload_path(derivative_relpath(source_rel, variant, fmt))
+            if force or not os.path.exists(destination):
+                targets.append((variant, fmt, destination))
+    if not targets:
+        return []
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pool(), render_derivatives, storage.upload_path(source_rel), targets)
+
+
+async def prerender_derivatives(source_rel: str) -> None:
+    """Background task after an image upload; failures only mean on-demand rendering later."""
+    try:
+        await generate_derivatives(source_rel)
+    except Exception:
+        logger.exception("Rendering derivatives of %s failed", source_rel)
@@ -0,0 +1,78 @@
+import base64
+import datetime
+import json
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, Response
+from pydantic_core import to_jsonable_python
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Keyset:
+    """
+    Sort key of a list endpoint, for cursor (keyset) pagination.
+
+    Pages are selected with `WHERE (sort key) > (last row's key)` over an
+    indexed key instead of OFFSET, so deep pages cost the same as the first
+    and rows inserted meanwhile don't shift or repeat entries. The last
+    column must be unique (usually the primary key) to break ties.
+
+    Clients pass the opaque cursor from the `X-Next-Cursor` header of the
+    previous page as `cursor`; `skip`/`limit` keep working as before.
+    """
+
+    def __init__(self, *columns, descending: bool = False):
+        self.columns = columns
+        self.descending = descending
+
+    def encode(self, row: Any) -> str:
+        values = [getattr(row, column.key) for column in self.columns]
+        payload = json.dumps(to_jsonable_python(values), separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> List[Any]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError("cursor does not match the sort key")
+            return [_coerce(column, value) for column, value in zip(self.columns, values)]
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    def paginate(self, query, cursor: Optional[str], skip: int, limit: int):
+        """Order `query` (a Select or Query) by the key and select the page; `cursor` replaces `skip`."""
+        order = [column.desc() if self.descending else column for column in self.columns]
+        query = query.order_by(*order)
+        if cursor:
+            values = self.decode(cursor)
+            key = self.columns[0] if len(self.columns) == 1 else tuple_(*self.columns)
+            bound = values[0] if len(self.columns) == 1 else tuple_(*values)
+            query = query.where(key < bound if self.descending else key > bound)
+        elif skip:
+            query = query.offset(skip)
+        # One extra row tells whether there is a next page
+        return query.limit(limit + 1)
+
+    def page(self, rows: Sequence[Any], limit: int, response: Response) -> List[Any]:
+        """Trim the extra row and announce the next cursor in the response headers."""
+        rows = list(rows)
+        if len(rows) > limit:
+            rows = rows[:limit]
+            if rows:
+                response.headers[NEXT_CURSOR_HEADER] = self.encode(rows[-1])
+        return rows
+
+
+def _coerce(column, value):
+    python_type = column.type.python_type
+    if value is None:
+        return None
+    if python_type is datetime.datetime:
+        return datetime.datetime.fromisoformat(value)
+    if python_type is datetime.date:
+        return datetime.date.fromisoformat(value)
+    if not isinstance(value, python_type):
+        return python_type(value)
+    return value
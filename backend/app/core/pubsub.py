@@ -0,0 +1,202 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is optional; only needed for PUSH_BACKEND=redis
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """Events for one connected client; `get()` returns None once the client fell behind."""
+
+    def __init__(self, channels: Iterable[str], maxsize: int):
+        self.channels = set(channels)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def put(self, data: str) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            # A client this far behind reconnects and catches up over the REST API
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def get(self) -> Optional[str]:
+        return await self.queue.get()
+
+
+class MemoryBackend:
+    """Fan-out within this process only (single worker)."""
+
+    async def start(self, deliver: Callable[[str, str], None]) -> None:
+        self.deliver = deliver
+
+    async def publish(self, channel: str, data: str) -> None:
+        self.deliver(channel, data)
+
+    async def stop(self) -> None:
+        pass
+
+
+class RedisBackend:
+    """
+    Fan-out across workers and hosts through Redis PUBLISH/PSUBSCRIBE.
+    Every worker receives every event and delivers it to its own clients.
+    """
+
+    def __init__(self, url: str, prefix: str = "push:"):
+        if aioredis is None:
+            raise RuntimeError("PUSH_BACKEND=redis requires the redis package")
+        self.url = url
+        self.prefix = prefix
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, deliver: Callable[[str, str], None]) -> None:
+        self.redis = aioredis.from_url(self.url, decode_responses=True)
+        self.pubsub = self.redis.pubsub()
+        await self.pubsub.psubscribe(f"{self.prefix}*")
+        self._task = asyncio.create_task(self._listen(deliver))
+
+    async def _listen(self, deliver) -> None:
+        async for message in self.pubsub.listen():
+            if message["type"] == "pmessage":
+                deliver(message["channel"][len(self.prefix):], message["data"])
+
+    async def publish(self, channel: str, data: str) -> None:
+        await self.redis.publish(f"{self.prefix}{channel}", data)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        await self.pubsub.aclose()
+        await self.redis.aclose()
+
+
+class Hub:
+    """
+    In-process pub/sub for pushing events to WebSocket and SSE clients.
+
+    Each event is serialized once and handed to every subscription of its
+    channel. Delivery always happens on the event loop; `publish_threadsafe`
+    can be called from the sync endpoints' worker threads. The backend
+    decides how far events travel (this process, or all workers via Redis).
+    """
+
+    def __init__(self, backend=None, queue_size: int = 256):
+        self.backend = backend or MemoryBackend()
+        self.queue_size = queue_size
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._channels: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._started = False
+
+    async def start(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        await self.backend.start(self._deliver)
+        self._started = True
+
+    async def stop(self) -> None:
+        if self._started:
+            await self.backend.stop()
+            self._started = False
+
+    async def subscribe(self, channels: Iterable[str]) -> Subscription:
+        if not self._started or self.loop.is_closed():
+            await self.start()  # Memory backend without a startup event (tests, scripts)
+        subscription = Subscription(channels, self.queue_size)
+        for channel in subscription.channels:
+            self._channels[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for channel in subscription.channels:
+            subscribers = self._channels.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[channel]
+
+    def _deliver(self, channel: str, data: str) -> None:
+        for subscription in list(self._channels.get(channel, ())):
+            subscription.put(data)
+
+    async def publish(self, channel: str, payload: dict) -> None:
+        if self._started:
+            await self.backend.publish(channel, json.dumps(to_jsonable_python(payload)))
+
+    def publish_threadsafe(self, channel: str, payload: dict) -> None:
+        """Publish from any thread; a no-op until the hub has been started."""
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            return
+        data = json.dumps(to_jsonable_python(payload))
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            loop.create_task(self.backend.publish(channel, data))
+        else:
+            asyncio.run_coroutine_threadsafe(self.backend.publish(channel, data), loop)
+
+
+def create_hub() -> Hub:
+    if settings.PUSH_BACKEND == "redis":
+        backend = RedisBackend(settings.PUSH_REDIS_URL)
+    elif settings.PUSH_BACKEND == "memory":
+        backend = MemoryBackend()
+    else:
+        raise ValueError(f"Unknown PUSH_BACKEND: {settings.PUSH_BACKEND}")
+    return Hub(backend, queue_size=settings.PUSH_QUEUE_SIZE)
+
+
+hub = create_hub()
+
+# model -> function returning the (channel, payload) events for a new row
+_publishers: List[Tuple[Type, Callable]] = []
+
+
+def publish_on_commit(model: Type, events: Callable) -> None:
+    """Push `events(obj)` for every new `model` row once its transaction commits."""
+    _publishers.append((model, events))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_events(session, flush_context):
+    if not _publishers:
+        return
+    pending = session.info.setdefault("push_events", [])
+    for obj in session.new:
+        for model, events in _publishers:
+            if isinstance(obj, model):
+                pending.extend(events(obj))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_events(session):
+    for channel, payload in session.info.pop("push_events", ()):
+        try:
+            hub.publish_threadsafe(channel, payload)
+        except Exception:
+            logger.exception("Publishing to %s failed", channel)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_events(session):
+    session.info.pop("push_events", None)
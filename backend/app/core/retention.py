@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.conversation import ConversationSummary
+from app.models.message import Message, MessageArchive
+from app.models.project import Projekt, ProjectStatus
+
+logger = logging.getLogger(__name__)
+
+# Columns copied into the archive (everything but archived_at)
+ARCHIVED_COLUMNS = ["id", "sender_id", "recipient_id", "project_id", "content", "timestamp", "is_read"]
+
+
+@dataclass
+class ArchiveReport:
+    archived: int = 0
+    retention_days: int = 0
+    closed_projects: bool = False
+    dry_run: bool = False
+
+    def summary(self) -> str:
+        rules = []
+        if self.retention_days > 0:
+            rules.append(f"older than {self.retention_days} days")
+        if self.closed_projects:
+            rules.append(f"of projects in {ProjectStatus.ABGESCHLOSSEN.value}")
+        action = "would archive" if self.dry_run else "archived"
+        return f"{action} {self.archived} messages ({' or '.join(rules) or 'no retention rule enabled'})"
+
+
+def archive_candidates(retention_days: int, closed_projects: bool):
+    """Ids of hot messages the retention policy moves out, oldest first (None if no rule applies)."""
+    conditions = []
+    if retention_days > 0:
+        # Stored as naive UTC (CURRENT_TIMESTAMP)
+        conditions.append(Message.timestamp < datetime.utcnow() - timedelta(days=retention_days))
+    if closed_projects:
+        closed = select(Projekt.id).where(Projekt.status == ProjectStatus.ABGESCHLOSSEN)
+        conditions.append(Message.project_id.in_(closed))
+    if not conditions:
+        return None
+    # Inbox rows point at their last message, so those stay in the hot table
+    kept = select(ConversationSummary.last_message_id).where(ConversationSummary.last_message_id.isnot(None))
+    return select(Message.id).where(or_(*conditions), Message.id.notin_(kept)).order_by(Message.id)
+
+
+def archive_messages(
+    db: Session,
+    retention_days: Optional[int] = None,
+    closed_projects: Optional[bool] = None,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+) -> ArchiveReport:
+    """
+    Move messages covered by the retention policy into `messagearchive`.
+
+    Works in batches of `batch_size`, each copied and deleted in its own
+    transaction, so the hot table is never locked for long. Archived
+    messages stay readable through the conversation endpoints.
+    """
+    report = ArchiveReport(
+        retention_days=settings.MESSAGE_RETENTION_DAYS if retention_days is None else retention_days,
+        closed_projects=settings.MESSAGE_ARCHIVE_CLOSED_PROJECTS if closed_projects is None else closed_projects,
+        dry_run=dry_run,
+    )
+    candidates = archive_candidates(report.retention_days, report.closed_projects)
+    if candidates is None:
+        return report
+    if dry_run:
+        report.archived = db.execute(select(func.count()).select_from(candidates.subquery())).scalar()
+        return report
+
+    columns = [getattr(Message, name) for name in ARCHIVED_COLUMNS]
+    while True:
+        ids = db.execute(candidates.limit(batch_size)).scalars().all()
+        if not ids:
+            break
+        # Bulk statements: the summary hooks must not see these as deletions
+        db.execute(insert(MessageArchive).from_select(ARCHIVED_COLUMNS, select(*columns).where(Message.id.in_(ids))))
+        db.execute(delete(Message).where(Message.id.in_(ids)))
+        db.commit()
+        report.archived += len(ids)
+    return report
+
+
+async def run_periodic_archive(session_factory, interval_hours: float) -> None:
+    """In-process archiving loop for single-instance deployments (see MESSAGE_ARCHIVE_INTERVAL_HOURS)."""
+    def _run():
+        db = session_factory()
+        try:
+            return archive_messages(db)
+        finally:
+            db.close()
+
+    while True:
+        await asyncio.sleep(interval_hours * 3600)
+        try:
+            report = await run_in_threadpool(_run)
+            logger.info("Message archive: %s", report.summary())
+        except Exception:
+            logger.exception("Message archiving failed")
@@ -1,10 +1,26 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from typing import Any, Union, Optional, Tuple
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes created with a different cost are reported by verify_and_update so
+# they can be re-hashed transparently on the next successful login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_desired_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_desired_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt releases the GIL, so a small dedicated pool runs hashes in parallel
+# without holding one of the request threadpool's tokens for ~200ms each.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
 
 ALGORITHM = "HS256"
 
@@ -23,3 +39,21 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+async def _run_hash(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, func, *args)
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify on the password executor. Returns (verified, new_hash); new_hash
+    is set when the stored hash uses outdated parameters and should be replaced.
+    """
+    return await _run_hash(pwd_context.verify_and_update, plain_password, hashed_password)
+
+async def dummy_verify_password() -> None:
+    """Spend the same time as a real verification (for unknown users)."""
+    await _run_hash(pwd_context.dummy_verify)
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_hash(pwd_context.hash, password)
@@ -0,0 +1,95 @@
+import datetime
+import enum
+import types
+import typing
+from typing import Any, List, Optional, Sequence, Type, Union
+
+from fastapi import Response
+from pydantic import BaseModel, EmailStr, TypeAdapter
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; pydantic-core's encoder is used without it
+    orjson = None
+
+# Leaf types orjson encodes exactly like pydantic's JSON mode
+_PLAIN_TYPES = (str, int, float, bool, type(None), datetime.date, datetime.datetime, EmailStr, Any)
+
+
+def _is_plain(annotation) -> bool:
+    """True for scalars, Optional scalars and JSON containers of them (no nested models)."""
+    if annotation in _PLAIN_TYPES:
+        return True
+    if isinstance(annotation, type):
+        if issubclass(annotation, (BaseModel, enum.Enum)):
+            return False
+        return issubclass(annotation, (str, int, float))
+    origin = typing.get_origin(annotation)
+    if origin in (Union, types.UnionType, list, dict, typing.Annotated):
+        args = typing.get_args(annotation)
+        if origin is typing.Annotated:
+            args = args[:1]
+        return all(_is_plain(arg) for arg in args)
+    return False
+
+
+def _is_flat(schema: Type[BaseModel]) -> bool:
+    decorators = schema.__pydantic_decorators__
+    if any((decorators.validators, decorators.field_validators, decorators.model_validators,
+            decorators.field_serializers, decorators.model_serializers, decorators.computed_fields)):
+        return False
+    return all(
+        field.alias is None and field.serialization_alias is None and _is_plain(field.annotation)
+        for field in schema.model_fields.values()
+    )
+
+
+class ListSerializer:
+    """
+    JSON body of a list endpoint, compiled once per response schema.
+
+    FastAPI's default path validates every returned ORM row against the
+    `response_model`, converts the result to plain Python and runs it
+    through the stdlib encoder. Here a precompiled TypeAdapter validates
+    the rows straight from their attributes and pydantic-core writes the
+    JSON in one pass; returning a Response also skips FastAPI's own
+    (second) validation. The route keeps its `response_model` for OpenAPI.
+
+    With TRUST_ORM_OUTPUT, schemas without nested models, validators or
+    aliases skip validation altogether: the schema's attributes are read off
+    the rows and encoded with orjson.
+    """
+
+    def __init__(self, schema: Type[BaseModel]):
+        self.schema = schema
+        self.adapter = TypeAdapter(List[schema])
+        self.fields = tuple(schema.model_fields)
+        self.flat = _is_flat(schema)
+
+    def validated_json(self, rows: Sequence[Any]) -> bytes:
+        return self.adapter.dump_json(self.adapter.validate_python(rows, from_attributes=True))
+
+    def trusted_json(self, rows: Sequence[Any]) -> bytes:
+        fields = self.fields
+        return orjson.dumps(
+            [{name: getattr(row, name) for name in fields} for row in rows],
+            option=orjson.OPT_UTC_Z,
+        )
+
+    def to_json(self, rows: Sequence[Any]) -> bytes:
+        if settings.TRUST_ORM_OUTPUT and self.flat and orjson is not None:
+            return self.trusted_json(rows)
+        return self.validated_json(rows)
+
+    def response(self, rows: Sequence[Any], response: Optional[Response] = None) -> Any:
+        """
+        Response for the endpoint to return (the rows themselves when
+        FAST_JSON_RESPONSES is off). Headers set on the endpoint's injected
+        `response` are carried over.
+        """
+        if not settings.FAST_JSON_RESPONSES:
+            return rows
+        headers = dict(response.headers) if response is not None else None
+        return Response(content=self.to_json(rows), media_type="application/json", headers=headers)
@@ -0,0 +1,112 @@
+import gzip
+import mimetypes
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from fastapi import HTTPException, Request, Response
+
+from app.core.file_responses import IMMUTABLE, accepted_encodings, cached_file_response, etag_matches, hash_file
+
+# Vite puts content-hashed bundles under assets/; everything else may change between deploys
+HASHED_DIR = "assets/"
+REVALIDATE = "no-cache"
+ROOT_FILE_CACHE = "public, max-age=3600"
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+@dataclass
+class StaticEntry:
+    path: str
+    stat: os.stat_result
+    etag: str
+    media_type: str
+    # Content-Encoding -> (path, stat) of the precompressed sibling
+    encoded: Dict[str, tuple] = field(default_factory=dict)
+
+
+class SpaManifest:
+    """
+    In-memory index of the frontend build, created once at startup.
+
+    Requests are answered from the index: no exists/isfile checks per
+    request, and the SPA fallback (index.html) is served from memory.
+    Rebuild the manifest (restart) after deploying a new build.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.files: Dict[str, StaticEntry] = {}
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                if name.endswith((".br", ".gz")) and os.path.splitext(name)[0] in filenames:
+                    continue  # Precompressed sibling, attached to its original below
+                path = os.path.join(dirpath, name)
+                rel = os.path.relpath(path, root).replace(os.sep, "/")
+                self.files[rel] = self._entry(path)
+
+        index = self.files.get("index.html")
+        self.index_html: Optional[bytes] = None
+        self.index_variants: Dict[str, bytes] = {}
+        if index is not None:
+            with open(index.path, "rb") as f:
+                self.index_html = f.read()
+            for encoding, (path, _) in index.encoded.items():
+                with open(path, "rb") as f:
+                    self.index_variants[encoding] = f.read()
+            self.index_variants.setdefault("gzip", gzip.compress(self.index_html, 9))
+            self.index_etag = index.etag
+
+    def _entry(self, path: str) -> StaticEntry:
+        entry = StaticEntry(
+            path=path,
+            stat=os.stat(path),
+            etag=f'"{hash_file(path)}"',
+            media_type=mimetypes.guess_type(path)[0] or "application/octet-stream",
+        )
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            if os.path.isfile(path + suffix):
+                entry.encoded[encoding] = (path + suffix, os.stat(path + suffix))
+        return entry
+
+    async def serve(self, request: Request, full_path: str) -> Response:
+        entry = self.files.get(full_path)
+        if entry is not None and full_path != "index.html":
+            cache_control = IMMUTABLE if full_path.startswith(HASHED_DIR) else ROOT_FILE_CACHE
+            return await self._serve_file(request, entry, cache_control)
+        if full_path.startswith(HASHED_DIR):
+            raise HTTPException(status_code=404, detail="Not Found")  # Missing bundle: don't answer with HTML
+        return self._serve_index(request)
+
+    async def _serve_file(self, request: Request, entry: StaticEntry, cache_control: str) -> Response:
+        headers = {"Vary": "Accept-Encoding"} if entry.encoded else {}
+        accepted = accepted_encodings(request.headers.get("accept-encoding"))
+        for encoding in ENCODING_SUFFIXES:
+            if encoding in entry.encoded and encoding in accepted:
+                path, stat = entry.encoded[encoding]
+                etag = f'{entry.etag[:-1]}-{encoding}"'
+                return await cached_file_response(
+                    request, path, stat, etag, entry.media_type, cache_control,
+                    {**headers, "Content-Encoding": encoding},
+                )
+        return await cached_file_response(request, entry.path, entry.stat, entry.etag, entry.media_type, cache_control, headers)
+
+    def _serve_index(self, request: Request) -> Response:
+        if self.index_html is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+        headers = {"Cache-Control": REVALIDATE, "Vary": "Accept-Encoding"}
+        accepted = accepted_encodings(request.headers.get("accept-encoding"))
+        body, etag = self.index_html, self.index_etag
+        for encoding in ENCODING_SUFFIXES:
+            if encoding in self.index_variants and encoding in accepted:
+                body = self.index_variants[encoding]
+                etag = f'{self.index_etag[:-1]}-{encoding}"'
+                headers["Content-Encoding"] = encoding
+                break
+        headers["ETag"] = etag
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+        if request.method == "HEAD":
+            return Response(headers={**headers, "Content-Length": str(len(body))}, media_type="text/html")
+        return Response(content=body, headers=headers, media_type="text/html")
@@ -0,0 +1,204 @@
+import hashlib
+import os
+import posixpath
+import re
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+import anyio
+from fastapi import HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.upload import UploadBlob
+
+# backend/static/uploads, served under /assets/uploads
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+UPLOAD_DIR = os.path.join(BASE_DIR, "static", "uploads")
+UPLOAD_URL_PREFIX = "/assets/uploads/"
+# In-progress writes live next to the final files so os.replace stays on one filesystem
+TMP_DIR = os.path.join(UPLOAD_DIR, ".tmp")
+EXTENSION_PATTERN = re.compile(r"^\.[a-z0-9]{1,10}$")
+BLOB_NAME_PATTERN = re.compile(r"^([0-9a-f]{64})(\.[a-z0-9]{1,10})?$")
+
+
+@dataclass
+class StoredFile:
+    path: str
+    size: int
+    sha256: str
+
+
+def too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413, detail=f"File exceeds the maximum upload size of {settings.MAX_UPLOAD_SIZE} bytes"
+    )
+
+
+def check_content_length(request: Request) -> None:
+    """
+    Dependency rejecting uploads whose declared size is already over the
+    limit, before the multipart body is read.
+    """
+    length = request.headers.get("content-length")
+    if length and length.isdigit() and int(length) > settings.MAX_UPLOAD_SIZE:
+        raise too_large()
+
+
+async def _fsync_and_close(handle) -> None:
+    await handle.flush()
+    await anyio.to_thread.run_sync(os.fsync, handle.wrapped.fileno())
+    await handle.aclose()
+
+
+async def receive_upload(file: UploadFile, max_size: Optional[int] = None) -> StoredFile:
+    """
+    Copy `file` into a temporary file under TMP_DIR in UPLOAD_CHUNK_SIZE
+    chunks without blocking the event loop, hashing as it goes.
+
+    The returned file is fsynced; the caller moves it into place with
+    `place_file` or removes it with `discard_file`. Exceeding `max_size`
+    (default MAX_UPLOAD_SIZE) aborts with 413 and leaves nothing behind.
+    """
+    max_size = settings.MAX_UPLOAD_SIZE if max_size is None else max_size
+    os.makedirs(TMP_DIR, exist_ok=True)
+    tmp_path = os.path.join(TMP_DIR, f"{uuid.uuid4().hex}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        handle = await anyio.open_file(tmp_path, "wb")
+        try:
+            while chunk := await file.read(settings.UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise too_large()
+                digest.update(chunk)
+                await handle.write(chunk)
+        except BaseException:
+            await handle.aclose()
+            raise
+        await _fsync_and_close(handle)
+    except BaseException:
+        await discard_file(tmp_path)
+        raise
+    return StoredFile(path=tmp_path, size=size, sha256=digest.hexdigest())
+
+
+async def place_file(tmp_path: str, destination: str) -> None:
+    """Atomically rename a received file into place, creating parent directories."""
+    def _place():
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        os.replace(tmp_path, destination)
+    await anyio.to_thread.run_sync(_place)
+
+
+async def discard_file(path: str) -> None:
+    await anyio.to_thread.run_sync(remove_file, path)
+
+
+async def stream_to_disk(file: UploadFile, destination: str, max_size: Optional[int] = None) -> StoredFile:
+    """Receive `file` and atomically place it at `destination`; readers never see a partial file."""
+    stored = await receive_upload(file, max_size)
+    try:
+        await place_file(stored.path, destination)
+    except BaseException:
+        await discard_file(stored.path)
+        raise
+    stored.path = destination
+    return stored
+
+
+def normalize_extension(filename: Optional[str]) -> str:
+    ext = os.path.splitext(filename or "")[1].lower()
+    return ext if EXTENSION_PATTERN.match(ext) else ""
+
+
+def blob_relpath(sha256: str, ext: str = "") -> str:
+    """Sharded location of a blob: ab/cd/<sha256><ext> (at most 65536 directories, few files each)."""
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}{ext}"
+
+
+def upload_url(relpath: str) -> str:
+    return f"{UPLOAD_URL_PREFIX}{relpath}"
+
+
+def upload_path(relpath: str) -> str:
+    return os.path.join(UPLOAD_DIR, *relpath.split("/"))
+
+
+def sha256_from_url(url: Optional[str]) -> Optional[str]:
+    """Content hash of a content-addressed upload URL, None for anything else (e.g. legacy uuid files)."""
+    if not isinstance(url, str) or not url.startswith(UPLOAD_URL_PREFIX):
+        return None
+    match = BLOB_NAME_PATTERN.match(url.rsplit("/", 1)[-1])
+    return match.group(1) if match else None
+
+
+def resolve_relpath(path: str) -> Optional[str]:
+    """Validate a client-supplied path below UPLOAD_DIR; None for traversal or hidden entries."""
+    rel = posixpath.normpath(path.lstrip("/"))
+    parts = rel.split("/")
+    if rel in ("", ".") or any(part in ("", "..") or part.startswith(".") for part in parts):
+        return None
+    return rel
+
+
+async def save_upload(file: UploadFile, db: Session) -> dict:
+    """Receive an upload and store it in the content-addressed store; returns its public URL."""
+    stored = await receive_upload(file)
+    return await store_blob(stored, file.filename, file.content_type, db)
+
+
+async def store_blob(stored: StoredFile, filename: Optional[str], content_type: Optional[str], db: Session) -> dict:
+    """
+    Move a received file into the content-addressed store.
+
+    Identical content maps to one blob: if the blob already exists the
+    received copy is dropped and the existing URL returned.
+    """
+    try:
+        blob = await run_in_threadpool(
+            register_blob, db, stored.sha256, blob_relpath(stored.sha256, normalize_extension(filename)),
+            stored.size, content_type,
+        )
+        destination = upload_path(blob.path)
+        if await anyio.to_thread.run_sync(os.path.exists, destination):
+            await discard_file(stored.path)
+            # Fresh mtime keeps a re-used blob out of the GC grace window
+            await anyio.to_thread.run_sync(os.utime, destination)
+        else:
+            await place_file(stored.path, destination)
+    except BaseException:
+        await discard_file(stored.path)
+        raise
+    return {"url": upload_url(blob.path), "path": blob.path, "size": stored.size, "sha256": stored.sha256}
+
+
+def register_blob(db: Session, sha256: str, relpath: str, size: int, content_type: Optional[str]) -> UploadBlob:
+    """Insert the blob row unless the content is already known; returns the stored row."""
+    values = {"sha256": sha256, "path": relpath, "size": size, "content_type": content_type}
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        db.execute(sqlite_insert(UploadBlob).values(**values).on_conflict_do_nothing(index_elements=["sha256"]))
+    elif dialect == "postgresql":
+        db.execute(pg_insert(UploadBlob).values(**values).on_conflict_do_nothing(index_elements=["sha256"]))
+    else:
+        try:
+            with db.begin_nested():
+                db.add(UploadBlob(**values))
+        except IntegrityError:
+            pass  # Same content uploaded concurrently
+    db.commit()
+    return db.query(UploadBlob).filter(UploadBlob.sha256 == sha256).one()
+
+
+def remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
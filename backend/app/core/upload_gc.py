@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import os
+import posixpath
+import shutil
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Set, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.core import storage
+from app.core.config import settings
+from app.core.images import derivative_source_stem
+from app.core.upload_sessions import remove_expired_sessions
+from app.core.upload_refs import UPLOAD_URL_FIELDS, iter_urls
+from app.models.upload import UploadBlob
+
+logger = logging.getLogger(__name__)
+
+QUARANTINE_DIRNAME = ".trash"
+QUARANTINE_DATE_FORMAT = "%Y-%m-%d"
+
+
+@dataclass
+class GCReport:
+    scanned: int = 0
+    reachable: int = 0
+    removed: List[str] = field(default_factory=list)
+    reclaimed_bytes: int = 0
+    purged_bytes: int = 0
+    mode: str = "quarantine"
+    dry_run: bool = False
+
+    def summary(self) -> str:
+        action = "would remove" if self.dry_run else ("quarantined" if self.mode == "quarantine" else "deleted")
+        return (
+            f"Scanned {self.scanned} files, {self.reachable} referenced URLs; "
+            f"{action} {len(self.removed)} files ({self.reclaimed_bytes / 1024 / 1024:.1f} MiB), "
+            f"purged {self.purged_bytes / 1024 / 1024:.1f} MiB from quarantine and expired upload sessions"
+        )
+
+
+def collect_reachable(db: Session, batch_size: int = 1000) -> Set[str]:
+    """
+    Relative paths (below UPLOAD_DIR) of every upload some record points at.
+
+    Streams the URL columns in batches instead of loading whole models, and
+    covers legacy uuid-named files as well as content-addressed blobs.
+    """
+    prefix = storage.UPLOAD_URL_PREFIX
+    reachable = set()
+    for model, fields in UPLOAD_URL_FIELDS.items():
+        columns = [getattr(model, name) for name in fields]
+        for values in db.query(*columns).yield_per(batch_size):
+            for url in iter_urls(list(values)):
+                if url.startswith(prefix):
+                    reachable.add(url[len(prefix):].split("?", 1)[0])
+    return reachable
+
+
+def iter_upload_files(root: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield (relative path, stat) for every stored file, skipping temp and quarantine dirs."""
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            entries = list(os.scandir(os.path.join(root, rel_dir)))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.startswith(".") and not rel_dir:
+                    continue
+                stack.append(rel)
+            elif entry.is_file(follow_symlinks=False):
+                yield rel, entry.stat(follow_symlinks=False)
+
+
+def collect_garbage(
+    db: Session,
+    grace_hours: Optional[float] = None,
+    mode: str = "quarantine",
+    dry_run: bool = False,
+) -> GCReport:
+    """
+    Remove upload files no record references and that are older than the
+    grace period (so uploads not yet attached to a record survive).
+
+    `mode="quarantine"` moves them to uploads/.trash/<date>/, which is
+    purged after UPLOAD_GC_QUARANTINE_DAYS; `mode="delete"` unlinks them.
+    Blob rows of removed content-addressed files are dropped as well.
+    """
+    if mode not in ("quarantine", "delete"):
+        raise ValueError(f"Unknown GC mode: {mode}")
+    grace_hours = settings.UPLOAD_GC_GRACE_HOURS if grace_hours is None else grace_hours
+    root = storage.UPLOAD_DIR
+    report = GCReport(mode=mode, dry_run=dry_run)
+    cutoff = time.time() - grace_hours * 3600
+
+    reachable = collect_reachable(db)
+    report.reachable = len(reachable)
+    # Derivatives live as long as their source
+    reachable_stems = {posixpath.splitext(rel)[0] for rel in reachable}
+    trash_dir = os.path.join(root, QUARANTINE_DIRNAME, datetime.now().strftime(QUARANTINE_DATE_FORMAT))
+    removed_hashes = []
+    for rel, stat in iter_upload_files(root):
+        report.scanned += 1
+        if rel in reachable or stat.st_mtime > cutoff or derivative_source_stem(rel) in reachable_stems:
+            continue
+        report.removed.append(rel)
+        report.reclaimed_bytes += stat.st_size
+        sha = storage.sha256_from_url(storage.upload_url(rel))
+        if sha:
+            removed_hashes.append(sha)
+        if dry_run:
+            continue
+        path = storage.upload_path(rel)
+        if mode == "delete":
+            storage.remove_file(path)
+        else:
+            target = os.path.join(trash_dir, *rel.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(path, target)
+
+    if not dry_run:
+        for start in range(0, len(removed_hashes), 500):
+            db.execute(delete(UploadBlob).where(UploadBlob.sha256.in_(removed_hashes[start:start + 500])))
+        db.commit()
+        report.purged_bytes = purge_quarantine(root)
+        report.purged_bytes += remove_expired_sessions()
+        _remove_stale_parts(cutoff)
+    return report
+
+
+def purge_quarantine(root: str, days: Optional[int] = None) -> int:
+    """Delete quarantine folders older than `days`; returns the bytes freed."""
+    days = settings.UPLOAD_GC_QUARANTINE_DAYS if days is None else days
+    trash = os.path.join(root, QUARANTINE_DIRNAME)
+    if not os.path.isdir(trash):
+        return 0
+    cutoff = datetime.now() - timedelta(days=days)
+    freed = 0
+    for entry in os.scandir(trash):
+        try:
+            quarantined_on = datetime.strptime(entry.name, QUARANTINE_DATE_FORMAT)
+        except ValueError:
+            continue
+        if entry.is_dir() and quarantined_on < cutoff:
+            freed += sum(stat.st_size for _, stat in iter_upload_files(entry.path))
+            shutil.rmtree(entry.path, ignore_errors=True)
+    return freed
+
+
+def _remove_stale_parts(cutoff: float) -> None:
+    # Temp files of uploads that died mid-stream
+    if not os.path.isdir(storage.TMP_DIR):
+        return
+    for entry in os.scandir(storage.TMP_DIR):
+        if entry.is_file() and entry.stat().st_mtime < cutoff:
+            storage.remove_file(entry.path)
+
+
+async def run_periodic_gc(session_factory, interval_hours: float) -> None:
+    """In-process GC loop for single-instance deployments (see UPLOAD_GC_INTERVAL_HOURS)."""
+    def _run():
+        db = session_factory()
+        try:
+            return collect_garbage(db)
+        finally:
+            db.close()
+
+    while True:
+        await asyncio.sleep(interval_hours * 3600)
+        try:
+            report = await run_in_threadpool(_run)
+            logger.info("Upload GC: %s", report.summary())
+        except Exception:
+            logger.exception("Upload GC failed")
@@ -0,0 +1,111 @@
+from typing import Any, Dict, Iterator, List, Type
+
+from sqlalchemy import delete, event, insert, inspect
+from sqlalchemy.orm import Session
+
+from app.core.storage import sha256_from_url
+from app.models.category import Category
+from app.models.document import Document
+from app.models.note import Note
+from app.models.product import Product
+from app.models.project import Projekt
+from app.models.project_stage import ProjectStage
+from app.models.site_content import SiteContent
+from app.models.upload import UploadRef
+from app.models.user import User
+
+# Every column that can hold upload URLs: plain strings, lists of URLs or
+# lists of file objects ({name, url, type}).
+UPLOAD_URL_FIELDS: Dict[Type, List[str]] = {
+    Projekt: ["main_image", "photos", "files"],
+    ProjectStage: ["images"],
+    Document: ["file_url"],
+    Note: ["files"],
+    Category: ["image_url"],
+    Product: ["image_url"],
+    User: ["avatar_url"],
+    SiteContent: ["content"], # Homepage logo, hero images ... inside the JSON blob
+}
+
+
+def iter_urls(value: Any) -> Iterator[str]:
+    """Yield every string inside a column value (string, list or nested dicts)."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from iter_urls(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from iter_urls(item)
+
+
+def blob_hashes(value: Any) -> set:
+    return {sha for sha in map(sha256_from_url, iter_urls(value)) if sha}
+
+
+def _ref_rows(obj, fields: List[str]) -> List[dict]:
+    model = obj.__tablename__
+    return [
+        {"sha256": sha, "model": model, "record_id": obj.id, "field": field}
+        for field in fields
+        for sha in sorted(blob_hashes(getattr(obj, field)))
+    ]
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_upload_refs(session, flush_context):
+    """
+    Keep UploadRef in step with the URL columns, inside the same transaction.
+
+    Only fields whose value was reassigned are re-indexed; JSON lists
+    mutated in place are not tracked by SQLAlchemy and are picked up by
+    `rebuild_upload_refs`.
+    """
+    deletes = []
+    rows = []
+    for obj in session.deleted:
+        if type(obj) in UPLOAD_URL_FIELDS:
+            deletes.append((obj.__tablename__, obj.id, UPLOAD_URL_FIELDS[type(obj)]))
+    for obj in session.new:
+        fields = UPLOAD_URL_FIELDS.get(type(obj))
+        if fields:
+            rows += _ref_rows(obj, fields)
+    for obj in session.dirty:
+        fields = UPLOAD_URL_FIELDS.get(type(obj))
+        if not fields or obj in session.deleted:
+            continue
+        state = inspect(obj)
+        changed = [field for field in fields if state.attrs[field].history.has_changes()]
+        if changed:
+            deletes.append((obj.__tablename__, obj.id, changed))
+            rows += _ref_rows(obj, changed)
+    if not deletes and not rows:
+        return
+    connection = session.connection()
+    for model, record_id, fields in deletes:
+        connection.execute(
+            delete(UploadRef).where(
+                UploadRef.model == model, UploadRef.record_id == record_id, UploadRef.field.in_(fields)
+            )
+        )
+    if rows:
+        connection.execute(insert(UploadRef), rows)
+
+
+def rebuild_upload_refs(db: Session, batch_size: int = 1000) -> int:
+    """Recreate the whole reference index from the URL columns; returns the number of refs."""
+    db.execute(delete(UploadRef))
+    rows = []
+    for model, fields in UPLOAD_URL_FIELDS.items():
+        columns = [getattr(model, field) for field in fields]
+        for record_id, *values in db.query(model.id, *columns).yield_per(batch_size):
+            for field, value in zip(fields, values):
+                rows += [
+                    {"sha256": sha, "model": model.__tablename__, "record_id": record_id, "field": field}
+                    for sha in sorted(blob_hashes(value))
+                ]
+    for start in range(0, len(rows), batch_size):
+        db.execute(insert(UploadRef), rows[start:start + batch_size])
+    db.commit()
+    return len(rows)
@@ -0,0 +1,201 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from typing import AsyncIterator, Dict, Optional
+
+import anyio
+from fastapi import HTTPException
+
+from app.core import storage
+from app.core.config import settings
+
+# Resumable uploads: one directory per session holding meta.json and the
+# received bytes (data.part). Everything is on disk, so memory use does not
+# depend on the file size and sessions survive a restart.
+SESSIONS_DIRNAME = ".sessions"
+SESSION_ID_LENGTH = 32
+
+_locks: Dict[str, asyncio.Lock] = {}
+
+
+def sessions_dir() -> str:
+    return os.path.join(storage.UPLOAD_DIR, SESSIONS_DIRNAME)
+
+
+def _session_dir(session_id: str) -> str:
+    if len(session_id) != SESSION_ID_LENGTH or not all(c in "0123456789abcdef" for c in session_id):
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return os.path.join(sessions_dir(), session_id)
+
+
+def _data_path(session_id: str) -> str:
+    return os.path.join(_session_dir(session_id), "data.part")
+
+
+def _write_meta(session_id: str, meta: dict) -> None:
+    path = os.path.join(_session_dir(session_id), "meta.json")
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp, path)
+
+
+def _read_meta(session_id: str) -> dict:
+    try:
+        with open(os.path.join(_session_dir(session_id), "meta.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+
+
+def _status(session_id: str) -> dict:
+    meta = _read_meta(session_id)
+    try:
+        offset = os.path.getsize(_data_path(session_id))
+    except FileNotFoundError:
+        # Handed over by complete_session, the directory is about to go
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return {**meta, "id": session_id, "offset": offset, "complete": offset == meta["size"]}
+
+
+def _load_owned(session_id: str, user_id: int) -> dict:
+    status = _status(session_id)
+    if status["owner_id"] != user_id:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return status
+
+
+def _create(filename: str, size: int, content_type: Optional[str], user_id: int) -> dict:
+    session_id = uuid.uuid4().hex
+    os.makedirs(_session_dir(session_id))
+    open(_data_path(session_id), "wb").close()
+    _write_meta(session_id, {
+        "filename": filename,
+        "size": size,
+        "content_type": content_type,
+        "owner_id": user_id,
+        "created": time.time(),
+    })
+    return _status(session_id)
+
+
+async def create_session(filename: str, size: int, content_type: Optional[str], user_id: int) -> dict:
+    if size > settings.MAX_RESUMABLE_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File exceeds the maximum upload size of {settings.MAX_RESUMABLE_UPLOAD_SIZE} bytes",
+        )
+    return await anyio.to_thread.run_sync(_create, filename, size, content_type, user_id)
+
+
+async def get_session(session_id: str, user_id: int) -> dict:
+    return await anyio.to_thread.run_sync(_load_owned, session_id, user_id)
+
+
+async def append_chunk(session_id: str, user_id: int, offset: int, chunks: AsyncIterator[bytes]) -> dict:
+    """
+    Append a streamed chunk at `offset`, which must equal the bytes received
+    so far (409 otherwise, with the current offset so the client can resume).
+
+    Data is written as it arrives; if the connection drops mid-chunk the
+    bytes already written count and the client resumes from the new offset.
+    """
+    lock = _locks.setdefault(session_id, asyncio.Lock())
+    async with lock:
+        status = await get_session(session_id, user_id)
+        if offset != status["offset"]:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Offset mismatch", "offset": status["offset"]},
+            )
+        remaining = status["size"] - offset
+        handle = await anyio.open_file(_data_path(session_id), "ab")
+        buffer = bytearray()
+        try:
+            async for chunk in chunks:
+                remaining -= len(chunk)
+                if remaining < 0:
+                    raise HTTPException(status_code=413, detail="Chunk exceeds the declared file size")
+                buffer += chunk
+                if len(buffer) >= settings.UPLOAD_CHUNK_SIZE:
+                    await handle.write(bytes(buffer))
+                    buffer.clear()
+        finally:
+            # Keep whatever arrived intact, also when the client disconnected
+            if buffer:
+                await handle.write(bytes(buffer))
+            await handle.aclose()
+        return await get_session(session_id, user_id)
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(settings.UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fsync(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+async def complete_session(session_id: str, user_id: int) -> tuple:
+    """
+    Check that every byte arrived and hand the file over as a received
+    upload (hashed in a worker thread, fsynced). Returns (StoredFile, meta).
+
+    The session is gone once this returns: the caller owns the file, and a
+    retried or concurrent finalize gets a 404 instead of a half-moved session.
+    """
+    lock = _locks.setdefault(session_id, asyncio.Lock())
+    async with lock:
+        status = await get_session(session_id, user_id)
+        if not status["complete"]:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Upload incomplete", "offset": status["offset"], "size": status["size"]},
+            )
+        data_path = _data_path(session_id)
+        sha256 = await anyio.to_thread.run_sync(_hash_file, data_path)
+        await anyio.to_thread.run_sync(_fsync, data_path)
+        tmp_path = os.path.join(storage.TMP_DIR, f"{session_id}.part")
+        stored = storage.StoredFile(path=tmp_path, size=status["size"], sha256=sha256)
+        await storage.place_file(data_path, stored.path)
+        await anyio.to_thread.run_sync(shutil.rmtree, _session_dir(session_id), True)
+    _locks.pop(session_id, None)
+    return stored, status
+
+
+async def delete_session(session_id: str, user_id: Optional[int] = None) -> None:
+    if user_id is not None:
+        await get_session(session_id, user_id)
+    await anyio.to_thread.run_sync(shutil.rmtree, _session_dir(session_id), True)
+    _locks.pop(session_id, None)
+
+
+def remove_expired_sessions(max_age_hours: Optional[float] = None) -> int:
+    """Drop sessions without activity for UPLOAD_SESSION_TTL_HOURS; returns the bytes freed."""
+    max_age_hours = settings.UPLOAD_SESSION_TTL_HOURS if max_age_hours is None else max_age_hours
+    root = sessions_dir()
+    if not os.path.isdir(root):
+        return 0
+    cutoff = time.time() - max_age_hours * 3600
+    freed = 0
+    for entry in os.scandir(root):
+        data = os.path.join(entry.path, "data.part")
+        size = os.path.getsize(data) if os.path.exists(data) else 0
+        last_activity = os.path.getmtime(data) if size else entry.stat().st_mtime
+        if last_activity < cutoff:
+            freed += size
+            shutil.rmtree(entry.path, ignore_errors=True)
+            _locks.pop(entry.name, None)
+    return freed
@@ -7,4 +7,8 @@ from app.models.task import Aufgabe  # noqa
 from app.models.category import Category  # noqa
 from app.models.customer import Customer  # noqa
 from app.models.site_content import SiteContent  # noqa
-
+from app.models.counter import Counter  # noqa
+from app.models.upload import UploadBlob, UploadRef  # noqa
+from app.models.message import Message, MessageArchive  # noqa
+from app.models.conversation import ConversationSummary  # noqa
+from app.models.project_message import ProjectMessage, ProjectReadCursor  # noqa
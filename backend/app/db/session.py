@@ -1,9 +1,94 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
-connect_args = {"check_same_thread": False} if "sqlite" in settings.SQLALCHEMY_DATABASE_URI else {}
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI, connect_args=connect_args
-)
+# Async drivers used when ASYNC_DB is enabled (optional dependencies)
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+def sqlite_pragmas() -> dict:
+    """PRAGMAs applied to every new SQLite connection (see the SQLITE_* settings)."""
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+
+def create_db_engine(uri: str, tuned: bool = settings.SQLITE_TUNING) -> Engine:
+    """
+    Create the application engine. For file-based SQLite with `tuned` set,
+    every connection is switched to WAL with the SQLITE_* profile, and the
+    pool is sized so uvicorn's threadpool can hold concurrent readers
+    (WAL readers never block the writer or each other).
+    """
+    connect_args, engine_args = _engine_args(uri, tuned)
+    engine = create_engine(uri, connect_args=connect_args, **engine_args)
+    _apply_sqlite_profile(engine, uri, tuned)
+    return engine
+
+def async_database_uri(uri: str) -> str:
+    """Swap the sync driver in `uri` for its async counterpart (aiosqlite / asyncpg)."""
+    url = make_url(uri)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+def create_async_db_engine(uri: str, tuned: bool = settings.SQLITE_TUNING) -> AsyncEngine:
+    """Async engine with the same pool settings and SQLite profile as create_db_engine."""
+    async_uri = async_database_uri(uri)
+    connect_args, engine_args = _engine_args(async_uri, tuned)
+    connect_args.pop("check_same_thread", None)  # aiosqlite owns its connection thread
+    if engine_args:
+        engine_args["poolclass"] = AsyncAdaptedQueuePool  # aiosqlite defaults to NullPool
+    engine = create_async_engine(async_uri, connect_args=connect_args, **engine_args)
+    _apply_sqlite_profile(engine.sync_engine, async_uri, tuned)
+    return engine
+
+def _is_memory_sqlite(uri: str) -> bool:
+    url = make_url(uri)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+def _engine_args(uri: str, tuned: bool):
+    is_sqlite = make_url(uri).get_backend_name() == "sqlite"
+    connect_args = {}
+    engine_args = {}
+    if is_sqlite:
+        connect_args["check_same_thread"] = False
+        if tuned:
+            connect_args["timeout"] = settings.SQLITE_BUSY_TIMEOUT_MS / 1000
+    if not _is_memory_sqlite(uri) and (tuned or not is_sqlite):
+        engine_args.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return connect_args, engine_args
+
+def _apply_sqlite_profile(engine: Engine, uri: str, tuned: bool) -> None:
+    if make_url(uri).get_backend_name() != "sqlite" or not tuned:
+        return
+    pragmas = sqlite_pragmas()
+    if _is_memory_sqlite(uri):
+        pragmas.pop("journal_mode")  # In-memory databases cannot use WAL
+
+    @event.listens_for(engine, "connect")
+    def apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+engine = create_db_engine(settings.SQLALCHEMY_DATABASE_URI)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Optional async engine for the endpoints ported to the event loop (ASYNC_DB)
+async_engine = create_async_db_engine(settings.SQLALCHEMY_DATABASE_URI) if settings.ASYNC_DB else None
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False) if async_engine is not None else None
+)
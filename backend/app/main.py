@@ -1,12 +1,20 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+import asyncio
 import os
+from app.api import assets
 from app.api.api_v1.api import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.storage import UPLOAD_DIR
+from app.core.images import shutdown_pool
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.pubsub import hub
+from app.core.retention import run_periodic_archive
+from app.core.spa import SpaManifest
+from app.core.upload_gc import run_periodic_gc
 from app.db.base import Base
-from app.db.session import engine
+from app.db.session import SessionLocal, engine
 
 # Create tables on startup
 Base.metadata.create_all(bind=engine)
@@ -24,34 +32,65 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
+    )
+
+# Compress JSON/text responses above COMPRESSION_MIN_SIZE
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        content_types=settings.COMPRESSION_TYPES,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
     )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
-# Mount uploads directory
-uploads_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "static", "uploads")
-os.makedirs(uploads_dir, exist_ok=True)
-app.mount("/assets/uploads", StaticFiles(directory=uploads_dir), name="uploads")
+# Uploaded files (immutable caching, ETags, ranges); registered before the SPA catch-all
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+app.include_router(assets.router)
+
+@app.on_event("startup")
+async def start_upload_gc():
+    # Optional in-process GC; multi-instance setups should run gc_uploads.py from cron instead
+    if settings.UPLOAD_GC_INTERVAL_HOURS > 0:
+        app.state.upload_gc_task = asyncio.create_task(
+            run_periodic_gc(SessionLocal, settings.UPLOAD_GC_INTERVAL_HOURS)
+        )
+
+@app.on_event("startup")
+async def start_message_archive():
+    # Optional in-process archiving; multi-instance setups should run archive_messages.py from cron instead
+    if settings.MESSAGE_ARCHIVE_INTERVAL_HOURS > 0:
+        app.state.message_archive_task = asyncio.create_task(
+            run_periodic_archive(SessionLocal, settings.MESSAGE_ARCHIVE_INTERVAL_HOURS)
+        )
+
+@app.on_event("startup")
+async def start_push_hub():
+    await hub.start()
+
+@app.on_event("shutdown")
+def stop_image_workers():
+    shutdown_pool()
+
+@app.on_event("shutdown")
+async def stop_push_hub():
+    await hub.stop()
 
-# Mount static files
+# Frontend build, indexed once at startup (see app/core/spa.py)
 static_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "frontend", "dist")
 
 if os.path.exists(static_dir):
-    app.mount("/assets", StaticFiles(directory=os.path.join(static_dir, "assets")), name="assets")
+    spa = SpaManifest(static_dir)
 
-    @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str):
-        # Allow API calls to pass through
+    @app.api_route("/{full_path:path}", methods=["GET", "HEAD"])
+    async def serve_frontend(request: Request, full_path: str):
+        # Unknown API paths get a real 404 instead of the SPA shell
         if full_path.startswith("api/"):
-            return None  # Let FastAPI handle 404 for API routes
-        
-        # Check if file exists in static dir (e.g. favicon.ico)
-        file_path = os.path.join(static_dir, full_path)
-        if os.path.exists(file_path) and os.path.isfile(file_path):
-            return FileResponse(file_path)
-            
-        # Fallback to index.html for SPA routing
-        return FileResponse(os.path.join(static_dir, "index.html"))
+            raise HTTPException(status_code=404, detail="Not Found")
+        return await spa.serve(request, full_path)
 else:
     print(f"Warning: Frontend build not found at {static_dir}")
@@ -14,3 +14,8 @@ from .document import Document
 from .ticket import Ticket
 from .note import Note
 from .comment import Comment
+from .counter import Counter
+from .upload import UploadBlob, UploadRef
+from .message import Message, MessageArchive
+from .conversation import ConversationSummary
+from .project_message import ProjectMessage, ProjectReadCursor
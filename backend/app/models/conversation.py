@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from app.db.base_class import Base
+
+class ConversationSummary(Base):
+    # One inbox row per user, counterpart and thread, kept up to date by app/core/conversations.py
+    __table_args__ = (
+        Index("ix_conversationsummary_thread", "user_id", "counterpart_id", "thread_id", unique=True),
+        Index("ix_conversationsummary_user_id_last_message_at", "user_id", "last_message_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    counterpart_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    thread_id = Column(Integer, nullable=False, default=0) # Message.project_id, 0 for direct messages
+    last_message_id = Column(Integer, ForeignKey("message.id"), nullable=True)
+    last_message_at = Column(DateTime(timezone=True), nullable=True)
+    unread_count = Column(Integer, nullable=False, default=0)
+
+    counterpart = relationship("User", foreign_keys=[counterpart_id])
+    last_message = relationship("Message")
+
+    @property
+    def project_id(self):
+        return self.thread_id or None
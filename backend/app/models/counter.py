@@ -0,0 +1,8 @@
+from sqlalchemy import Column, Integer, String
+from app.db.base_class import Base
+
+class Counter(Base):
+    # Named monotonic counters (e.g. project numbers), incremented atomically in SQL
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)
+    value = Column(Integer, nullable=False, default=0)
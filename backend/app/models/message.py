@@ -1,17 +1,41 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
 class Message(Base):
+    # Fetch the server-side timestamp with the INSERT, so new rows can be pushed without a reload
+    __mapper_args__ = {"eager_defaults": True}
+    # Conversation pages (one sender/recipient direction at a time) and per-recipient lookups, by time
+    __table_args__ = (
+        Index("ix_message_sender_recipient_timestamp", "sender_id", "recipient_id", "timestamp"),
+        Index("ix_message_recipient_sender_timestamp", "recipient_id", "sender_id", "timestamp"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     sender_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     recipient_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     project_id = Column(Integer, ForeignKey("projekt.id"), nullable=True)
     content = Column(Text, nullable=False)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     is_read = Column(Boolean, default=False)
 
     sender = relationship("User", foreign_keys=[sender_id], backref="sent_messages")
     recipient = relationship("User", foreign_keys=[recipient_id], backref="received_messages")
     project = relationship("Projekt", backref="messages")
+
+class MessageArchive(Base):
+    # Messages moved out of the hot table by the retention policy (app/core/retention.py); ids are kept
+    __table_args__ = (
+        Index("ix_messagearchive_sender_recipient_timestamp", "sender_id", "recipient_id", "timestamp"),
+        Index("ix_messagearchive_project_id", "project_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    sender_id = Column(Integer, nullable=False)
+    recipient_id = Column(Integer, nullable=False)
+    project_id = Column(Integer, nullable=True)
+    content = Column(Text, nullable=False)
+    timestamp = Column(DateTime(timezone=True))
+    is_read = Column(Boolean, default=False)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
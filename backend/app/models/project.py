@@ -47,7 +47,7 @@ class Projekt(Base):
     projekt_nummer = Column(String, unique=True, index=True, nullable=True)
     name = Column(String, index=True, nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(String, default=ProjectStatus.GEPLANT)
+    status = Column(String, default=ProjectStatus.GEPLANT, index=True)
     priority = Column(String, default=ProjectPriority.MITTEL)
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import backref, relationship
+from app.db.base_class import Base
+
+class ProjectMessage(Base):
+    # Project group chat: stored once per message, members track their position in ProjectReadCursor
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("projekt.id"), nullable=False, index=True) # (project_id, id) pages the channel
+    sender_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    content = Column(Text, nullable=False)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+
+    sender = relationship("User")
+    # Deleting a project deletes its chat history
+    project = relationship("Projekt", backref=backref("channel_messages", cascade="all, delete-orphan"))
+
+class ProjectReadCursor(Base):
+    # Newest project message a member has read; unread = messages after it
+    __table_args__ = (Index("ix_projectreadcursor_project_id_user_id", "project_id", "user_id", unique=True),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("projekt.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    last_read_id = Column(Integer, nullable=False, default=0)
+
+    project = relationship("Projekt", backref=backref("channel_read_cursors", cascade="all, delete-orphan"))
@@ -18,7 +18,7 @@ class Aufgabe(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True, nullable=False)
     description = Column(String, nullable=True)
-    status = Column(String, default=TaskStatus.OFFEN)
+    status = Column(String, default=TaskStatus.OFFEN, index=True)
     priority = Column(String, default=TaskPriority.MITTEL)
     due_date = Column(Date, nullable=True)
     
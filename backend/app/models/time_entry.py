@@ -1,8 +1,14 @@
-from sqlalchemy import Column, Integer, String, Float, Text, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Text, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
 class TimeEntry(Base):
+    # Per-user timesheets and per-project reports, filtered and sorted by date
+    __table_args__ = (
+        Index("ix_timeentry_user_id_date", "user_id", "date"),
+        Index("ix_timeentry_project_id_date", "project_id", "date"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("user.id"))
     user_name = Column(String, nullable=True)
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class UploadBlob(Base):
+    # One row per distinct upload content, stored once at `path` (relative to the upload dir)
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), unique=True, index=True, nullable=False)
+    path = Column(String, nullable=False)
+    size = Column(Integer, nullable=False)
+    content_type = Column(String, nullable=True)
+    created_date = Column(DateTime(timezone=True), server_default=func.now())
+
+class UploadRef(Base):
+    # Reference index: record `record_id` of table `model` points at blob `sha256` through `field`
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), index=True, nullable=False)
+    model = Column(String, nullable=False)
+    record_id = Column(Integer, nullable=False)
+    field = Column(String, nullable=False)
+
+    __table_args__ = (Index("ix_uploadref_model_record_id", "model", "record_id"),)
@@ -1,6 +1,6 @@
 from .token import Token, TokenPayload
-from .user import User, UserCreate, UserInDB, UserUpdate
-from .project import Project, ProjectCreate, ProjectUpdate, ProjectPublic
+from .user import User, UserCreate, UserInDB, UserUpdate, UserPrincipal
+from .project import Project, ProjectCreate, ProjectUpdate, ProjectPublic, ProjectSummary
 from .task import Task, TaskCreate, TaskUpdate
 from .customer import Customer, CustomerCreate, CustomerUpdate
 from .category import Category, CategoryCreate
@@ -11,7 +11,8 @@ from .cash_register import CashRegister, CashRegisterCreate, CashRegisterUpdate
 from .cash_sale import CashSale, CashSaleCreate
 from .subcontractor import Subcontractor, SubcontractorCreate, SubcontractorUpdate
 from .project_stage import ProjectStage, ProjectStageCreate, ProjectStageUpdate
-from .document import Document, DocumentCreate, DocumentUpdate
+from .document import Document, DocumentCreate, DocumentUpdate, DocumentFromUpload
 from .ticket import Ticket, TicketCreate, TicketUpdate
 from .note import Note, NoteCreate, NoteUpdate
 from .comment import Comment, CommentCreate
+from .upload import UploadSession, UploadSessionCreate, UploadSessionFinalize, UploadResult
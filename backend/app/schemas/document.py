@@ -19,6 +19,15 @@ class DocumentCreate(DocumentBase):
 class DocumentUpdate(DocumentBase):
     pass
 
+class DocumentFromUpload(BaseModel):
+    # Document fields for a resumable upload; file_url/name/size come from the upload
+    project_id: int
+    title: str
+    description: Optional[str] = None
+    type: Optional[str] = "Sonstiges"
+    tags: Optional[List[str]] = []
+    status: Optional[str] = "Aktiv"
+
 class Document(DocumentBase):
     id: int
     created_date: datetime
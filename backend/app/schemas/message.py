@@ -22,3 +22,26 @@ class Message(MessageBase):
 
     class Config:
         from_attributes = True
+
+class ConversationCounterpart(BaseModel):
+    id: int
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    avatar_url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+class Conversation(BaseModel):
+    counterpart_id: int
+    counterpart: Optional[ConversationCounterpart] = None
+    project_id: Optional[int] = None
+    last_message: Optional[Message] = None
+    unread_count: int
+
+    class Config:
+        from_attributes = True
+
+class ConversationRead(BaseModel):
+    updated: int
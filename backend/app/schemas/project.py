@@ -45,6 +45,22 @@ class Project(ProjectInDBBase):
     workers: List[User] = []
     subcontractors: List[Subcontractor] = []
 
+class ProjectSummary(BaseModel):
+    # Compact list representation: no nested users/subcontractors
+    id: int
+    projekt_nummer: Optional[str] = None
+    name: Optional[str] = None
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    customer_id: Optional[int] = None
+    category_id: Optional[int] = None
+    projektleiter_id: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
 class ProjectPublic(ProjectBase):
     id: int
     # Simplified public view - Exclude sensitive fields
@@ -0,0 +1,27 @@
+from typing import Optional
+from datetime import datetime
+from pydantic import BaseModel
+
+class ProjectMessageCreate(BaseModel):
+    content: str
+
+class ProjectMessage(BaseModel):
+    id: int
+    project_id: int
+    sender_id: int
+    content: str
+    timestamp: datetime
+
+    class Config:
+        from_attributes = True
+
+class ProjectChannel(BaseModel):
+    project_id: int
+    name: Optional[str] = None
+    projekt_nummer: Optional[str] = None
+    last_message: Optional[ProjectMessage] = None
+    last_read_id: int = 0
+    unread_count: int = 0
+
+class ProjectChannelRead(BaseModel):
+    last_read_id: Optional[int] = None # Defaults to (and is capped at) the newest message
@@ -0,0 +1,28 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+from app.schemas.document import Document, DocumentFromUpload
+
+class UploadSessionCreate(BaseModel):
+    filename: str
+    size: int = Field(gt=0)  # Bytes; empty files go through the plain upload endpoint
+    content_type: Optional[str] = None
+
+class UploadSession(BaseModel):
+    id: str
+    filename: str
+    size: int
+    content_type: Optional[str] = None
+    offset: int
+    complete: bool
+    chunk_size: int
+
+class UploadSessionFinalize(BaseModel):
+    # Optional: create a document pointing at the uploaded file in the same call
+    document: Optional[DocumentFromUpload] = None
+
+class UploadResult(BaseModel):
+    url: str
+    path: str
+    size: int
+    sha256: str
+    document: Optional[Document] = None
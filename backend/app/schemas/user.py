@@ -45,6 +45,18 @@ class UserInDBBase(UserBase):
 class User(UserInDBBase):
     pass
 
+# Authenticated principal snapshot, cached per user id in deps
+class UserPrincipal(BaseModel):
+    id: int
+    email: Optional[str] = None
+    role: Optional[str] = None
+    is_active: bool = True
+    is_superuser: bool = False
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
 # Additional properties stored in DB
 class UserInDB(UserInDBBase):
     hashed_password: str
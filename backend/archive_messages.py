@@ -0,0 +1,45 @@
+"""
+Move messages covered by the retention policy into the archive table
+(`messagearchive`): messages older than MESSAGE_RETENTION_DAYS and, with
+MESSAGE_ARCHIVE_CLOSED_PROJECTS, all messages of projects in
+"Abgeschlossen". The last message of every conversation stays in place for
+the inbox. Archived messages remain readable through the conversation API.
+
+Run it from cron, or set MESSAGE_ARCHIVE_INTERVAL_HOURS to run it inside
+the app process.
+Usage (from backend/): python archive_messages.py [--dry-run] [--days N] [--keep-closed-projects]
+"""
+import argparse
+
+from app.core.retention import archive_messages as run_archive
+from app.db.base import Base  # noqa: F401 - register every model
+from app.db.session import SessionLocal, engine
+from app.models.message import MessageArchive
+
+
+def archive_messages():
+    parser = argparse.ArgumentParser(description="Archive messages past the retention period")
+    parser.add_argument("--dry-run", action="store_true", help="only report how many messages would move")
+    parser.add_argument("--days", type=int, default=None, help="retention period in days (0 = no age limit)")
+    parser.add_argument("--keep-closed-projects", action="store_true",
+                        help="do not archive messages of completed projects")
+    parser.add_argument("--batch-size", type=int, default=1000, help="messages moved per transaction")
+    args = parser.parse_args()
+
+    MessageArchive.__table__.create(bind=engine, checkfirst=True)
+    db = SessionLocal()
+    try:
+        report = run_archive(
+            db,
+            retention_days=args.days,
+            closed_projects=False if args.keep_closed_projects else None,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+        print(report.summary())
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    archive_messages()
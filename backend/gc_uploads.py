@@ -0,0 +1,43 @@
+"""
+Garbage-collect uploads no record references any more (deleted projects,
+documents, stages, replaced images ...).
+
+Unreferenced files older than the grace period are moved to
+static/uploads/.trash/<date>/ (purged after UPLOAD_GC_QUARANTINE_DAYS),
+or deleted outright with --delete. Run it from cron, or set
+UPLOAD_GC_INTERVAL_HOURS to run it inside the app process.
+Usage (from backend/): python gc_uploads.py [--dry-run] [--delete] [--grace-hours N]
+"""
+import argparse
+
+from app.core.upload_gc import collect_garbage
+from app.db.base import Base  # noqa: F401 - register every model
+from app.db.session import SessionLocal
+
+
+def gc_uploads():
+    parser = argparse.ArgumentParser(description="Remove unreferenced upload files")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be removed")
+    parser.add_argument("--delete", action="store_true", help="delete instead of quarantining")
+    parser.add_argument("--grace-hours", type=float, default=None, help="keep files younger than this")
+    parser.add_argument("--verbose", action="store_true", help="list every removed file")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = collect_garbage(
+            db,
+            grace_hours=args.grace_hours,
+            mode="delete" if args.delete else "quarantine",
+            dry_run=args.dry_run,
+        )
+        if args.verbose:
+            for rel in report.removed:
+                print(f"  {rel}")
+        print(report.summary())
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    gc_uploads()
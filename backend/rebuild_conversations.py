@@ -0,0 +1,29 @@
+"""
+Create the inbox summary table (`conversationsummary`) and fill it from
+every message. Needed once after upgrading, and after any script that
+inserts, edits or deletes messages with bulk SQL.
+
+Safe to re-run - the summaries are recreated from scratch.
+Usage (from backend/): python rebuild_conversations.py
+"""
+from app.core.conversations import rebuild_conversation_summaries
+from app.db.session import SessionLocal, engine
+from app.models.conversation import ConversationSummary
+
+
+def rebuild_conversations():
+    ConversationSummary.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        total = rebuild_conversation_summaries(db)
+        print(f"Summarized {total} conversations")
+    except Exception as e:
+        print(f"Error rebuilding conversation summaries: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    rebuild_conversations()
@@ -0,0 +1,30 @@
+"""
+Create the upload store tables and rebuild the upload reference index
+(`uploadref`) from every URL column. Needed once after upgrading, and
+after any script that edits URL columns in place.
+
+Safe to re-run - the index is recreated from scratch.
+Usage (from backend/): python reindex_uploads.py
+"""
+from app.core.upload_refs import rebuild_upload_refs
+from app.db.session import SessionLocal, engine
+from app.models.upload import UploadBlob, UploadRef
+
+
+def reindex_uploads():
+    UploadBlob.__table__.create(bind=engine, checkfirst=True)
+    UploadRef.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        total = rebuild_upload_refs(db)
+        print(f"Indexed {total} references to content-addressed uploads")
+    except Exception as e:
+        print(f"Error rebuilding upload index: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reindex_uploads()
@@ -0,0 +1,43 @@
+"""
+One-time migration: create the `counter` table and seed the project number
+counter from the highest existing EP-XXXX number.
+
+Safe to re-run - the counter is only ever moved forward.
+Usage (from backend/): python seed_project_counter.py
+"""
+from sqlalchemy import update
+
+from app.api.api_v1.endpoints.projects import (
+    PROJECT_NUMBER_COUNTER,
+    scan_max_project_number,
+    seed_project_counter,
+)
+from app.db.session import SessionLocal, engine
+from app.models.counter import Counter
+
+
+def seed_counter():
+    Counter.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        max_num = scan_max_project_number(db)
+        seed_project_counter(db)
+        db.execute(
+            update(Counter)
+            .where(Counter.name == PROJECT_NUMBER_COUNTER, Counter.value < max_num)
+            .values(value=max_num)
+        )
+        db.commit()
+        counter = db.query(Counter).filter(Counter.name == PROJECT_NUMBER_COUNTER).first()
+        print(f"Highest existing project number: EP-{max_num}")
+        print(f"Counter '{PROJECT_NUMBER_COUNTER}' set to {counter.value}, next number: EP-{counter.value + 1}")
+    except Exception as e:
+        print(f"Error seeding counter: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    seed_counter()
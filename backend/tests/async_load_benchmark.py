@@ -0,0 +1,131 @@
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# In-process load test of the hot read endpoints: concurrent clients against
+# the sync endpoints (threadpool + SessionLocal) and against the async
+# variants served from the aiosqlite engine (ASYNC_DB). Both run on the same
+# temporary file database. Usage (from backend/):
+#   python tests/async_load_benchmark.py [concurrency] [seconds]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_tmp = tempfile.TemporaryDirectory()
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(_tmp.name, 'bench.db')}"
+os.environ["ASYNC_DB"] = "true"
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.api_v1.endpoints import categories, content, messages, projects, tasks
+from app.core import security
+from app.db.session import SessionLocal, async_engine
+from app.main import app
+from app.models.category import Category
+from app.models.message import Message
+from app.models.project import Projekt
+from app.models.site_content import SiteContent
+from app.models.task import Aufgabe
+from app.models.user import User
+
+# The sync routers on their own, as the app was served before ASYNC_DB
+sync_app = FastAPI()
+for module, prefix in [
+    (projects, "/projects"), (tasks, "/tasks"), (categories, "/categories"),
+    (messages, "/messages"), (content, "/content"),
+]:
+    sync_app.include_router(module.router, prefix=f"/api/v1{prefix}")
+
+
+class AsyncLoadBenchmark:
+    URLS = [
+        "/api/v1/projects/?limit=20",
+        "/api/v1/projects/1",
+        "/api/v1/tasks/?limit=50",
+        "/api/v1/categories/public",
+        "/api/v1/messages/?limit=50",
+        "/api/v1/content/home",
+    ]
+
+    def __init__(self, concurrency, duration):
+        self.concurrency = concurrency
+        self.duration = duration
+        self.headers = {"Authorization": f"Bearer {self.seed()}"}
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def seed(self):
+        db = SessionLocal()
+        admin = User(email="admin@example.com", hashed_password="x", role="Admin", is_superuser=True)
+        workers = [User(email=f"worker{i}@example.com", hashed_password="x", role="Worker") for i in range(10)]
+        db.add_all([admin] + workers)
+        for i in range(50):
+            db.add(Projekt(
+                name=f"Project {i}", projekt_nummer=f"EP-{1000 + i}",
+                projektleiter=admin, workers=workers[i % 10:i % 10 + 3],
+            ))
+        db.flush()
+        db.add_all(Aufgabe(title=f"Task {i}", project_id=1 + i % 50) for i in range(200))
+        for i in range(5):
+            parent = Category(name=f"Category {i}")
+            parent.children = [Category(name=f"Category {i}.{n}") for n in range(4)]
+            db.add(parent)
+        db.add_all(
+            Message(sender_id=admin.id if i % 2 else workers[0].id,
+                    recipient_id=workers[0].id if i % 2 else admin.id, content=f"Message {i}")
+            for i in range(200)
+        )
+        db.add(SiteContent(key="home", content={"title": "Welcome"}))
+        db.commit()
+        token = security.create_access_token(admin.id)
+        db.close()
+        return token
+
+    async def client_loop(self, client, stop, latencies, errors, n):
+        i = n
+        while not stop.is_set():
+            url = self.URLS[i % len(self.URLS)]
+            i += 1
+            start = time.perf_counter()
+            res = await client.get(url, headers=self.headers)
+            latencies.append(time.perf_counter() - start)
+            if res.status_code != 200:
+                errors.append(f"{url}: {res.status_code}")
+
+    async def scenario(self, asgi_app):
+        transport = httpx.ASGITransport(app=asgi_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # Warm-up: fills the principal cache and opens pool connections
+            for url in self.URLS:
+                await client.get(url, headers=self.headers)
+            stop = asyncio.Event()
+            latencies, errors = [], []
+            workers = [
+                asyncio.create_task(self.client_loop(client, stop, latencies, errors, n))
+                for n in range(self.concurrency)
+            ]
+            await asyncio.sleep(self.duration)
+            stop.set()
+            await asyncio.gather(*workers)
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        return len(latencies) / self.duration, p50, p99, errors
+
+    def run(self):
+        self.log(f"{self.concurrency} concurrent clients, {self.duration}s per scenario, {len(self.URLS)} endpoints")
+        print(f"{'endpoints':<28}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>10}")
+        for name, asgi_app in [("sync (threadpool)", sync_app), ("async (ASYNC_DB)", app)]:
+            rate, p50, p99, errors = asyncio.run(self.scenario(asgi_app))
+            print(f"{name:<28}{rate:>10.0f}{p50:>10.1f}{p99:>10.1f}{len(errors):>10}")
+            if errors:
+                self.log(f"First error: {errors[0]}", "FAIL")
+        asyncio.run(async_engine.dispose())
+
+
+if __name__ == "__main__":
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    AsyncLoadBenchmark(concurrency, duration).run()
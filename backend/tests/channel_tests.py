@@ -0,0 +1,201 @@
+import json
+import os
+import sys
+
+# Run in-process against a throwaway in-memory database (no server needed).
+# Usage (from backend/): python tests/channel_tests.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.websockets import WebSocketDisconnect
+
+from app.api import deps
+from app.core import security
+from app.core.config import settings
+from app.db.base_class import Base
+from app.main import app
+from app.models.project import Projekt
+from app.models.project_message import ProjectMessage, ProjectReadCursor
+from app.models.user import User
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class ChannelTester:
+    def __init__(self):
+        settings.PUSH_KEEPALIVE_SECONDS = 0.5  # Frames keep arriving, so a missing event can't hang the test
+        Base.metadata.create_all(bind=engine)
+        app.dependency_overrides[deps.get_db] = override_get_db
+        self.client = TestClient(app)
+        self.inserts = []
+        event.listen(engine, "before_cursor_execute", self._count_inserts)
+
+    def _count_inserts(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            self.inserts.append(statement)
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def fail(self, message):
+        self.log(message, "FAIL")
+        sys.exit(1)
+
+    def setup_project(self):
+        db = TestingSessionLocal()
+        self.leader = User(email="leader@example.com", hashed_password="x", role="Projektleiter")
+        self.group_leader = User(email="group@example.com", hashed_password="x", role="Gruppenleiter")
+        self.workers = [User(email=f"worker{i}@example.com", hashed_password="x", role="Worker") for i in range(30)]
+        self.outsider = User(email="outsider@example.com", hashed_password="x", role="Worker")
+        self.admin = User(email="admin@example.com", hashed_password="x", role="Admin")
+        db.add_all([self.leader, self.group_leader, self.outsider, self.admin, *self.workers])
+        db.flush()
+        project = Projekt(name="Baustelle", projekt_nummer="EP-1", projektleiter_id=self.leader.id)
+        project.gruppenleiter.append(self.group_leader)
+        project.workers.extend(self.workers)
+        db.add_all([project, Projekt(name="Other", projekt_nummer="EP-2")])
+        db.commit()
+        self.project_id = project.id
+        self.tokens = {
+            user.id: security.create_access_token(user.id)
+            for user in [self.leader, self.group_leader, self.outsider, self.admin, *self.workers]
+        }
+        for user in [self.leader, self.group_leader, self.outsider, self.workers[0]]:
+            deps.cache_principal(user)  # Long-lived connections resolve the caller from the cache
+        db.close()
+
+    def as_user(self, user):
+        return {"Authorization": f"Bearer {self.tokens[user.id]}"}
+
+    def post(self, user, content):
+        return self.client.post(
+            f"/api/v1/channels/{self.project_id}/messages", json={"content": content}, headers=self.as_user(user)
+        )
+
+    def check_membership(self):
+        for user in [self.leader, self.group_leader, self.workers[29], self.admin]:
+            if self.post(user, f"Hallo von {user.email}").status_code != 200:
+                self.fail(f"{user.email} could not post to the channel")
+        if self.post(self.outsider, "Hallo").status_code != 403:
+            self.fail("Non-member could post to the channel")
+        if self.client.get(f"/api/v1/channels/{self.project_id}/messages", headers=self.as_user(self.outsider)).status_code != 403:
+            self.fail("Non-member could read the channel")
+        if self.client.get("/api/v1/channels/999/messages", headers=self.as_user(self.admin)).status_code != 404:
+            self.fail("Unknown project must return 404")
+        self.log("Channel membership follows Projektleiter, Gruppenleiter and workers")
+
+    def check_single_write(self):
+        self.inserts.clear()
+        if self.post(self.workers[0], "Material kommt um 9").status_code != 200:
+            self.fail("Posting failed")
+        # The message itself plus the sender's own read cursor, whatever the crew size
+        if len(self.inserts) != 2:
+            self.fail(f"Posting wrote {len(self.inserts)} rows: {self.inserts}")
+        db = TestingSessionLocal()
+        if db.query(ProjectReadCursor).count() != 5:
+            self.fail("Only members that posted or read should have a cursor")
+        db.close()
+        self.log("A message is stored once for the whole crew")
+
+    def check_unread(self):
+        channels = self.client.get("/api/v1/channels/", headers=self.as_user(self.workers[5])).json()
+        if [(c["project_id"], c["unread_count"]) for c in channels] != [(self.project_id, 5)]:
+            self.fail(f"Worker channel list: {channels}")
+        if channels[0]["last_message"]["content"] != "Material kommt um 9":
+            self.fail("Channel list is missing the last message")
+        sender = self.client.get("/api/v1/channels/", headers=self.as_user(self.workers[0])).json()
+        if sender[0]["unread_count"] != 0:
+            self.fail("Posting must mark the channel as read for the sender")
+
+        history = self.client.get(f"/api/v1/channels/{self.project_id}/messages",
+                                  params={"limit": 2}, headers=self.as_user(self.workers[5])).json()
+        read = self.client.post(f"/api/v1/channels/{self.project_id}/read",
+                                json={"last_read_id": history[0]["id"]}, headers=self.as_user(self.workers[5]))
+        if read.json() != {"last_read_id": history[0]["id"]}:
+            self.fail(f"Read cursor not advanced: {read.json()}")
+        if self.client.get("/api/v1/channels/", headers=self.as_user(self.workers[5])).json()[0]["unread_count"] != 1:
+            self.fail("Unread count does not follow the read cursor")
+        self.client.post(f"/api/v1/channels/{self.project_id}/read", headers=self.as_user(self.workers[5]))
+        older = self.client.post(f"/api/v1/channels/{self.project_id}/read",
+                                 json={"last_read_id": 1}, headers=self.as_user(self.workers[5])).json()
+        if older["last_read_id"] != history[-1]["id"]:
+            self.fail("Read cursor moved backwards")
+        beyond = self.client.post(f"/api/v1/channels/{self.project_id}/read",
+                                  json={"last_read_id": 1000000000}, headers=self.as_user(self.workers[5])).json()
+        if beyond["last_read_id"] != history[-1]["id"]:
+            self.fail(f"Read cursor moved past the newest message: {beyond}")
+
+        earlier = self.client.get(f"/api/v1/channels/{self.project_id}/messages",
+                                  params={"before_id": history[0]["id"]}, headers=self.as_user(self.workers[5])).json()
+        ids = [m["id"] for m in earlier + history]
+        if len(ids) != 5 or ids != sorted(ids):
+            self.fail(f"Scrolling back returned {ids}")
+        self.log("Unread counts come from per-member read cursors")
+
+    def check_push(self):
+        url = f"/api/v1/channels/{self.project_id}/ws?token={self.tokens[self.group_leader.id]}"
+        with self.client.websocket_connect(url) as ws:
+            sent = self.post(self.leader, "Feierabend").json()
+            for _ in range(8):
+                event = json.loads(ws.receive_text())
+                if event["type"] == "project_message":
+                    break
+            if event.get("data") != sent:
+                self.fail(f"Channel push delivered {event}")
+        unread = self.client.get("/api/v1/channels/", headers=self.as_user(self.workers[5])).json()[0]["unread_count"]
+        if unread != 1:
+            self.fail(f"New message not counted as unread after an out-of-range read: {unread}")
+        try:
+            with self.client.websocket_connect(
+                f"/api/v1/channels/{self.project_id}/ws?token={self.tokens[self.outsider.id]}"
+            ) as ws:
+                ws.receive_text()
+        except WebSocketDisconnect as exc:
+            if exc.code != 1008:
+                self.fail(f"Unexpected close code {exc.code}")
+        else:
+            self.fail("Non-member subscribed to the channel")
+        self.log("Channel messages are pushed to subscribed members only")
+
+    def check_delete_project(self):
+        response = self.client.delete(f"/api/v1/projects/{self.project_id}", headers=self.as_user(self.admin))
+        if response.status_code != 200:
+            self.fail(f"Deleting a project with chat history failed: {response.status_code} {response.text}")
+        db = TestingSessionLocal()
+        left = (
+            db.query(ProjectMessage).filter(ProjectMessage.project_id == self.project_id).count(),
+            db.query(ProjectReadCursor).filter(ProjectReadCursor.project_id == self.project_id).count(),
+        )
+        db.close()
+        if left != (0, 0):
+            self.fail(f"Channel messages/cursors left behind: {left}")
+        self.log("Deleting a project removes its channel")
+
+    def run(self):
+        self.setup_project()
+        self.check_membership()
+        self.check_single_write()
+        self.check_unread()
+        self.check_push()
+        self.check_delete_project()
+        self.log("Channel Test Completed Successfully!")
+
+
+if __name__ == "__main__":
+    tester = ChannelTester()
+    tester.run()
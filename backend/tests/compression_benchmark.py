@@ -0,0 +1,111 @@
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Response size and latency of the largest list endpoints with and without
+# compression, in-process against a temporary file database. Also checks
+# that compressed bodies decode to the identity response.
+# Usage (from backend/): python tests/compression_benchmark.py [requests per case]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_tmp = tempfile.TemporaryDirectory()
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(_tmp.name, 'bench.db')}"
+
+from fastapi.testclient import TestClient
+
+from app.core import compression, security
+from app.db.session import SessionLocal
+from app.main import app
+from app.models.category import Category
+from app.models.project import Projekt
+from app.models.site_content import SiteContent
+from app.models.user import User
+
+
+class CompressionBenchmark:
+    URLS = [
+        "/api/v1/projects/?limit=100",
+        "/api/v1/categories/?limit=100",
+        "/api/v1/content/",
+    ]
+    ENCODINGS = ["identity", "gzip", "br"]
+
+    def __init__(self, requests):
+        self.requests = requests
+        self.client = TestClient(app)
+        self.client.headers.update({"Authorization": f"Bearer {self.seed()}"})
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def fail(self, message):
+        self.log(message, "FAIL")
+        sys.exit(1)
+
+    def seed(self):
+        db = SessionLocal()
+        admin = User(email="admin@example.com", hashed_password="x", role="Admin", is_superuser=True, first_name="Admin")
+        workers = [
+            User(email=f"worker{i}@example.com", hashed_password="x", role="Worker", first_name="Worker", last_name=str(i))
+            for i in range(20)
+        ]
+        db.add_all([admin] + workers)
+        for i in range(100):
+            db.add(Projekt(
+                name=f"Sanierung Mehrfamilienhaus {i}", projekt_nummer=f"EP-{1000 + i}",
+                description="Dachsanierung, Fassadendämmung und Fenstertausch. " * 3,
+                projektleiter=admin, workers=workers[i % 20:i % 20 + 4],
+            ))
+        for i in range(40):
+            db.add(Category(
+                name=f"Leistung {i}",
+                modal_config={"title": f"Leistung {i}", "steps": [{"label": f"Schritt {n}", "hint": "Bitte auswählen"} for n in range(6)]},
+                custom_fields={"fields": [{"key": f"feld_{n}", "type": "text", "label": f"Feld {n}", "required": n % 2 == 0} for n in range(8)]},
+            ))
+        for key in ("home", "about", "services", "contact"):
+            db.add(SiteContent(key=key, content={
+                "title": key.title(),
+                "sections": [{"heading": f"Abschnitt {n}", "text": "Wir planen und bauen für Sie. " * 20} for n in range(10)],
+            }))
+        db.commit()
+        token = security.create_access_token(admin.id)
+        db.close()
+        return token
+
+    def measure(self, url, encoding):
+        response = self.client.get(url, headers={"Accept-Encoding": encoding})
+        latencies = []
+        for _ in range(self.requests):
+            start = time.perf_counter()
+            self.client.get(url, headers={"Accept-Encoding": encoding})
+            latencies.append(time.perf_counter() - start)
+        return response, statistics.median(latencies) * 1000
+
+    def wire_size(self, response):
+        # httpx decodes transparently; Content-Length is what went over the wire
+        return int(response.headers.get("content-length", len(response.content)))
+
+    def run(self):
+        if compression.brotli is None:
+            self.log("brotli not installed, br falls back to identity", "WARN")
+        print(f"{'endpoint':<34}{'encoding':<10}{'bytes':>10}{'ratio':>8}{'p50 ms':>9}")
+        for url in self.URLS:
+            baseline = None
+            for encoding in self.ENCODINGS:
+                response, p50 = self.measure(url, encoding)
+                if response.status_code != 200:
+                    self.fail(f"{url}: {response.status_code}")
+                size = self.wire_size(response)
+                if baseline is None:
+                    baseline, identity_body = size, response.content
+                elif response.content != identity_body:
+                    self.fail(f"{url} ({encoding}) does not decode to the identity body")
+                used = response.headers.get("content-encoding", "identity")
+                print(f"{url:<34}{used:<10}{size:>10}{size / baseline:>8.2f}{p50:>9.2f}")
+        self.log("Compressed responses decode to the identity bodies")
+
+
+if __name__ == "__main__":
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    CompressionBenchmark(requests).run()
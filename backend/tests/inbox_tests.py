@@ -0,0 +1,184 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Run in-process against a throwaway in-memory database (no server needed).
+# Usage (from backend/): python tests/inbox_tests.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.core import security
+from app.core.conversations import rebuild_conversation_summaries
+from app.db.base_class import Base
+from app.main import app
+from app.models.conversation import ConversationSummary
+from app.models.message import Message
+from app.models.project import Projekt
+from app.models.user import User
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class InboxTester:
+    def __init__(self):
+        Base.metadata.create_all(bind=engine)
+        app.dependency_overrides[deps.get_db] = override_get_db
+        self.client = TestClient(app)
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def fail(self, message):
+        self.log(message, "FAIL")
+        sys.exit(1)
+
+    def setup_users(self):
+        db = TestingSessionLocal()
+        users = [
+            User(email=f"user{i}@example.com", first_name=f"User {i}", hashed_password="x", role="Worker")
+            for i in range(4)
+        ]
+        db.add_all(users)
+        db.add(Projekt(name="Chat project", projekt_nummer="EP-1"))
+        db.commit()
+        self.ids = [user.id for user in users]
+        self.tokens = [security.create_access_token(user_id) for user_id in self.ids]
+        db.close()
+
+    def as_user(self, index):
+        return {"Authorization": f"Bearer {self.tokens[index]}"}
+
+    def send(self, sender, recipient, content, project_id=None):
+        response = self.client.post(
+            "/api/v1/messages/",
+            json={"recipient_id": self.ids[recipient], "content": content, "project_id": project_id},
+            headers=self.as_user(sender),
+        )
+        if response.status_code != 200:
+            self.fail(f"Sending failed: {response.status_code} {response.text}")
+        return response.json()
+
+    def inbox(self, user, **params):
+        response = self.client.get("/api/v1/messages/inbox", params=params, headers=self.as_user(user))
+        if response.status_code != 200:
+            self.fail(f"Inbox failed: {response.status_code} {response.text}")
+        return response.json()
+
+    def check_inbox(self):
+        self.send(1, 0, "Hallo von 1")
+        self.send(2, 0, "Hallo von 2")
+        self.send(1, 0, "Noch etwas")
+        self.send(0, 2, "Antwort an 2")
+        last = self.send(3, 0, "Zum Projekt", project_id=1)
+
+        self.statements.clear()
+        inbox = self.inbox(0)
+        if len(self.statements) > 2:
+            self.fail(f"Inbox took {len(self.statements)} queries")
+        threads = [(c["counterpart_id"], c["project_id"], c["unread_count"]) for c in inbox]
+        expected = [(self.ids[3], 1, 1), (self.ids[2], None, 1), (self.ids[1], None, 2)]
+        if threads != expected:
+            self.fail(f"Inbox returned {threads}, expected {expected}")
+        if inbox[0]["last_message"] != last or inbox[0]["counterpart"]["first_name"] != "User 3":
+            self.fail("Last message or counterpart missing")
+        if inbox[1]["last_message"]["content"] != "Antwort an 2":
+            self.fail("Own replies must count as the last message")
+        if self.inbox(2)[0]["unread_count"] != 1:
+            self.fail("Recipient of the reply should have one unread message")
+        self.log("Inbox lists each conversation with last message and unread count")
+
+    def check_mark_read(self):
+        response = self.client.post(f"/api/v1/messages/conversation/{self.ids[1]}/read", headers=self.as_user(0))
+        if response.json() != {"updated": 2}:
+            self.fail(f"Mark as read returned {response.json()}")
+        if [c["counterpart_id"] for c in self.inbox(0, unread_only=True)] != [self.ids[3], self.ids[2]]:
+            self.fail("Read conversation still listed as unread")
+        messages = self.client.get(f"/api/v1/messages/conversation/{self.ids[1]}", headers=self.as_user(0)).json()
+        if not all(m["is_read"] for m in messages):
+            self.fail("Messages were not marked as read")
+        self.log("Conversations are marked as read in bulk")
+
+    def check_consistency(self):
+        db = TestingSessionLocal()
+        # Edits and deletes through the ORM keep the summaries in step
+        message = db.query(Message).filter(Message.sender_id == self.ids[2]).one()
+        message.is_read = True
+        reply = db.query(Message).filter(Message.content == "Antwort an 2").one()
+        db.delete(reply)
+        db.add(Message(sender_id=self.ids[1], recipient_id=self.ids[0], content="Older",
+                       timestamp=datetime(2000, 1, 1)))
+        db.commit()
+
+        def snapshot():
+            return sorted(
+                (s.user_id, s.counterpart_id, s.thread_id, s.last_message_id, s.unread_count)
+                for s in db.query(ConversationSummary)
+            )
+
+        maintained = snapshot()
+        rebuild_conversation_summaries(db)
+        if snapshot() != maintained:
+            self.fail(f"Maintained summaries {maintained} differ from a rebuild {snapshot()}")
+        db.close()
+        conversation = next(c for c in self.inbox(0) if c["counterpart_id"] == self.ids[2])
+        if conversation["unread_count"] != 0 or conversation["last_message"]["content"] != "Hallo von 2":
+            self.fail("Edit/delete not reflected in the inbox")
+        self.log("Summaries match a full rebuild after edits and deletes")
+
+    def check_pagination(self):
+        db = TestingSessionLocal()
+        start = datetime(2024, 1, 1)
+        db.add_all(
+            Message(sender_id=self.ids[0], recipient_id=self.ids[1], content=f"Thread {i}",
+                    project_id=100 + i, timestamp=start + timedelta(minutes=i))
+            for i in range(7)
+        )
+        db.commit()
+        total = db.query(ConversationSummary).filter(ConversationSummary.user_id == self.ids[0]).count()
+        db.close()
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            response = self.client.get("/api/v1/messages/inbox", params=params, headers=self.as_user(0))
+            seen += [(c["counterpart_id"], c["project_id"]) for c in response.json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        if len(seen) != total or len(set(seen)) != total:
+            self.fail(f"Inbox pages returned {len(seen)} of {total} conversations")
+        self.log("Inbox pages with cursors")
+
+    def run(self):
+        self.setup_users()
+        self.check_inbox()
+        self.check_mark_read()
+        self.check_consistency()
+        self.check_pagination()
+        self.log("Inbox Test Completed Successfully!")
+
+
+if __name__ == "__main__":
+    tester = InboxTester()
+    tester.run()
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# In-process benchmark: latency of other endpoints during a burst of logins
+# (e.g. the time terminal at shift start). Compares the previous sync login,
+# which ran bcrypt on the request threadpool, with the current async login.
+# Usage (from backend/): python tests/login_storm_benchmark.py [logins]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+import httpx
+from fastapi import Depends, HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.core import security
+from app.db.base_class import Base
+from app.main import app
+from app.models.user import User
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@app.post("/bench/legacy-login")
+def legacy_login(db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()):
+    # Previous implementation: sync endpoint, bcrypt twice for a wrong password
+    user = db.query(User).filter(User.email == form_data.username).first()
+    if user:
+        security.verify_password(form_data.password, user.hashed_password)
+    if not user or not security.verify_password(form_data.password, user.hashed_password):
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
+    return {"access_token": security.create_access_token(user.id), "token_type": "bearer"}
+
+
+class LoginStormBenchmark:
+    PROBE_URL = "/api/v1/categories/public"
+    PROBE_CONCURRENCY = 5
+
+    def __init__(self, logins):
+        self.logins = logins
+        Base.metadata.create_all(bind=engine)
+        app.dependency_overrides[deps.get_db] = override_get_db
+        db = TestingSessionLocal()
+        db.add(User(email="worker@example.com", hashed_password=security.get_password_hash("secret"), role="Worker"))
+        db.commit()
+        db.close()
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    async def probe(self, client, stop, latencies):
+        while not stop.is_set():
+            start = time.perf_counter()
+            await client.get(self.PROBE_URL)
+            latencies.append(time.perf_counter() - start)
+
+    async def login(self, client, url, i):
+        # Every third attempt uses a wrong password
+        password = "wrong" if i % 3 == 0 else "secret"
+        await client.post(url, data={"username": "worker@example.com", "password": password})
+
+    async def scenario(self, url):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            stop = asyncio.Event()
+            latencies = []
+            probes = [asyncio.create_task(self.probe(client, stop, latencies)) for _ in range(self.PROBE_CONCURRENCY)]
+            start = time.perf_counter()
+            await asyncio.gather(*(self.login(client, url, i) for i in range(self.logins)))
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await asyncio.gather(*probes)
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        return elapsed, len(latencies), p50, p99
+
+    def run(self):
+        self.log(f"{self.logins} concurrent logins, {self.PROBE_CONCURRENCY} concurrent probes on {self.PROBE_URL}")
+        print(f"{'login path':<32}{'storm s':>10}{'probes':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        for name, url in [
+            ("sync (previous)", "/bench/legacy-login"),
+            ("async + password executor", "/api/v1/login/access-token"),
+        ]:
+            elapsed, count, p50, p99 = asyncio.run(self.scenario(url))
+            print(f"{name:<32}{elapsed:>10.2f}{count:>10}{p50:>10.1f}{p99:>10.1f}")
+
+
+if __name__ == "__main__":
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    LoginStormBenchmark(logins).run()
@@ -0,0 +1,211 @@
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+# Run in-process against a throwaway in-memory database (no server needed).
+# Usage (from backend/): python tests/pagination_tests.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.core import security
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.db.base_class import Base
+from app.main import app
+from app.models.message import Message
+from app.models.project import Projekt
+from app.models.ticket import Ticket
+from app.models.time_entry import TimeEntry
+from app.models.user import User
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class PaginationTester:
+    def __init__(self):
+        Base.metadata.create_all(bind=engine)
+        app.dependency_overrides[deps.get_db] = override_get_db
+        self.client = TestClient(app)
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def fail(self, message):
+        self.log(message, "FAIL")
+        sys.exit(1)
+
+    def seed(self):
+        db = TestingSessionLocal()
+        admin = User(email="admin@example.com", hashed_password="x", role="Admin", is_superuser=True)
+        other = User(email="worker@example.com", hashed_password="x", role="Worker")
+        db.add_all([admin, other])
+        db.flush()
+        db.add_all(Projekt(name=f"Project {i}", projekt_nummer=f"EP-{i}") for i in range(25))
+        db.add_all(Ticket(subject=f"Ticket {i}", message="-") for i in range(7))
+        # Pairs of messages share a timestamp, so the id has to break ties
+        start = datetime(2024, 1, 1, 8, 0)
+        db.add_all(
+            Message(sender_id=admin.id, recipient_id=other.id, content=f"Message {i}",
+                    timestamp=start + timedelta(minutes=i // 2))
+            for i in range(15)
+        )
+        db.add_all(
+            TimeEntry(user_id=admin.id if i % 2 else other.id, date=date(2024, 3, 1) + timedelta(days=i // 3),
+                      start_time="07:00", end_time=None if i == 29 else "16:00",
+                      project_id=1 + i % 3, location="Baustelle" if i % 5 == 0 else "Büro")
+            for i in range(30)
+        )
+        db.commit()
+        self.admin_id, self.other_id = admin.id, other.id
+        self.client.headers.update({"Authorization": f"Bearer {security.create_access_token(admin.id)}"})
+        db.close()
+
+    def walk(self, url, limit):
+        return self.walk_params(url, {"limit": limit})
+
+    def walk_params(self, url, params):
+        pages, items, cursor = 0, [], None
+        while True:
+            response = self.client.get(url, params={**params, **({"cursor": cursor} if cursor else {})})
+            if response.status_code != 200:
+                self.fail(f"{url}: {response.status_code} {response.text}")
+            items += response.json()
+            pages += 1
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                return items, pages
+
+    def check_cursor_walk(self):
+        projects, pages = self.walk("/api/v1/projects/", 10)
+        ids = [p["id"] for p in projects]
+        if ids != sorted(ids) or len(set(ids)) != 25 or pages != 3:
+            self.fail(f"Project walk returned {len(ids)} ids in {pages} pages")
+
+        messages, _ = self.walk("/api/v1/messages/", 4)
+        keys = [(m["timestamp"], m["id"]) for m in messages]
+        if len(messages) != 15 or keys != sorted(keys, reverse=True):
+            self.fail("Message walk is not newest-first without gaps or repeats")
+
+        tickets, pages = self.walk("/api/v1/tickets/", 7)
+        if len(tickets) != 7 or pages != 1:
+            self.fail("An exactly full last page must not announce a next cursor")
+        self.log("Cursor walks return every row exactly once, in order")
+
+    def check_stable_under_deletes(self):
+        first = self.client.get("/api/v1/projects/", params={"limit": 10})
+        cursor = first.headers[NEXT_CURSOR_HEADER]
+        # With OFFSET, removing a row from page one would skip a row on page two
+        db = TestingSessionLocal()
+        db.delete(db.get(Projekt, first.json()[0]["id"]))
+        db.commit()
+        db.close()
+        second = self.client.get("/api/v1/projects/", params={"limit": 10, "cursor": cursor})
+        if second.json()[0]["id"] != first.json()[-1]["id"] + 1:
+            self.fail("Next page shifted after a delete")
+        self.log("Pages stay stable while rows change")
+
+    def check_compatibility(self):
+        response = self.client.get("/api/v1/projects/", params={"skip": 19, "limit": 3})
+        if [p["projekt_nummer"] for p in response.json()] != ["EP-20", "EP-21", "EP-22"]:
+            self.fail("skip/limit changed behaviour")
+        shaped = self.client.get("/api/v1/projects/", params={"limit": 5, "fields": "summary"})
+        if NEXT_CURSOR_HEADER not in shaped.headers:
+            self.fail("Shaped project list lost the cursor header")
+        if self.client.get("/api/v1/projects/", params={"cursor": "not-a-cursor"}).status_code != 400:
+            self.fail("Malformed cursor must be rejected with 400")
+        self.log("skip/limit still work, malformed cursors are rejected")
+
+    def check_time_entry_filters(self):
+        params = {"user_id": self.other_id, "date_from": "2024-03-03", "date_to": "2024-03-07", "limit": 2}
+        entries, pages = self.walk_params("/api/v1/time-entries/", params)
+        dates = [e["date"] for e in entries]
+        if any(e["user_id"] != self.other_id for e in entries) or dates != sorted(dates, reverse=True):
+            self.fail("Time entries not filtered by user or not newest first")
+        if min(dates) < "2024-03-03" or max(dates) > "2024-03-07" or pages < 2:
+            self.fail(f"Date range not applied: {dates}")
+        project = self.client.get("/api/v1/time-entries/", params={"project_id": 2, "location": "Baustelle", "sort": "date"}).json()
+        if not project or any(e["project_id"] != 2 or e["location"] != "Baustelle" for e in project):
+            self.fail("Project/location filter not applied")
+        open_entries = self.client.get("/api/v1/time-entries/", params={"open_only": True}).json()
+        if len(open_entries) != 1 or open_entries[0]["end_time"] is not None:
+            self.fail("open_only did not return the running entry")
+        if self.client.get("/api/v1/time-entries/", params={"sort": "hours"}).status_code != 400:
+            self.fail("Unknown sort must be rejected")
+
+        with engine.connect() as conn:
+            plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT * FROM timeentry WHERE user_id = 1 AND date >= '2024-03-01' ORDER BY date DESC, id DESC"
+            )).fetchall()
+        if "ix_timeentry_user_id_date" not in " ".join(str(row) for row in plan):
+            self.fail(f"Per-user time entry query does not use the composite index: {plan}")
+        self.log("Time entries filtered, sorted and paged on the server")
+
+    def check_conversation_pages(self):
+        db = TestingSessionLocal()
+        # Replies interleave with the seeded messages, so both directions must be merged
+        db.add_all(
+            Message(sender_id=self.other_id, recipient_id=self.admin_id, content=f"Reply {i}",
+                    timestamp=datetime(2024, 1, 1, 8, i, 30))
+            for i in range(5)
+        )
+        db.commit()
+        expected = [m.id for m in db.query(Message).order_by(Message.timestamp, Message.id)]
+        db.close()
+
+        url = f"/api/v1/messages/conversation/{self.other_id}"
+        page = self.client.get(url, params={"limit": 6}).json()
+        history = [m["id"] for m in page]
+        while page:
+            page = self.client.get(url, params={"limit": 6, "before_id": history[0]}).json()
+            history = [m["id"] for m in page] + history
+        if history != expected:
+            self.fail(f"Scrolling back returned {history}, expected {expected}")
+
+        newer = self.client.get(url, params={"limit": 3, "after_id": expected[9]}).json()
+        if [m["id"] for m in newer] != expected[10:13]:
+            self.fail("after_id did not return the next messages in order")
+        since = self.client.get(url, params={"since": "2024-01-01T08:05:00"}).json()
+        if [m["id"] for m in since] != expected[-3:]:
+            self.fail(f"since returned {[m['id'] for m in since]}")
+
+        with engine.connect() as conn:
+            plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT id FROM message WHERE sender_id = 1 AND recipient_id = 2 "
+                "AND (timestamp, id) < ('2024-01-01 08:05:00', 12) ORDER BY timestamp DESC, id DESC LIMIT 6"
+            )).fetchall()
+        plan = " ".join(str(row) for row in plan)
+        # Either (sender, recipient, timestamp) index serves a direction; SQLite picks one per run
+        composite = ("ix_message_sender_recipient_timestamp", "ix_message_recipient_sender_timestamp")
+        if not any(index in plan for index in composite) or "TEMP B-TREE" in plan:
+            self.fail(f"Conversation page is not read from the composite index: {plan}")
+        self.log("Conversation history pages backwards and forwards by id or time")
+
+    def run(self):
+        self.seed()
+        self.check_cursor_walk()
+        self.check_stable_under_deletes()
+        self.check_compatibility()
+        self.check_time_entry_filters()
+        self.check_conversation_pages()
+        self.log("Pagination Test Completed Successfully!")
+
+
+if __name__ == "__main__":
+    tester = PaginationTester()
+    tester.run()
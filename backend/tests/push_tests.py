@@ -0,0 +1,167 @@
+import asyncio
+import json
+import os
+import sys
+
+# Run in-process against a throwaway in-memory database (no server needed).
+# Usage (from backend/): python tests/push_tests.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.websockets import WebSocketDisconnect
+
+from app.api import deps
+from app.core import security
+from app.core.config import settings
+from app.core.pubsub import hub
+from app.db.base_class import Base
+from app.main import app
+from app.models.message import Message
+from app.models.project import Projekt
+from app.models.user import User
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class PushTester:
+    def __init__(self):
+        settings.PUSH_KEEPALIVE_SECONDS = 0.5  # Frames keep arriving, so a missing event can't hang the test
+        Base.metadata.create_all(bind=engine)
+        app.dependency_overrides[deps.get_db] = override_get_db
+        self.client = TestClient(app)
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def fail(self, message):
+        self.log(message, "FAIL")
+        sys.exit(1)
+
+    def setup_users(self):
+        db = TestingSessionLocal()
+        users = [User(email=f"user{i}@example.com", hashed_password="x", role="Worker") for i in range(3)]
+        db.add_all(users)
+        db.add(Projekt(name="Chat project", projekt_nummer="EP-1"))
+        db.commit()
+        self.ids = [user.id for user in users]
+        # Long-lived connections resolve the caller from the principal cache
+        for user in users:
+            deps.cache_principal(user)
+        self.tokens = [security.create_access_token(user_id) for user_id in self.ids]
+        db.close()
+
+    def send(self, sender, recipient, content, project_id=None):
+        response = self.client.post(
+            "/api/v1/messages/",
+            json={"recipient_id": self.ids[recipient], "content": content, "project_id": project_id},
+            headers={"Authorization": f"Bearer {self.tokens[sender]}"},
+        )
+        if response.status_code != 200:
+            self.fail(f"Sending failed: {response.status_code} {response.text}")
+        return response.json()
+
+    def next_message(self, ws, frames=8):
+        for _ in range(frames):
+            event = json.loads(ws.receive_text())
+            if event["type"] == "message":
+                return event["data"]
+        return None
+
+    def check_websocket_push(self):
+        with self.client.websocket_connect(f"/api/v1/messages/ws?token={self.tokens[1]}") as inbox, \
+                self.client.websocket_connect(f"/api/v1/messages/ws?token={self.tokens[2]}") as bystander:
+            sent = self.send(0, 1, "Hallo")
+            pushed = self.next_message(inbox)
+            if pushed != sent:
+                self.fail(f"Recipient got {pushed}, expected {sent}")
+            if self.next_message(bystander, frames=2) is not None:
+                self.fail("Message pushed to a user outside the conversation")
+
+        with self.client.websocket_connect(f"/api/v1/messages/ws?token={self.tokens[1]}&project_id=1") as project_chat:
+            self.send(0, 1, "Ohne Projekt")
+            sent = self.send(0, 1, "Im Projekt", project_id=1)
+            if self.next_message(project_chat) != sent:
+                self.fail("Project channel did not receive exactly the project message")
+        self.log("New messages are pushed over WebSocket to the participants only")
+
+    def check_rejects_anonymous(self):
+        try:
+            with self.client.websocket_connect("/api/v1/messages/ws?token=invalid") as ws:
+                ws.receive_text()
+        except WebSocketDisconnect as exc:
+            if exc.code != 1008:
+                self.fail(f"Unexpected close code {exc.code}")
+        else:
+            self.fail("WebSocket accepted an invalid token")
+        if self.client.get("/api/v1/messages/stream").status_code != 401:
+            self.fail("SSE stream without a token must be rejected")
+        self.log("Unauthenticated push connections are rejected")
+
+    async def read_sse(self):
+        # Drive the ASGI app directly: the test client buffers whole responses
+        chunks, disconnect = [], asyncio.Event()
+
+        async def receive():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                chunks.append(message.get("body", b"").decode())
+                if "data:" in "".join(chunks):
+                    disconnect.set()
+
+        scope = {
+            "type": "http", "method": "GET", "path": "/api/v1/messages/stream", "raw_path": b"/api/v1/messages/stream",
+            "query_string": f"token={self.tokens[1]}".encode(), "headers": [], "http_version": "1.1",
+            "scheme": "http", "server": ("test", 80), "client": ("test", 1), "root_path": "",
+        }
+        stream = asyncio.create_task(app(scope, receive, send))
+        while not hub._channels.get(f"user:{self.ids[1]}"):
+            await asyncio.sleep(0.01)
+        # Commit from a worker thread, like the sync endpoints do
+        await asyncio.to_thread(self.insert_message)
+        await asyncio.wait_for(stream, timeout=5)
+        return "".join(chunks)
+
+    def insert_message(self):
+        db = TestingSessionLocal()
+        db.add(Message(sender_id=self.ids[2], recipient_id=self.ids[1], content="Per SSE"))
+        db.commit()
+        db.close()
+
+    def check_sse_fallback(self):
+        body = asyncio.run(self.read_sse())
+        data = [line[len("data: "):] for line in body.splitlines() if line.startswith("data: ")]
+        if not data or json.loads(data[0])["data"]["content"] != "Per SSE":
+            self.fail(f"SSE stream did not carry the message: {body!r}")
+        if hub._channels.get(f"user:{self.ids[1]}"):
+            self.fail("SSE subscription not released after disconnect")
+        self.log("SSE fallback streams messages committed from worker threads")
+
+    def run(self):
+        self.setup_users()
+        self.check_websocket_push()
+        self.check_rejects_anonymous()
+        self.check_sse_fallback()
+        self.log("Push Test Completed Successfully!")
+
+
+if __name__ == "__main__":
+    tester = PushTester()
+    tester.run()
@@ -0,0 +1,153 @@
+import os
+import sys
+
+# Run in-process against a throwaway in-memory database (no server needed).
+# Usage (from backend/): python tests/query_count_tests.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.core import security
+from app.db.base_class import Base
+from app.main import app
+from app.models.project import Projekt
+from app.models.subcontractor import Subcontractor
+from app.models.user import User
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class QueryCountTester:
+    # Upper bound for one page: project SELECT + one batched SELECT per
+    # eager-loaded relationship (the caller comes from the principal cache).
+    MAX_QUERIES = 5
+
+    def __init__(self):
+        self.query_count = 0
+        self.data_store = {}
+        Base.metadata.create_all(bind=engine)
+        event.listen(engine, "before_cursor_execute", self._count_query)
+        app.dependency_overrides[deps.get_db] = override_get_db
+        self.client = TestClient(app)
+
+    def _count_query(self, conn, cursor, statement, parameters, context, executemany):
+        self.query_count += 1
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def fail(self, message):
+        self.log(message, "FAIL")
+        sys.exit(1)
+
+    def setup_admin(self):
+        db = TestingSessionLocal()
+        admin = User(
+            email="admin@example.com",
+            hashed_password="not-used",
+            first_name="Admin",
+            last_name="User",
+            role="Admin",
+            is_superuser=True,
+        )
+        db.add(admin)
+        db.commit()
+        token = security.create_access_token(admin.id)
+        self.client.headers.update({"Authorization": f"Bearer {token}"})
+        db.close()
+        # Warm the principal cache so counts only cover the endpoint itself
+        self.client.get("/api/v1/users/me")
+
+    def create_projects(self, count):
+        self.log(f"Creating {count} projects with team members...")
+        db = TestingSessionLocal()
+        offset = self.data_store.get("projects", 0)
+        for i in range(offset, offset + count):
+            users = [
+                User(email=f"user{i}_{n}@example.com", hashed_password="x", role="Worker")
+                for n in range(6)
+            ]
+            project = Projekt(
+                name=f"Project {i}",
+                projekt_nummer=f"EP-{1000 + i}",
+                projektleiter=users[0],
+                gruppenleiter=users[1:3],
+                workers=users[3:6],
+                subcontractors=[Subcontractor(company_name=f"Sub {i}")],
+            )
+            db.add(project)
+        db.commit()
+        db.close()
+        self.data_store["projects"] = offset + count
+
+    def count_requests(self, url):
+        self.query_count = 0
+        res = self.client.get(url)
+        if res.status_code != 200:
+            self.fail(f"GET {url} failed: {res.text}")
+        return self.query_count, res.json()
+
+    def check_list(self):
+        self.create_projects(5)
+        small, data = self.count_requests("/api/v1/projects/")
+        if len(data) != 5 or len(data[0]["workers"]) != 3:
+            self.fail("Project list did not include nested relations")
+
+        self.create_projects(45)
+        large, data = self.count_requests("/api/v1/projects/")
+        if len(data) != 50:
+            self.fail(f"Expected 50 projects, got {len(data)}")
+
+        self.log(f"Queries for 5 projects: {small}, for 50 projects: {large}")
+        if small != large:
+            self.fail("Query count grows with page size (N+1)")
+        if large > self.MAX_QUERIES:
+            self.fail(f"Too many queries for one page: {large}")
+        self.log("Project list query count is constant")
+
+    def check_detail(self):
+        count, data = self.count_requests("/api/v1/projects/1")
+        if data["projektleiter"] is None or len(data["gruppenleiter"]) != 2:
+            self.fail("Project detail did not include nested relations")
+        self.log(f"Queries for project detail: {count}")
+        if count > self.MAX_QUERIES:
+            self.fail(f"Too many queries for project detail: {count}")
+
+    def check_summary(self):
+        count, data = self.count_requests("/api/v1/projects/?fields=summary")
+        if "workers" in data[0] or "description" in data[0]:
+            self.fail("Summary list returned non-summary fields")
+        count_incl, data = self.count_requests("/api/v1/projects/?fields=summary&include=workers")
+        if len(data[0]["workers"]) != 3 or "gruppenleiter" in data[0]:
+            self.fail("include=workers did not expand exactly the workers relation")
+        self.log(f"Queries for summary list: {count}, with include=workers: {count_incl}")
+        if count_incl != count + 1:
+            self.fail("Each included relation should cost exactly one batched query")
+
+    def run(self):
+        self.setup_admin()
+        self.check_list()
+        self.check_detail()
+        self.check_summary()
+        self.log("Query Count Test Completed Successfully!")
+
+
+if __name__ == "__main__":
+    tester = QueryCountTester()
+    tester.run()
@@ -0,0 +1,123 @@
+import datetime
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Per-endpoint latency of the list endpoints with FastAPI's default
+# response_model path, the precompiled TypeAdapter path and the trusted
+# (orjson, no validation) path, in-process against a temporary file
+# database. Also checks that all three produce the same JSON.
+# Usage (from backend/): python tests/serialization_benchmark.py [requests per case]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_tmp = tempfile.TemporaryDirectory()
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(_tmp.name, 'bench.db')}"
+os.environ["COMPRESSION_ENABLED"] = "false"
+
+from fastapi.testclient import TestClient
+
+from app.core import security
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.main import app
+from app.models.cash_register import CashRegister
+from app.models.cash_sale import CashSale
+from app.models.category import Category
+from app.models.message import Message
+from app.models.product import Product
+from app.models.product_log import ProductLog
+from app.models.project import Projekt
+from app.models.task import Aufgabe
+from app.models.time_entry import TimeEntry
+from app.models.user import User
+
+MODES = {
+    "response_model": {"FAST_JSON_RESPONSES": False, "TRUST_ORM_OUTPUT": False},
+    "type_adapter": {"FAST_JSON_RESPONSES": True, "TRUST_ORM_OUTPUT": False},
+    "trusted": {"FAST_JSON_RESPONSES": True, "TRUST_ORM_OUTPUT": True},
+}
+
+
+class SerializationBenchmark:
+    URLS = [
+        "/api/v1/projects/?limit=100",
+        "/api/v1/users/?limit=100",
+        "/api/v1/tasks/?limit=100",
+        "/api/v1/messages/?limit=100",
+        "/api/v1/products/?limit=100",
+        "/api/v1/product-logs/?limit=100",
+        "/api/v1/time-entries/?limit=100",
+        "/api/v1/cash-sales/?limit=100",
+    ]
+
+    def __init__(self, requests):
+        self.requests = requests
+        self.client = TestClient(app)
+        self.client.headers.update({"Authorization": f"Bearer {self.seed()}"})
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def fail(self, message):
+        self.log(message, "FAIL")
+        sys.exit(1)
+
+    def seed(self):
+        db = SessionLocal()
+        admin = User(email="admin@example.com", hashed_password="x", role="Admin", is_superuser=True)
+        workers = [User(email=f"worker{i}@example.com", hashed_password="x", role="Worker", first_name=f"W{i}") for i in range(100)]
+        db.add_all([admin] + workers)
+        for i in range(100):
+            db.add(Projekt(name=f"Project {i}", projekt_nummer=f"EP-{1000 + i}", projektleiter=admin, workers=workers[i:i + 3]))
+        category = Category(name="Material", children=[Category(name="Holz"), Category(name="Metall")])
+        db.add(category)
+        db.flush()
+        register = CashRegister(name="Kasse 1", register_number="K1")
+        db.add(register)
+        db.flush()
+        today = datetime.date.today()
+        for i in range(100):
+            db.add(Aufgabe(title=f"Task {i}", project_id=1 + i, due_date=today))
+            db.add(Message(sender_id=admin.id, recipient_id=workers[i].id, content=f"Message {i}"))
+            product = Product(name=f"Product {i}", category_id=category.id, stock=i, sales_price=9.5)
+            db.add(product)
+            db.flush()
+            db.add(ProductLog(product_id=product.id, user_id=admin.id, action="Entnahme", quantity=2, project_id=1 + i))
+            db.add(TimeEntry(user_id=workers[i].id, date=today, start_time="07:00", end_time="15:30", hours=8.5, project_id=1 + i))
+            db.add(CashSale(cash_register_id=register.id, product_id=product.id, product_name=product.name, amount=9.5))
+        db.commit()
+        token = security.create_access_token(admin.id)
+        db.close()
+        return token
+
+    def measure(self, url):
+        response = self.client.get(url)
+        latencies = []
+        for _ in range(self.requests):
+            start = time.perf_counter()
+            self.client.get(url)
+            latencies.append(time.perf_counter() - start)
+        return response, statistics.median(latencies) * 1000
+
+    def run(self):
+        print(f"{'endpoint':<34}" + "".join(f"{mode:>16}" for mode in MODES) + f"{'speedup':>10}")
+        for url in self.URLS:
+            timings, bodies = [], []
+            for overrides in MODES.values():
+                for key, value in overrides.items():
+                    setattr(settings, key, value)
+                response, p50 = self.measure(url)
+                if response.status_code != 200:
+                    self.fail(f"{url}: {response.status_code} {response.text[:200]}")
+                timings.append(p50)
+                bodies.append(response.json())
+            if any(body != bodies[0] for body in bodies[1:]):
+                self.fail(f"{url}: fast paths differ from the response_model output")
+            print(f"{url:<34}" + "".join(f"{ms:>13.2f} ms" for ms in timings) + f"{timings[0] / min(timings[1:]):>9.1f}x")
+        self.log("All modes return identical JSON")
+
+
+if __name__ == "__main__":
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    SerializationBenchmark(requests).run()
@@ -0,0 +1,104 @@
+import gzip
+import os
+import sys
+import tempfile
+
+# Serves a throwaway frontend build through SpaManifest (no server needed).
+# Usage (from backend/): python tests/spa_tests.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.file_responses import IMMUTABLE
+from app.core.spa import SpaManifest
+
+INDEX_HTML = b"<!doctype html><html><head></head><body><div id=root></div>" + b" " * 2000 + b"</body></html>"
+BUNDLE_JS = b"console.log('app');" * 200
+
+
+class SpaTester:
+    def __init__(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        os.makedirs(os.path.join(root, "assets"))
+        self.write("index.html", INDEX_HTML)
+        self.write("favicon.svg", b"<svg/>")
+        self.write("assets/index-abc123.js", BUNDLE_JS)
+        self.write("assets/index-abc123.js.gz", gzip.compress(BUNDLE_JS))
+
+        self.spa = SpaManifest(root)
+        app = FastAPI()
+
+        @app.api_route("/{full_path:path}", methods=["GET", "HEAD"])
+        async def serve_frontend(request: Request, full_path: str):
+            return await self.spa.serve(request, full_path)
+
+        self.client = TestClient(app)
+
+    def write(self, rel, data):
+        with open(os.path.join(self.tmp.name, rel), "wb") as f:
+            f.write(data)
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def fail(self, message):
+        self.log(message, "FAIL")
+        sys.exit(1)
+
+    def check_hashed_assets(self):
+        plain = self.client.get("/assets/index-abc123.js", headers={"Accept-Encoding": "identity"})
+        if plain.status_code != 200 or plain.content != BUNDLE_JS:
+            self.fail(f"Bundle not served: {plain.status_code}")
+        if plain.headers["cache-control"] != IMMUTABLE or "content-encoding" in plain.headers:
+            self.fail(f"Unexpected bundle headers: {dict(plain.headers)}")
+
+        packed = self.client.get("/assets/index-abc123.js", headers={"Accept-Encoding": "gzip, br;q=0"})
+        if packed.headers.get("content-encoding") != "gzip" or packed.content != BUNDLE_JS:
+            self.fail("Precompressed sibling not used")
+        if packed.headers["etag"] == plain.headers["etag"] or packed.headers["vary"] != "Accept-Encoding":
+            self.fail("Encoded variant needs its own ETag and Vary")
+        cached = self.client.get(
+            "/assets/index-abc123.js",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": packed.headers["etag"]},
+        )
+        if cached.status_code != 304:
+            self.fail(f"Expected 304 for the gzip variant, got {cached.status_code}")
+
+        if self.client.get("/assets/index-missing.js").status_code != 404:
+            self.fail("Missing bundle must not fall back to index.html")
+        self.log("Hashed assets: immutable caching and precompressed variants")
+
+    def check_spa_fallback(self):
+        response = self.client.get("/projects/42", headers={"Accept-Encoding": "identity"})
+        if response.status_code != 200 or response.content != INDEX_HTML:
+            self.fail(f"SPA route did not return index.html: {response.status_code}")
+        if response.headers["cache-control"] != "no-cache":
+            self.fail("index.html must be revalidated")
+        if self.client.get("/", headers={"If-None-Match": response.headers["etag"], "Accept-Encoding": "identity"}).status_code != 304:
+            self.fail("index.html ETag not honoured")
+
+        packed = self.client.get("/dashboard", headers={"Accept-Encoding": "gzip"})
+        if packed.headers.get("content-encoding") != "gzip" or packed.content != INDEX_HTML:
+            self.fail("index.html not compressed from memory")
+
+        # Served from memory: deleting the file on disk changes nothing until the next startup
+        os.remove(os.path.join(self.tmp.name, "index.html"))
+        if self.client.get("/tasks").content != INDEX_HTML:
+            self.fail("index.html was read from disk per request")
+
+        root_file = self.client.get("/favicon.svg")
+        if root_file.content != b"<svg/>" or "immutable" in root_file.headers["cache-control"]:
+            self.fail("Unhashed root files must not be cached as immutable")
+        self.log("SPA fallback served from memory with ETag/304")
+
+    def run(self):
+        self.check_hashed_assets()
+        self.check_spa_fallback()
+        self.log("SPA Test Completed Successfully!")
+
+
+if __name__ == "__main__":
+    tester = SpaTester()
+    tester.run()
@@ -0,0 +1,87 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+# Concurrent read/write throughput on a file SQLite database, comparing the
+# previous engine (check_same_thread only) with the tuned WAL profile from
+# app.db.session. Usage (from backend/): python tests/sqlite_benchmark.py [seconds]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 - register every model on Base.metadata
+from app.db.base_class import Base
+from app.db.session import create_db_engine
+from app.models.time_entry import TimeEntry
+
+
+class SqliteBenchmark:
+    WRITERS = 4
+    READERS = 12
+
+    def __init__(self, duration):
+        self.duration = duration
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def writer(self, Session, stop, stats, n):
+        while not stop.is_set():
+            db = Session()
+            try:
+                db.add(TimeEntry(user_id=n, date=date.today(), start_time="08:00", hours=1.0))
+                db.commit()
+                stats["writes"] += 1
+            except OperationalError:
+                db.rollback()
+                stats["errors"] += 1
+            finally:
+                db.close()
+
+    def reader(self, Session, stop, stats, n):
+        while not stop.is_set():
+            db = Session()
+            try:
+                db.query(TimeEntry).filter(TimeEntry.user_id == n % self.WRITERS).order_by(TimeEntry.id.desc()).limit(50).all()
+                stats["reads"] += 1
+            except OperationalError:
+                stats["errors"] += 1
+            finally:
+                db.close()
+
+    def scenario(self, tuned):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", tuned=tuned)
+            Base.metadata.create_all(bind=engine)
+            Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            stats = {"writes": 0, "reads": 0, "errors": 0}
+            stop = threading.Event()
+            threads = [threading.Thread(target=self.writer, args=(Session, stop, stats, i)) for i in range(self.WRITERS)]
+            threads += [threading.Thread(target=self.reader, args=(Session, stop, stats, i)) for i in range(self.READERS)]
+            for t in threads:
+                t.start()
+            time.sleep(self.duration)
+            stop.set()
+            for t in threads:
+                t.join()
+            engine.dispose()
+        return stats
+
+    def run(self):
+        self.log(f"{self.WRITERS} writer / {self.READERS} reader threads, {self.duration}s per scenario")
+        print(f"{'engine':<24}{'writes/s':>10}{'reads/s':>10}{'locked errors':>15}")
+        for name, tuned in [("default (previous)", False), ("WAL profile", True)]:
+            stats = self.scenario(tuned)
+            print(
+                f"{name:<24}{stats['writes'] / self.duration:>10.0f}"
+                f"{stats['reads'] / self.duration:>10.0f}{stats['errors']:>15}"
+            )
+
+
+if __name__ == "__main__":
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    SqliteBenchmark(duration).run()
@@ -0,0 +1,340 @@
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+# Run in-process against a throwaway in-memory database and a temporary
+# upload directory (no server needed).
+# Usage (from backend/): python tests/upload_tests.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
+
+import anyio
+from PIL import Image
+from fastapi import HTTPException, UploadFile
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.core import security, storage, upload_sessions
+from app.core.config import settings
+from app.core.images import derivative_relpath, shutdown_pool
+from app.core.upload_gc import collect_garbage
+from app.core.upload_refs import rebuild_upload_refs
+from app.db.base_class import Base
+from app.main import app
+from app.models.project import Projekt
+from app.models.project_stage import ProjectStage
+from app.models.site_content import SiteContent
+from app.models.upload import UploadBlob
+from app.models.user import User
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class UploadTester:
+    def __init__(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        storage.UPLOAD_DIR = self.tmp.name
+        storage.TMP_DIR = os.path.join(self.tmp.name, ".tmp")
+        Base.metadata.create_all(bind=engine)
+        app.dependency_overrides[deps.get_db] = override_get_db
+        self.client = TestClient(app)
+
+    def log(self, message, status="INFO"):
+        print(f"[{status}] {message}")
+
+    def fail(self, message):
+        self.log(message, "FAIL")
+        sys.exit(1)
+
+    def setup_user(self):
+        db = TestingSessionLocal()
+        user = User(email="uploader@example.com", hashed_password="x", role="Worker")
+        db.add(user)
+        db.commit()
+        self.client.headers.update({"Authorization": f"Bearer {security.create_access_token(user.id)}"})
+        db.close()
+
+    def upload(self, path, name, data, content_type="application/octet-stream"):
+        return self.client.post(path, files={"file": (name, data, content_type)})
+
+    def local_path(self, url):
+        return os.path.join(storage.UPLOAD_DIR, url[len(storage.UPLOAD_URL_PREFIX):])
+
+    def check_streamed_upload(self):
+        data = os.urandom(3 * settings.UPLOAD_CHUNK_SIZE + 123)
+        res = self.upload("/api/v1/upload/", "plan.pdf", data)
+        if res.status_code != 200:
+            self.fail(f"Upload failed: {res.text}")
+        body = res.json()
+        if body["sha256"] != hashlib.sha256(data).hexdigest() or body["size"] != len(data):
+            self.fail("Upload hash or size does not match the content")
+        with open(self.local_path(body["url"]), "rb") as f:
+            if f.read() != data:
+                self.fail("Stored file differs from the upload")
+        self.log("Multi-chunk upload stored with matching SHA-256")
+
+    def check_size_limit(self):
+        original = settings.MAX_UPLOAD_SIZE
+        settings.MAX_UPLOAD_SIZE = 1000
+        try:
+            res = self.upload("/api/v1/upload/image", "big.jpg", b"x" * 5000, "image/jpeg")
+        finally:
+            settings.MAX_UPLOAD_SIZE = original
+        if res.status_code != 413:
+            self.fail(f"Expected 413 for an oversized upload, got {res.status_code}")
+        # Without a usable Content-Length the limit must hold while streaming
+        try:
+            anyio.run(storage.stream_to_disk, UploadFile(io.BytesIO(b"x" * 5000)), os.path.join(self.tmp.name, "big"), 1000)
+            self.fail("stream_to_disk accepted more than max_size")
+        except HTTPException as e:
+            if e.status_code != 413:
+                self.fail(f"Expected 413 while streaming, got {e.status_code}")
+        if os.listdir(storage.TMP_DIR) or os.path.exists(os.path.join(self.tmp.name, "big")):
+            self.fail("Rejected upload left a temporary file behind")
+        self.log("Oversized upload rejected with 413 and cleaned up")
+
+    def check_image_type(self):
+        res = self.upload("/api/v1/upload/image", "notes.txt", b"hello", "text/plain")
+        if res.status_code != 400:
+            self.fail(f"Expected 400 for a non-image, got {res.status_code}")
+
+    def check_dedup(self):
+        data = os.urandom(20000)
+        first = self.upload("/api/v1/upload/image", "site.jpg", data, "image/jpeg").json()
+        second = self.upload("/api/v1/upload/", "copy-of-site.JPG", data).json()
+        if first["url"] != second["url"]:
+            self.fail("Identical uploads were stored twice")
+        sha = first["sha256"]
+        if not first["url"].endswith(f"{sha[:2]}/{sha[2:4]}/{sha}.jpg"):
+            self.fail(f"Blob is not stored under its sharded hash path: {first['url']}")
+        if not os.path.isfile(self.local_path(first["url"])):
+            self.fail("Blob file missing")
+        self.log("Identical uploads share one sharded blob")
+        return first
+
+    def check_reference_index(self, blob):
+        url = blob["url"]
+        db = TestingSessionLocal()
+        project = Projekt(name="Site", main_image=url, photos=[url, "/assets/uploads/legacy.jpg"])
+        stage = ProjectStage(name="Rohbau", images=[url])
+        db.add_all([project, stage])
+        db.commit()
+        project_id = project.id
+
+        refs = self.client.get(f"/api/v1/upload/blobs/{blob['sha256']}").json()["references"]
+        found = {(r["model"], r["field"]) for r in refs}
+        expected = {("projekt", "main_image"), ("projekt", "photos"), ("projectstage", "images")}
+        if found != expected:
+            self.fail(f"Unexpected references: {found}")
+
+        project = db.get(Projekt, project_id)
+        project.main_image = None
+        db.commit()
+        db.delete(stage)
+        db.commit()
+        refs = self.client.get(f"/api/v1/upload/blobs/{blob['sha256']}").json()["references"]
+        if [(r["model"], r["field"]) for r in refs] != [("projekt", "photos")]:
+            self.fail(f"References not updated on change/delete: {refs}")
+
+        if rebuild_upload_refs(db) != 1:
+            self.fail("Rebuilding the index did not reproduce the live references")
+        db.close()
+        self.log("Reference index follows inserts, updates and deletes")
+
+    def check_garbage_collection(self, referenced):
+        orphan = self.upload("/api/v1/upload/", "old.pdf", os.urandom(4096)).json()
+        young = self.upload("/api/v1/upload/", "new.pdf", os.urandom(1024)).json()
+        logo = self.upload("/api/v1/upload/", "logo.png", os.urandom(2048)).json()
+        day_ago = time.time() - 86400
+        for url in (orphan["url"], referenced["url"], logo["url"]):
+            os.utime(self.local_path(url), (day_ago, day_ago))
+
+        db = TestingSessionLocal()
+        # Homepage images live only inside the SiteContent JSON
+        db.add(SiteContent(key="homepage", content={"logo_url": logo["url"], "hero": [{"image": referenced["url"]}]}))
+        db.commit()
+        refs = self.client.get(f"/api/v1/upload/blobs/{logo['sha256']}").json()["references"]
+        if [(r["model"], r["field"]) for r in refs] != [("sitecontent", "content")]:
+            self.fail(f"SiteContent reference not indexed: {refs}")
+        dry = collect_garbage(db, grace_hours=1, dry_run=True)
+        if dry.removed != [orphan["url"][len(storage.UPLOAD_URL_PREFIX):]]:
+            self.fail(f"GC selected the wrong files: {dry.removed}")
+        report = collect_garbage(db, grace_hours=1)
+        if report.reclaimed_bytes != 4096:
+            self.fail(f"Expected 4096 reclaimed bytes, got {report.reclaimed_bytes}")
+        if os.path.exists(self.local_path(orphan["url"])):
+            self.fail("Orphaned file was not quarantined")
+        if not os.path.exists(self.local_path(referenced["url"])) or not os.path.exists(self.local_path(young["url"])):
+            self.fail("GC removed a referenced or recent file")
+        if not os.path.exists(self.local_path(logo["url"])):
+            self.fail("GC removed an upload referenced only from SiteContent")
+        if db.query(UploadBlob).filter(UploadBlob.sha256 == orphan["sha256"]).first():
+            self.fail("Blob row of the collected file was kept")
+        db.close()
+        self.log(f"GC: {report.summary()}")
+
+    def check_image_derivatives(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", (2000, 1000), (200, 120, 40)).save(buffer, "PNG")
+        body = self.upload("/api/v1/upload/image", "site.png", buffer.getvalue(), "image/png").json()
+        if set(body.get("variants", {})) != {"thumb", "medium", "large"}:
+            self.fail(f"Upload response lacks variant URLs: {body}")
+        # TestClient runs background tasks before returning, so the variants exist now
+        for variant in ("thumb", "medium", "large"):
+            for fmt in ("webp", "jpeg"):
+                if not os.path.isfile(storage.upload_path(derivative_relpath(body["path"], variant, fmt))):
+                    self.fail(f"Derivative {variant}.{fmt} was not generated")
+        res = self.client.get(body["variants"]["thumb"]["jpeg"])
+        if res.status_code != 200 or res.headers["content-type"] != "image/jpeg":
+            self.fail(f"Derivative endpoint failed: {res.status_code}")
+        if Image.open(io.BytesIO(res.content)).size != (320, 160):
+            self.fail("Thumbnail has the wrong size")
+
+        # Legacy uploads get their variants on first request
+        Image.new("RGB", (1200, 1200)).save(os.path.join(storage.UPLOAD_DIR, "legacy.jpg"))
+        res = self.client.get("/api/v1/upload/derivatives/medium/legacy.jpg?format=webp")
+        if res.status_code != 200 or Image.open(io.BytesIO(res.content)).size != (960, 960):
+            self.fail("On-demand derivative was not rendered")
+        if not os.path.isfile(storage.upload_path(derivative_relpath("legacy.jpg", "medium", "webp"))):
+            self.fail("On-demand derivative was not cached on disk")
+        for url in ("/api/v1/upload/derivatives/thumb/%2E%2E/secret.jpg", "/api/v1/upload/derivatives/huge/legacy.jpg"):
+            if self.client.get(url).status_code != 404:
+                self.fail(f"{url} should be rejected")
+        self.log("Image derivatives rendered in the background and on demand")
+
+    def check_resumable_upload(self):
+        data = os.urandom(2 * settings.UPLOAD_CHUNK_SIZE + 777)
+        session = self.client.post(
+            "/api/v1/upload/sessions", json={"filename": "Plan A.pdf", "size": len(data), "content_type": "application/pdf"}
+        ).json()
+        url = f"/api/v1/upload/sessions/{session['id']}"
+        first = settings.UPLOAD_CHUNK_SIZE + 5
+        res = self.client.put(f"{url}?offset=0", content=data[:first])
+        if res.status_code != 200 or res.json()["offset"] != first:
+            self.fail(f"First chunk failed: {res.text}")
+        # A retried chunk at a stale offset is refused with the offset to resume from
+        res = self.client.put(f"{url}?offset=0", content=data[:first])
+        if res.status_code != 409 or res.json()["detail"]["offset"] != first:
+            self.fail(f"Stale offset not rejected: {res.status_code}")
+        if self.client.post(f"{url}/finalize", json={}).status_code != 409:
+            self.fail("Incomplete upload was finalized")
+        if self.client.get(url).json()["offset"] != first:
+            self.fail("Status does not report the received bytes")
+        if self.client.put(f"{url}?offset={first}", content=data[first:] + b"extra").status_code != 413:
+            self.fail("Chunk beyond the declared size was accepted")
+        res = self.client.put(f"{url}?offset={first}", content=data[first:])
+        if not res.json()["complete"]:
+            self.fail("Upload not complete after the last chunk")
+
+        db = TestingSessionLocal()
+        project_id = db.query(Projekt.id).first()[0]
+        db.close()
+        res = self.client.post(f"{url}/finalize", json={"document": {"project_id": project_id, "title": "Plan A", "type": "Plan"}})
+        if res.status_code != 200:
+            self.fail(f"Finalize failed: {res.text}")
+        body = res.json()
+        if body["sha256"] != hashlib.sha256(data).hexdigest() or body["document"]["file_url"] != body["url"]:
+            self.fail("Finalized upload does not match the document or the content")
+        with open(self.local_path(body["url"]), "rb") as f:
+            if f.read() != data:
+                self.fail("Reassembled file differs from the upload")
+        if self.client.get(url).status_code != 404:
+            self.fail("Session still exists after finalize")
+        if self.client.post(f"{url}/finalize", json={}).status_code != 404:
+            self.fail("A retried finalize must not find the session")
+
+        for size in (0, -5):
+            if self.client.post("/api/v1/upload/sessions", json={"filename": "x.pdf", "size": size}).status_code != 422:
+                self.fail(f"Session with size {size} was accepted")
+
+        # A session whose bytes were already handed over is gone, not a server error
+        pending = self.client.post("/api/v1/upload/sessions", json={"filename": "b.pdf", "size": 10}).json()
+        os.remove(os.path.join(upload_sessions.sessions_dir(), pending["id"], "data.part"))
+        pending_url = f"/api/v1/upload/sessions/{pending['id']}"
+        if self.client.get(pending_url).status_code != 404 or self.client.put(f"{pending_url}?offset=0", content=b"x").status_code != 404:
+            self.fail("Session without its data file not reported as missing")
+        self.log("Resumable upload reassembled and attached to a new document")
+
+    def check_http_caching(self):
+        data = os.urandom(10000)
+        body = self.upload("/api/v1/upload/", "video.mp4", data).json()
+        res = self.client.get(body["url"])
+        if res.status_code != 200 or res.content != data:
+            self.fail(f"Serving the upload failed: {res.status_code}")
+        etag = res.headers["etag"]
+        if etag != f'"{body["sha256"]}"' or "immutable" not in res.headers["cache-control"]:
+            self.fail(f"Missing immutable caching headers: {dict(res.headers)}")
+        res = self.client.get(body["url"], headers={"If-None-Match": etag})
+        if res.status_code != 304 or res.content:
+            self.fail("Matching If-None-Match did not return an empty 304")
+
+        res = self.client.get(body["url"], headers={"Range": "bytes=100-199"})
+        if res.status_code != 206 or res.content != data[100:200] or res.headers["content-range"] != "bytes 100-199/10000":
+            self.fail(f"Byte range not served: {res.status_code} {res.headers.get('content-range')}")
+        res = self.client.get(body["url"], headers={"Range": "bytes=-10"})
+        if res.status_code != 206 or res.content != data[-10:]:
+            self.fail("Suffix range not served")
+        if self.client.get(body["url"], headers={"Range": "bytes=20000-"}).status_code != 416:
+            self.fail("Unsatisfiable range not rejected")
+        res = self.client.get(body["url"], headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+        if res.status_code != 200 or res.content != data:
+            self.fail("Stale If-Range should return the whole file")
+
+        # Compressible files keep identity bytes, so a resumed range matches the first response
+        text = b"Aufmass Zeile 1;2;3\n" * 500
+        notes = self.upload("/api/v1/upload/", "notes.txt", text).json()
+        full = self.client.get(notes["url"], headers={"Accept-Encoding": "gzip"})
+        if "content-encoding" in full.headers or full.content != text or full.headers["etag"] != f'"{notes["sha256"]}"':
+            self.fail(f"Upload compressed under its content ETag: {dict(full.headers)}")
+        res = self.client.get(notes["url"], headers={
+            "Accept-Encoding": "gzip", "Range": "bytes=5000-", "If-Range": full.headers["etag"],
+        })
+        if res.status_code != 206 or full.content[:5000] + res.content != text:
+            self.fail("Resumed download does not continue the first response")
+
+        # Legacy names get a hash-based ETag too; hidden directories are never served
+        with open(os.path.join(storage.UPLOAD_DIR, "legacy.pdf"), "wb") as f:
+            f.write(data)
+        if self.client.get("/assets/uploads/legacy.pdf").headers["etag"] != etag:
+            self.fail("Legacy file ETag is not the content hash")
+        if self.client.head(body["url"]).headers["content-length"] != "10000":
+            self.fail("HEAD did not report the length")
+        if self.client.get("/assets/uploads/.sessions/x").status_code != 404:
+            self.fail("Hidden upload directories must not be served")
+        self.log("Uploads served with immutable caching, ETag/304 and byte ranges")
+
+    def run(self):
+        self.setup_user()
+        self.check_streamed_upload()
+        self.check_size_limit()
+        self.check_image_type()
+        blob = self.check_dedup()
+        self.check_reference_index(blob)
+        self.check_garbage_collection(blob)
+        self.check_image_derivatives()
+        self.check_resumable_upload()
+        self.check_http_caching()
+        shutdown_pool()
+        self.log("Upload Test Completed Successfully!")
+
+
+if __name__ == "__main__":
+    tester = UploadTester()
+    tester.run()
@@ -0,0 +1,39 @@
+// Post-build step: write .br and .gz siblings for compressible files in dist/
+// so the backend can serve them without compressing per request.
+import { readdirSync, readFileSync, statSync, writeFileSync } from 'node:fs'
+import { join, extname } from 'node:path'
+import { brotliCompressSync, gzipSync, constants } from 'node:zlib'
+
+const DIST = new URL('../dist/', import.meta.url).pathname
+const EXTENSIONS = new Set(['.html', '.js', '.mjs', '.css', '.svg', '.json', '.txt', '.xml', '.map', '.ico', '.webmanifest'])
+const MIN_SIZE = 1024
+
+function* walk(dir) {
+    for (const name of readdirSync(dir)) {
+        const path = join(dir, name)
+        if (statSync(path).isDirectory()) yield* walk(path)
+        else yield path
+    }
+}
+
+let count = 0
+let before = 0
+let after = 0
+for (const path of walk(DIST)) {
+    if (!EXTENSIONS.has(extname(path)) || statSync(path).size < MIN_SIZE) continue
+    const data = readFileSync(path)
+    const br = brotliCompressSync(data, {
+        params: {
+            [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+            [constants.BROTLI_PARAM_SIZE_HINT]: data.length,
+        },
+    })
+    const gz = gzipSync(data, { level: 9 })
+    // Only keep variants that are actually smaller
+    if (br.length < data.length) writeFileSync(`${path}.br`, br)
+    if (gz.length < data.length) writeFileSync(`${path}.gz`, gz)
+    count += 1
+    before += data.length
+    after += br.length
+}
+console.log(`compress: ${count} files, ${(before / 1024).toFixed(0)} KiB -> ${(after / 1024).toFixed(0)} KiB (brotli)`)
@@ -1,8 +1,10 @@
 import api from './axios';
 
 export const clientApi = {
-    getProjects: async (ownerOnly = false) => {
-        return api.get(`/projects/?owner_only=${ownerOnly}`);
+    // fields=summary|all returns compact rows; pass include (e.g. 'workers') to expand relations
+    getProjects: async (ownerOnly = false, fields = 'all', include = '') => {
+        const includeParam = include ? `&include=${include}` : '';
+        return api.get(`/projects/?owner_only=${ownerOnly}&fields=${fields}${includeParam}`);
     },
 
     getProjectById: async (id) => {
@@ -19,7 +21,7 @@ export const clientApi = {
     },
     getMyProjects: async (ownerOnly = false) => {
         // ownerOnly=true forces backend to return only projects where user is assigned
-        return api.get(`/projects/?owner_only=${ownerOnly}`);
+        return api.get(`/projects/?owner_only=${ownerOnly}&fields=summary`);
     },
     getMyTasks: async () => {
         return api.get('/tasks/');
@@ -53,17 +55,15 @@ export const clientApi = {
         return api.delete(`/users/${id}`);
     },
     getDashboardStats: async () => {
-        const [projectsStats, tasksStats, usersData, projectsList] = await Promise.all([
-            api.get('/projects/stats'),
-            api.get('/tasks/stats'),
-            api.get('/users/'),
-            api.get('/projects/?limit=5')
-        ]);
+        // One request; sections the user's role can't see come back as null
+        const { data } = await api.get('/dashboard/');
         return {
-            projects: projectsStats.data,
-            tasks: tasksStats.data,
-            users: usersData.data.length,
-            recentProjects: projectsList.data
+            projects: data.projects,
+            tasks: data.tasks,
+            users: data.users ? data.users.total : 0,
+            recentProjects: data.recent_projects,
+            openTickets: data.open_tickets,
+            lowStock: data.low_stock
         };
     },
     updateProfile: async (data) => {
@@ -122,8 +122,20 @@ export const clientApi = {
     },
 
     // Time Entries
-    getTimeEntries: async () => {
-        return api.get('/time-entries/');
+    // Filters: user_id, project_id, date_from, date_to, location, open_only, sort, limit, cursor
+    getTimeEntries: async (params = {}) => {
+        return api.get('/time-entries/', { params });
+    },
+    // Follows X-Next-Cursor until every matching entry is loaded (totals, reports)
+    getAllTimeEntries: async (params = {}) => {
+        const data = [];
+        let cursor;
+        do {
+            const res = await api.get('/time-entries/', { params: { limit: 500, ...params, cursor } });
+            data.push(...res.data);
+            cursor = res.headers['x-next-cursor'];
+        } while (cursor);
+        return { data };
     },
     createTimeEntry: async (data) => {
         return api.post('/time-entries/', data);
@@ -223,12 +235,89 @@ export const clientApi = {
     uploadFile: (formData) => api.post('/upload/', formData, {
         headers: { 'Content-Type': 'multipart/form-data' }
     }),
+    // Large files (plans, CAD exports): chunked upload that resumes from the server's offset
+    // after a failed chunk; with `document` the finalize call also creates the document
+    uploadResumable: async (file, document = null, onProgress = null) => {
+        const { data: session } = await api.post('/upload/sessions', {
+            filename: file.name,
+            size: file.size,
+            content_type: file.type || null,
+        });
+        let offset = session.offset;
+        let retries = 0;
+        while (offset < file.size) {
+            try {
+                const { data } = await api.put(
+                    `/upload/sessions/${session.id}?offset=${offset}`,
+                    file.slice(offset, offset + session.chunk_size),
+                    { headers: { 'Content-Type': 'application/octet-stream' } }
+                );
+                offset = data.offset;
+                retries = 0;
+                if (onProgress) onProgress(offset / file.size);
+            } catch (error) {
+                if (++retries > 5) throw error;
+                await new Promise((resolve) => setTimeout(resolve, 1000 * retries));
+                const { data } = await api.get(`/upload/sessions/${session.id}`);
+                offset = data.offset;
+            }
+        }
+        return api.post(`/upload/sessions/${session.id}/finalize`, { document });
+    },
     getMessages: async (projectId) => {
         return api.get(`/messages/?project_id=${projectId}`);
     },
     sendMessage: async (data) => {
         return api.post('/messages/', data);
     },
+    // One row per counterpart and project thread, with last_message and unread_count
+    getInbox: async (params = {}) => {
+        return api.get('/messages/inbox', { params });
+    },
+    // Latest messages, oldest first; pass before_id / after_id / since to page
+    getConversation: async (userId, params = {}) => {
+        return api.get(`/messages/conversation/${userId}`, { params });
+    },
+    markConversationRead: async (userId, projectId = null) => {
+        return api.post(`/messages/conversation/${userId}/read`, null, { params: projectId ? { project_id: projectId } : {} });
+    },
+    // Calls onMessage for every new message pushed by the server; returns an unsubscribe function.
+    // Uses a WebSocket and falls back to Server-Sent Events where WebSockets are unavailable.
+    subscribeMessages: (onMessage, projectId = null) => {
+        const params = new URLSearchParams({ token: localStorage.getItem('token') || '' });
+        if (projectId) params.append('project_id', projectId);
+        const base = new URL(api.defaults.baseURL, window.location.href);
+        const handle = (raw) => {
+            const event = JSON.parse(raw);
+            if (event.type === 'message') onMessage(event.data);
+        };
+
+        if (!('WebSocket' in window)) {
+            const source = new EventSource(`${base.href.replace(/\/$/, '')}/messages/stream?${params}`);
+            source.onmessage = (e) => handle(e.data);
+            return () => source.close();
+        }
+
+        let socket;
+        let closed = false;
+        let retry;
+        const connect = () => {
+            const url = new URL(`${base.pathname.replace(/\/$/, '')}/messages/ws?${params}`, base);
+            url.protocol = url.protocol === 'https:' ? 'wss:' : 'ws:';
+            socket = new WebSocket(url);
+            socket.onmessage = (e) => handle(e.data);
+            socket.onclose = (e) => {
+                // 1008: not authenticated, reconnecting won't help
+                if (!closed && e.code !== 1008) retry = setTimeout(connect, 3000);
+            };
+        };
+        connect();
+        return () => {
+            closed = true;
+            clearTimeout(retry);
+            socket.close();
+        };
+    },
 };
 
 
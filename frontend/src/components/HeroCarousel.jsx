@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { ArrowLeft, ArrowRight } from 'lucide-react';
+import { imageVariant } from '@/lib/utils';
 
 export default function HeroCarousel({ images }) {
     const [currentIndex, setCurrentIndex] = useState(0);
@@ -25,7 +26,7 @@ export default function HeroCarousel({ images }) {
                     className={`absolute inset-0 transition-opacity duration-1000 ease-in-out ${idx === currentIndex ? 'opacity-100' : 'opacity-0'}`}
                 >
                     <img
-                        src={img}
+                        src={imageVariant(img, 'large')}
                         alt={`Hero ${idx + 1}`}
                         className="w-full h-full object-cover"
                     />
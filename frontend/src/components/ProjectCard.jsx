@@ -1,6 +1,7 @@
 import React from 'react';
 import { ArrowRight } from 'lucide-react';
 import { Link } from 'react-router-dom';
+import { imageVariant } from '@/lib/utils';
 
 export default function ProjectCard({ project }) {
     return (
@@ -10,7 +11,8 @@ export default function ProjectCard({ project }) {
                 <div className="project-card__img relative overflow-hidden h-64">
                     {(project.photos && project.photos.length > 0) || project.foto ? (
                         <img
-                            src={(project.photos && project.photos.length > 0) ? project.photos[0] : project.foto}
+                            src={imageVariant((project.photos && project.photos.length > 0) ? project.photos[0] : project.foto, 'medium')}
+                            loading="lazy"
                             alt={project.name}
                             className="w-full h-full object-cover transition-transform duration-500 group-hover:scale-105"
                         />
@@ -25,6 +25,8 @@ export default function ProjectDocuments({ projectId }) {
     const [documents, setDocuments] = useState([]);
     const [loading, setLoading] = useState(true);
     const [dialogOpen, setDialogOpen] = useState(false);
+    const [file, setFile] = useState(null);
+    const [progress, setProgress] = useState(null);
     const [form, setForm] = useState({
         title: "",
         type: "Plan",
@@ -49,15 +51,26 @@ export default function ProjectDocuments({ projectId }) {
     };
 
     const handleSave = async () => {
+        const document = {
+            title: form.title || file?.name,
+            type: form.type,
+            description: form.content || null,
+            project_id: parseInt(projectId)
+        };
         try {
-            await clientApi.createDocument({
-                ...form,
-                project_id: parseInt(projectId)
-            });
+            if (file) {
+                setProgress(0);
+                await clientApi.uploadResumable(file, document, setProgress);
+            } else {
+                await clientApi.createDocument({ ...document, file_url: form.url });
+            }
             setDialogOpen(false);
             loadDocuments();
         } catch (error) {
             console.error("Error saving document:", error);
+            alert("Fehler beim Hochladen des Dokuments");
+        } finally {
+            setProgress(null);
         }
     };
 
@@ -80,6 +93,7 @@ export default function ProjectDocuments({ projectId }) {
             url: "",
             content: ""
         });
+        setFile(null);
         setDialogOpen(true);
     };
 
@@ -117,9 +131,9 @@ export default function ProjectDocuments({ projectId }) {
                                     </div>
                                 </div>
                                 <div className="flex gap-1">
-                                    {doc.url && (
+                                    {doc.file_url && (
                                         <Button variant="ghost" size="icon" asChild>
-                                            <a href={doc.url} target="_blank" rel="noopener noreferrer">
+                                            <a href={doc.file_url} target="_blank" rel="noopener noreferrer">
                                                 <ExternalLink className="w-4 h-4" />
                                             </a>
                                         </Button>
@@ -160,6 +174,13 @@ export default function ProjectDocuments({ projectId }) {
                                 </SelectContent>
                             </Select>
                         </div>
+                        <div className="space-y-2">
+                            <Label>Datei</Label>
+                            <Input type="file" onChange={e => setFile(e.target.files[0] || null)} />
+                            {progress !== null && (
+                                <p className="text-xs text-slate-500">Hochladen... {Math.round(progress * 100)}%</p>
+                            )}
+                        </div>
                         <div className="space-y-2">
                             <Label>URL (Optional)</Label>
                             <Input value={form.url} onChange={e => setForm({ ...form, url: e.target.value })} placeholder="https://..." />
@@ -171,7 +192,7 @@ export default function ProjectDocuments({ projectId }) {
                     </div>
                     <DialogFooter>
                         <Button variant="outline" onClick={() => setDialogOpen(false)}>Abbrechen</Button>
-                        <Button onClick={handleSave}>Speichern</Button>
+                        <Button onClick={handleSave} disabled={progress !== null || (!file && !form.url)}>Speichern</Button>
                     </DialogFooter>
                 </DialogContent>
             </Dialog>
@@ -15,11 +15,11 @@ export default function ProjectReports({ project }) {
             // Fetch additional data needed for report
             const [logsRes, timeRes] = await Promise.all([
                 clientApi.getProductLogs(),
-                clientApi.getTimeEntries()
+                clientApi.getAllTimeEntries({ project_id: project.id, sort: "date" })
             ]);
 
             const projectLogs = logsRes.data.filter(l => l.project_id === project.id);
-            const projectTime = timeRes.data.filter(t => t.project_id === project.id);
+            const projectTime = timeRes.data;
             const totalHours = projectTime.reduce((acc, curr) => acc + (curr.hours || 0), 0);
 
             const doc = new jsPDF();
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from "react";
 import { clientApi } from "@/api/client";
+import { imageVariant } from "@/lib/utils";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
@@ -201,7 +202,7 @@ export default function ProjectStages({ projectId, readOnly = false }) {
                                         <div className="grid grid-cols-2 md:grid-cols-4 lg:grid-cols-6 gap-2">
                                             {stage.images.map((img, idx) => (
                                                 <div key={idx} className="aspect-square rounded-md overflow-hidden border bg-slate-50">
-                                                    <img src={img} alt={`Phase ${idx}`} className="w-full h-full object-cover cursor-pointer hover:scale-105 transition-transform" onClick={() => window.open(img, '_blank')} />
+                                                    <img src={imageVariant(img, 'thumb')} loading="lazy" alt={`Phase ${idx}`} className="w-full h-full object-cover cursor-pointer hover:scale-105 transition-transform" onClick={() => window.open(img, '_blank')} />
                                                 </div>
                                             ))}
                                         </div>
@@ -264,7 +265,7 @@ export default function ProjectStages({ projectId, readOnly = false }) {
                                 <div className="grid grid-cols-3 md:grid-cols-4 gap-4 mb-4">
                                     {form.images.map((img, idx) => (
                                         <div key={idx} className="relative aspect-square rounded-md overflow-hidden bg-white border group">
-                                            <img src={img} alt="" className="w-full h-full object-cover" />
+                                            <img src={imageVariant(img, 'thumb')} alt="" className="w-full h-full object-cover" />
                                             <button
                                                 className="absolute top-1 right-1 bg-red-500 text-white rounded-full p-1 opacity-0 group-hover:opacity-100 transition-opacity"
                                                 onClick={() => removeImage(idx)}
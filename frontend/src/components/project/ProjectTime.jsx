@@ -18,13 +18,10 @@ export default function ProjectTime({ projectId }) {
 
     const loadEntries = async () => {
         try {
-            // Fetch all time entries
-            // Similarly assuming we filter client-side if no direct endpoint
-            // API usually has /time-entries?project_id=... but let's check
-            const res = await clientApi.getTimeEntries();
-            const projectEntries = res.data.filter(e => e.project_id === parseInt(projectId));
+            const res = await clientApi.getAllTimeEntries({ project_id: projectId, sort: "-date" });
+            const projectEntries = res.data;
 
-            setEntries(projectEntries.sort((a, b) => new Date(b.date) - new Date(a.date)));
+            setEntries(projectEntries);
 
             // Calc stats
             const total = projectEntries.reduce((acc, curr) => acc + (curr.hours || 0), 0);
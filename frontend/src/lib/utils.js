@@ -4,3 +4,13 @@ import { twMerge } from "tailwind-merge"
 export function cn(...inputs) {
     return twMerge(clsx(inputs))
 }
+
+const UPLOAD_PREFIX = '/assets/uploads/'
+
+// Resized variant (thumb | medium | large) of an uploaded image; other URLs pass through unchanged
+export function imageVariant(url, variant = 'medium', format = 'webp') {
+    if (typeof url !== 'string' || !url.startsWith(UPLOAD_PREFIX) || url.startsWith(`${UPLOAD_PREFIX}derived/`)) {
+        return url
+    }
+    return `/api/v1/upload/derivatives/${variant}/${url.slice(UPLOAD_PREFIX.length)}?format=${format}`
+}
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import { ArrowLeft, Calendar, MapPin, Tag } from 'lucide-react';
 import { publicApi } from "@/api/public";
+import { imageVariant } from "@/lib/utils";
 import Header from "@/components/Header";
 import Footer from "@/components/Footer";
 
@@ -63,7 +64,7 @@ export default function ProjectDetails() {
                 <div className="relative h-[60vh] bg-slate-900">
                     {project.main_image || (project.photos && project.photos.length > 0) ? (
                         <img
-                            src={project.main_image || project.photos[0]}
+                            src={imageVariant(project.main_image || project.photos[0], 'large')}
                             alt={project.name}
                             className="w-full h-full object-cover opacity-60"
                         />
@@ -109,7 +110,8 @@ export default function ProjectDetails() {
                                             {project.photos.map((photo, index) => (
                                                 <div key={index} className="rounded-xl overflow-hidden h-64 border border-slate-100 shadow-sm">
                                                     <img
-                                                        src={photo}
+                                                        src={imageVariant(photo, 'medium')}
+                                                        loading="lazy"
                                                         alt={`Projektbild ${index + 1}`}
                                                         className="w-full h-full object-cover hover:scale-105 transition-transform duration-500"
                                                     />
@@ -31,10 +31,13 @@ export default function ProjectDetailsUser() {
     }, [id]);
 
     useEffect(() => {
-        if (activeTab === 'chat') {
-            loadMessages();
-        }
-    }, [activeTab]);
+        if (activeTab !== 'chat') return;
+        loadMessages();
+        return clientApi.subscribeMessages((message) => {
+            setMessages(prev => prev.some(m => m.id === message.id) ? prev : [...prev, message]);
+            scrollToBottom();
+        }, id);
+    }, [activeTab, id]);
 
     const loadProject = async () => {
         try {
@@ -72,7 +75,7 @@ export default function ProjectDetailsUser() {
                 content: newMessage
             });
 
-            setMessages(prev => [...prev, res.data]);
+            setMessages(prev => prev.some(m => m.id === res.data.id) ? prev : [...prev, res.data]);
             setNewMessage('');
             scrollToBottom();
         } catch (error) {
@@ -74,7 +74,7 @@ export default function Support() {
                 const response = await clientApi.getTickets();
                 setTickets(response.data);
             } else if (activeTab === 'chat') {
-                const response = await clientApi.getMessages();
+                const response = await clientApi.getInbox();
                 processConversations(response.data);
             }
         } catch (error) {
@@ -84,30 +84,25 @@ export default function Support() {
         }
     };
 
-    const processConversations = (messages) => {
+    const counterpartName = (counterpart, userId) => {
+        const name = [counterpart?.first_name, counterpart?.last_name].filter(Boolean).join(' ');
+        return name || counterpart?.email || `User ${userId}`;
+    };
+
+    const processConversations = (inbox) => {
+        // The inbox has one row per project thread; the chat list shows one entry per user
         const grouped = {};
-        messages.forEach(msg => {
-            // Determine the "other" user ID
-            const otherId = msg.sender_id === user.id ? msg.recipient_id : msg.sender_id;
+        inbox.forEach(conversation => {
+            const otherId = conversation.counterpart_id;
             if (!grouped[otherId]) {
                 grouped[otherId] = {
                     userId: otherId,
-                    messages: [],
-                    lastMessage: null,
-                    // We don't have user details here easily without another fetch or join. 
-                    // For now validation relies on what we have. 
-                    // Ideally backend returns User object with message.
-                    // Assuming we can get name from a separate call or list.
-                    name: `User ${otherId}`
+                    name: counterpartName(conversation.counterpart, otherId),
+                    lastMessage: conversation.last_message,
+                    unreadCount: 0
                 };
             }
-            grouped[otherId].messages.push(msg);
-        });
-
-        // Sort messages in each conversation
-        Object.values(grouped).forEach(group => {
-            group.messages.sort((a, b) => new Date(a.timestamp) - new Date(b.timestamp));
-            group.lastMessage = group.messages[group.messages.length - 1];
+            grouped[otherId].unreadCount += conversation.unread_count;
         });
 
         setConversations(grouped);
@@ -115,11 +110,17 @@ export default function Support() {
 
     const handleSelectConversation = async (userId) => {
         setSelectedUser(userId);
-        // Ensure we have the latest for this user (though we loaded all already)
-        // We could also call getConversation(userId) to be sure
-        const msgs = conversations[userId]?.messages || [];
-        setChatMessages(msgs);
-        setTimeout(scrollToBottom, 100);
+        try {
+            const response = await clientApi.getConversation(userId);
+            setChatMessages(response.data);
+            setTimeout(scrollToBottom, 100);
+            if (conversations[userId]?.unreadCount) {
+                await clientApi.markConversationRead(userId);
+                setConversations(prev => ({ ...prev, [userId]: { ...prev[userId], unreadCount: 0 } }));
+            }
+        } catch (error) {
+            console.error("Failed to load conversation", error);
+        }
     };
 
     const handleSendMessage = async (e) => {
@@ -139,15 +140,16 @@ export default function Support() {
             scrollToBottom();
 
             // Update conversation list as well
-            setConversations(prev => {
-                const updated = { ...prev };
-                if (!updated[selectedUser]) {
-                    updated[selectedUser] = { userId: selectedUser, messages: [], name: `User ${selectedUser}` };
+            setConversations(prev => ({
+                ...prev,
+                [selectedUser]: {
+                    userId: selectedUser,
+                    name: `User ${selectedUser}`,
+                    unreadCount: 0,
+                    ...prev[selectedUser],
+                    lastMessage: newMsg
                 }
-                updated[selectedUser].messages.push(newMsg);
-                updated[selectedUser].lastMessage = newMsg;
-                return updated;
-            });
+            }));
 
         } catch (error) {
             console.error("Failed to send message", error);
@@ -377,11 +379,14 @@ export default function Support() {
                                                 {chat.lastMessage?.content || 'Keine Nachrichten'}
                                             </p>
                                         </div>
-                                        {chat.lastMessage && (
-                                            <span className="text-[10px] text-slate-400">
-                                                {format(new Date(chat.lastMessage.timestamp), 'HH:mm')}
-                                            </span>
-                                        )}
+                                        <div className="flex flex-col items-end gap-1">
+                                            {chat.lastMessage && (
+                                                <span className="text-[10px] text-slate-400">
+                                                    {format(new Date(chat.lastMessage.timestamp), 'HH:mm')}
+                                                </span>
+                                            )}
+                                            {chat.unreadCount > 0 && <Badge>{chat.unreadCount}</Badge>}
+                                        </div>
                                     </div>
                                 </div>
                             ))}
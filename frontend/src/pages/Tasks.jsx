@@ -62,7 +62,7 @@ export default function Tasks() {
         try {
             const [tasksRes, projectsRes, usersRes] = await Promise.all([
                 clientApi.getMyTasks(),
-                clientApi.getProjects(),
+                clientApi.getProjects(false, 'summary'),
                 clientApi.getAllUsers()
             ]);
             setTasks(tasksRes.data);
@@ -53,8 +53,8 @@ export default function TimeTerminal() {
     const checkActiveEntry = async (userId) => {
         // Check if user has an unfinished time entry
         try {
-            const res = await clientApi.getTimeEntries();
-            const userEntries = res.data.filter(e => e.user_id === userId && !e.end_time);
+            const res = await clientApi.getTimeEntries({ user_id: userId, open_only: true });
+            const userEntries = res.data;
             if (userEntries.length > 0) {
                 setActiveEntry(userEntries[0]);
                 setActiveProject(userEntries[0].project_id ? userEntries[0].project_id.toString() : '');
@@ -66,31 +66,26 @@ export default function Zeiterfassung() {
 
     useEffect(() => {
         loadData();
-    }, [filterDate]); // Reload when date changes, or could load all and filter client side? date filter on backend is better.
+    }, [filterDate, filterUser]); // Filters are applied by the API
 
     const loadData = async () => {
         setLoading(true);
         try {
-            // In a real app we would pass filters to the API
-            // const [entriesData, usersData, projectsData] = await Promise.all([
-            //   clientApi.getTimeEntries(filterDate), 
-            //   clientApi.getAllUsers(),
-            //   clientApi.getMyProjects() // or getAllProjects if admin
-            // ]);
-
-            // For now, loading all and filtering locally or assuming existing API returns all
+            const params = { sort: "-date", limit: 500 };
+            if (filterDate) {
+                params.date_from = filterDate;
+                params.date_to = filterDate;
+            }
+            if (filterUser !== "all") {
+                params.user_id = filterUser;
+            }
             const [entriesData, usersData, projectsData] = await Promise.all([
-                clientApi.getTimeEntries(),
+                clientApi.getTimeEntries(params),
                 clientApi.getAllUsers(),
                 clientApi.getMyProjects()
             ]);
 
-            let filtered = entriesData.data;
-            if (filterDate) {
-                filtered = filtered.filter(e => e.date === filterDate);
-            }
-
-            setEntries(filtered);
+            setEntries(entriesData.data);
             setUsers(usersData.data);
             setProjects(projectsData.data);
         } catch (error) {
@@ -182,10 +177,6 @@ export default function Zeiterfassung() {
         return `${hours}h ${mins}m`;
     };
 
-    const filteredEntries = entries.filter(e =>
-        filterUser === "all" || e.user_id.toString() === filterUser
-    );
-
     return (
         <div className="space-y-6 p-6">
             <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-4">
@@ -255,12 +246,12 @@ export default function Zeiterfassung() {
                                 <TableRow>
                                     <TableCell colSpan={7} className="text-center py-8">Laden...</TableCell>
                                 </TableRow>
-                            ) : filteredEntries.length === 0 ? (
+                            ) : entries.length === 0 ? (
                                 <TableRow>
                                     <TableCell colSpan={7} className="text-center py-8 text-slate-400">Keine Einträge für dieses Datum</TableCell>
                                 </TableRow>
                             ) : (
-                                filteredEntries.map((entry) => (
+                                entries.map((entry) => (
                                     <TableRow key={entry.id}>
                                         <TableCell>
                                             <div className="flex items-center gap-2">